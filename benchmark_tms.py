@@ -0,0 +1,492 @@
+#!/usr/bin/python3
+import os
+import argparse
+import logging
+import json
+import hashlib
+import shutil
+import socket
+import random
+import threading
+import time
+import zipfile
+import io
+import platform
+import statistics
+import paramiko
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import urlparse
+from urllib.parse import parse_qs
+from crawler_tms import TmsCrawler
+from crawler_tms import LfsCrawler
+from crawler_tms import MaterialProvider
+from crawler_tms import TmsDirParser
+from crawler_tms import UccLogParser
+from crawler_tms import UccLogResultFiltrator
+from crawler_tms import UccLogTimestampFiltrator
+from crawler_tms import ReportFormatter
+from crawler_tms import PipelineMetrics
+
+class SyntheticMaterial():
+    AP: list = ["Atlas", "Borealis", "Cygnus", "Draco", "Eridanus", "Fornax"]
+    STA: list = ["Lyra", "Mensa", "Norma", "Orion"]
+
+    @staticmethod
+    def getUccLog(**kwargs) -> str:
+        idx: int = kwargs["idx"]
+        lines: int = kwargs["lines"] if "lines" in kwargs else 1000
+        ap: list = kwargs["ap"]
+        sta: list = kwargs["sta"]
+        result: str = kwargs["result"] if "result" in kwargs else "PASS"
+        parallel: bool = kwargs["parallel"] if "parallel" in kwargs else False
+        rng: random.Random = kwargs["rng"]
+        prefix: str = "INFO - parallel-1 " if parallel is True else "INFO - "
+        begin: str = "2023-%02d-%02d %02d:%02d:%02d" % (1 + idx % 12, 1 + idx % 28, idx % 24, idx % 60, (idx * 7) % 60)
+        out: list = list()
+        out.append("%s,000 INFO - WiFiTestSuite Version [9.%d.0]" % (begin, idx % 3))
+        out.append("Test Start Time   : %s" % (begin))
+        out.append("%s,000 %sDUT (192.168.250.1:9000)    <--  status,COMPLETE,vendor,Vendor%d,model,Model%d,version,1.%d" % (begin, prefix, idx % 4, idx % 5, idx % 9))
+        for name in ap:
+            out.append("%s,000 %s%s (192.168.250.2:9000)    --->  ap_set_security,NAME,%s,KEYMGNT,SAE" % (begin, prefix, name, name))
+        for name in sta:
+            out.append("%s,000 %s %s (192.168.250.3:9000)    --->  sta_set_security,interface,wlan0,type,SAE" % (begin, prefix, name))
+        out.append("%s,000 %sDUT (192.168.250.1:9000)    --->  sta_set_security,interface,wlan0,type,SAE" % (begin, prefix))
+        for i in range(lines):
+            out.append("%s,%03d %sDUT (192.168.250.1:9000)    <--  status,COMPLETE,token,%08x" % (begin, i % 1000, prefix, rng.getrandbits(32)))
+        out.append("Execution Time [00:%02d:%02d]" % (idx % 60, (idx * 13) % 60))
+        out.append("FINAL TEST RESULT  --->  %s" % (result))
+        return "\r\n".join(out) + "\r\n"
+
+    @staticmethod
+    def makeZip(**kwargs) -> int:
+        path: str = kwargs["path"]
+        tc: str = kwargs["tc"]
+        os.makedirs(os.path.dirname(path), mode = 0o777, exist_ok = True)
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(tc + "_" + str(kwargs["idx"]) + ".log", SyntheticMaterial.getUccLog(**kwargs))
+            archive.writestr("sniffer-1.2.log", "sniffer\r\n")
+        return os.path.getsize(path)
+
+    @staticmethod
+    def makeNaming(fn: str = ""):
+        with open(fn, "w", encoding = "utf-8") as f:
+            for idx, name in enumerate(SyntheticMaterial.AP):
+                f.write("%d!wfa_control_agent_%s_ap!%s!192.168.250.%d\n" % (idx + 1, name.lower(), name, 10 + idx))
+            for idx, name in enumerate(SyntheticMaterial.STA):
+                f.write("%d!wfa_control_agent_%s_sta!%s!192.168.250.%d\n" % (idx + 1, name.lower(), name, 50 + idx))
+
+    @staticmethod
+    def makePermutation(fn: str = "", tcs: list = None, permutation: dict = None):
+        with open(fn, "w", encoding = "utf-8") as f:
+            f.write("<HE>\n")
+            for tc in tcs:
+                ap: str = ",".join([name.lower() for name in permutation[tc]["ap"]])
+                sta: str = ",".join([name.lower() for name in permutation[tc]["sta"]])
+                f.write("  <%s><AP>%s</AP><STA>%s</STA></%s>\n" % (tc, ap, sta, tc))
+            f.write("</HE>\n")
+
+    @staticmethod
+    def makeEvent(**kwargs) -> dict:
+        root: str = kwargs["root"]
+        event: str = kwargs["event"]
+        qty: int = kwargs["qty"]
+        tc_qty: int = kwargs["tc_qty"]
+        dut_qty: int = kwargs["dut_qty"]
+        tb_qty: int = kwargs["tb_qty"]
+        lines: int = kwargs["lines"]
+        rng: random.Random = random.Random(kwargs["seed"] if "seed" in kwargs else 0)
+        tcs: list = ["HE-4.%d.%d" % (1 + i // 10, i % 10) for i in range(tc_qty)]
+        permutation: dict = dict()
+        for tc in tcs:
+            permutation[tc] = {"ap": rng.sample(SyntheticMaterial.AP, rng.randint(1, 3)), "sta": rng.sample(SyntheticMaterial.STA, rng.randint(0, 2))}
+        results: list = list()
+        size: int = 0
+        for idx in range(qty):
+            tc: str = tcs[idx % tc_qty]
+            result: str = "PASS" if rng.random() < 0.8 else "FAIL"
+            rel: str = "/".join(["Event" + event, "DUT%d" % (idx % dut_qty), "TB%d" % (idx % tb_qty), tc, "log_%d.zip" % (idx)])
+            size += SyntheticMaterial.makeZip(path = root + os.path.sep + rel, tc = tc, idx = idx, lines = lines,
+                ap = permutation[tc]["ap"], sta = permutation[tc]["sta"], result = result, parallel = idx % 5 == 0, rng = rng)
+            results.append({"id": idx,
+                "result": result.capitalize(),
+                "timestamp": str(1672531200000 + idx * 60000),
+                "logFileName": "ftp://127.0.0.1/" + rel,
+                "testCaseIdName": tc,
+                "dUTDevice": {"vendorDeviceId": "DUT%d" % (idx % dut_qty)}})
+        return {"tcs": tcs, "permutation": permutation, "results": results, "size": size}
+
+class TmsStandIn(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        logging.debug("stand-in: " + format % args)
+
+    def reply(self, code: int = 200, body: bytes = b"", headers: dict = None):
+        self.send_response(code)
+        for k, v in (headers if headers is not None else dict()).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def replyValidated(self, body: bytes = b""):
+        #process; the conditional request (i.e. If-None-Match) of an unchanged body is answered without the body
+        state: dict = self.server.state
+        etag: str = "\"%s\"" % (hashlib.sha1(body).hexdigest())
+        with state["lock"]:
+            state["requested"] += 1
+            if self.headers.get("If-None-Match") == etag:
+                state["not_modified"] += 1
+        if self.headers.get("If-None-Match") == etag:
+            self.reply(code = 304, headers = {"ETag": etag})
+        else:
+            self.reply(body = body, headers = {"ETag": etag})
+
+    def getResults(self) -> bytes:
+        #process; a growing event (i.e. the growth per request) appends the results between requests, as a running event does
+        state: dict = self.server.state
+        with state["lock"]:
+            visible: int = len(state["results"]) if state["growth"] <= 0 else min(len(state["results"]), state["visible"] + state["growth"])
+            state["visible"] = visible
+        return json.dumps(state["results"][:visible]).encode()
+
+    def do_GET(self):
+        state: dict = self.server.state
+        parsed = urlparse(self.path)
+        if parsed.path == "/":
+            self.reply(headers = {"Set-Cookie": "CSRF-TOKEN=benchmark; Path=/"})
+        elif parsed.path.startswith("/api/events/"):
+            self.replyValidated(body = json.dumps({"id": state["event"], "name": "Event" + state["event"], "password": "benchmark", "ftpUserName": "/home/benchmark"}).encode())
+        elif parsed.path.startswith("/api/testResults/event/"):
+            self.replyValidated(body = self.getResults())
+        elif parsed.path.startswith("/wifitmsftp/api/ftp-file"):
+            uri: str = parse_qs(parsed.query)["uri"][0]
+            fn: str = state["root"] + os.path.sep + uri[len("ftp://"):].split("/", 1)[1]
+            if os.path.exists(fn) is False:
+                self.reply(code = 404)
+                return
+            with open(fn, "rb") as f:
+                body: bytes = f.read()
+            requested: str = self.headers.get("Range")
+            if requested is not None:
+                offset: int = int(requested.split("=")[1].split("-")[0])
+                self.reply(code = 206, body = body[offset:], headers = {"Content-Range": "bytes %d-%d/%d" % (offset, len(body) - 1, len(body))})
+            else:
+                self.reply(body = body)
+        else:
+            self.reply(code = 404)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.reply(headers = {"Set-Cookie": "JSESSIONID=benchmark; Path=/"})
+
+    @staticmethod
+    def serve(event: str = "", root: str = "", results: list = None, growth: int = 0) -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), TmsStandIn)
+        server.state = {"event": event, "root": root, "results": results, "growth": growth, "visible": 0,
+            "lock": threading.Lock(), "requested": 0, "not_modified": 0}
+        threading.Thread(target = server.serve_forever, daemon = True).start()
+        return server
+
+class SftpStandIn(paramiko.ServerInterface):
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+    @staticmethod
+    def getInterface(root: str = "", faults: dict = None):
+        class SftpFolder(paramiko.SFTPServerInterface):
+            def locate(self, path):
+                return root + os.path.sep + path.lstrip("/")
+
+            def canonicalize(self, path):
+                return "/" + path.lstrip("./")
+
+            def stat(self, path):
+                if os.path.exists(self.locate(path)) is False:
+                    return paramiko.SFTP_NO_SUCH_FILE
+                return paramiko.SFTPAttributes.from_stat(os.stat(self.locate(path)))
+
+            def lstat(self, path):
+                return self.stat(path)
+
+            def open(self, path, flags, attr):
+                if os.path.exists(self.locate(path)) is False:
+                    return paramiko.SFTP_NO_SUCH_FILE
+                with faults["lock"]:
+                    #process; the burst refuses the first transfers at once (i.e. the host is down for a while), then the rate applies
+                    injected: bool = faults["injected"] < faults.get("burst", 0) or faults["rng"].random() < faults["rate"]
+                    faults["injected"] += 1 if injected is True else 0
+                if injected is True:
+                    #process; inject a fault (i.e. the server refuses the transfer)
+                    return paramiko.SFTP_FAILURE
+                handle = paramiko.SFTPHandle(flags)
+                handle.readfile = open(self.locate(path), "rb")
+                handle.filename = self.locate(path)
+                return handle
+
+            def list_folder(self, path):
+                return [paramiko.SFTPAttributes.from_stat(os.stat(self.locate(path) + os.path.sep + fn), fn) for fn in os.listdir(self.locate(path))]
+        return SftpFolder
+
+    @staticmethod
+    def serve(root: str = "", faults: dict = None) -> int:
+        key = paramiko.RSAKey.generate(2048)
+        sock = socket.socket()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(64)
+        faults = faults if faults is not None else {"rate": 0.0, "burst": 0, "max_sessions": 0}
+        faults.update({"rng": random.Random(0), "lock": threading.Lock(), "injected": 0, "rejected": 0})
+        interface = SftpStandIn.getInterface(root, faults)
+        transports: list = list()
+        def accept():
+            while True:
+                conn, _ = sock.accept()
+                transports[:] = [t for t in transports if t.is_active() is True]
+                if faults["max_sessions"] > 0 and len(transports) >= faults["max_sessions"]:
+                    #process; throttle; the connection beyond the quantity of sessions is dropped
+                    faults["rejected"] += 1
+                    conn.close()
+                    continue
+                transport = paramiko.Transport(conn)
+                transports.append(transport)
+                transport.add_server_key(key)
+                transport.set_subsystem_handler("sftp", paramiko.SFTPServer, interface)
+                transport.start_server(server = SftpStandIn())
+        threading.Thread(target = accept, daemon = True).start()
+        return sock.getsockname()[1]
+
+def summarize(runs: list = None) -> dict:
+    #process; the best run of each stage; the runs are summarized by PipelineMetrics, i.e. the same numbers as --metrics of crawler_tms.py
+    summary: dict = dict()
+    for name in runs[0]["stages"]:
+        measured: list = [run["stages"][name] for run in runs if name in run["stages"]]
+        best: float = min([stage["seconds"] for stage in measured])
+        candidates: int = measured[0]["candidates"]
+        size: int = measured[0]["bytes"] if "bytes" in measured[0] else 0
+        summary[name] = {"seconds": best,
+            "seconds_mean": statistics.mean([stage["seconds"] for stage in measured]),
+            "candidates": candidates,
+            "candidates_per_second": candidates / best if best > 0 else None,
+            "bytes": size,
+            "mb_per_second": size / 1048576 / best if best > 0 and size > 0 else None}
+    return summary
+
+def getSize(material: dict = None) -> int:
+    return sum([os.path.getsize(candidate["path"]) for tc in material for candidate in material[tc]])
+
+if __name__ == "__main__":
+    my_parser = argparse.ArgumentParser(description="Benchmark of Crawler6 with synthetic UCC logs and local TMS/SFTP stand-ins")
+    my_parser.add_argument("-v",
+        "--verbose",
+        action="store_true",
+        help="verbosity")
+    my_parser.add_argument("-q",
+        "--qty",
+        metavar="qty",
+        default=200,
+        type=int,
+        help="quantity of test results (i.e. zipfiles)")
+    my_parser.add_argument(
+        "--lines",
+        metavar="lines",
+        default=2000,
+        type=int,
+        help="quantity of filler lines per UCC log")
+    my_parser.add_argument(
+        "--tc-qty",
+        metavar="tc_qty",
+        default=20,
+        type=int,
+        help="quantity of test cases")
+    my_parser.add_argument(
+        "--dut-qty",
+        metavar="dut_qty",
+        default=2,
+        type=int,
+        help="quantity of DUTs")
+    my_parser.add_argument(
+        "--tb-qty",
+        metavar="tb_qty",
+        default=3,
+        type=int,
+        help="quantity of primary testbeds")
+    my_parser.add_argument(
+        "--seed",
+        metavar="seed",
+        default=0,
+        type=int,
+        help="seed of the synthetic material")
+    my_parser.add_argument(
+        "--repeat",
+        metavar="repeat",
+        default=3,
+        type=int,
+        help="quantity of runs; the best run of each stage is reported")
+    my_parser.add_argument("-d",
+        "--directory",
+        metavar="directory",
+        default="benchmark",
+        type=str,
+        help="working directory of the benchmark; removed before generating")
+    my_parser.add_argument("-o",
+        "--offline",
+        action="store_true",
+        help="benchmark the offline provider (local file system) instead of TMS")
+    my_parser.add_argument(
+        "--output",
+        metavar="output",
+        default=None,
+        type=str,
+        help="path of the JSON output; standard output if not specified")
+    my_parser.add_argument(
+        "--jobs",
+        metavar="jobs",
+        default=1,
+        type=int,
+        help="quantity of concurrent downloads")
+    my_parser.add_argument(
+        "--http-fetching",
+        action="store_true",
+        help="fetch log from web site instead of SFTP")
+    my_parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="extract UCC log next to the zipfile before parsing")
+    my_parser.add_argument(
+        "--parse-jobs",
+        metavar="parse_jobs",
+        default=1,
+        type=int,
+        help="quantity of worker processes for parsing UCC log")
+    my_parser.add_argument(
+        "--scan-mode",
+        metavar="scan_mode",
+        default="line",
+        choices=["line", "mmap"],
+        type=str,
+        help="scanning mode of UCC log")
+    my_parser.add_argument(
+        "--fault-rate",
+        metavar="fault_rate",
+        default=0.0,
+        type=float,
+        help="probability that the SFTP stand-in refuses a transfer")
+    my_parser.add_argument(
+        "--fault-burst",
+        metavar="fault_burst",
+        default=0,
+        type=int,
+        help="quantity of the first transfers that the SFTP stand-in refuses in a row")
+    my_parser.add_argument(
+        "--max-sessions",
+        metavar="max_sessions",
+        default=0,
+        type=int,
+        help="quantity of concurrent sessions that the SFTP stand-in accepts (the others are dropped); 0 for unlimited")
+    my_parser.add_argument(
+        "--backoff",
+        metavar="backoff",
+        default=1.0,
+        type=float,
+        help="base delay (in seconds) of the backoff between retries")
+    my_parser.add_argument(
+        "--retry",
+        metavar="retry",
+        default=3,
+        type=int,
+        help="quantity of retries per download")
+    my_parser.add_argument(
+        "--circuit-cooldown",
+        metavar="circuit_cooldown",
+        default=30.0,
+        type=float,
+        help="seconds that the circuit of a failing host stays open before a probe")
+
+    args = my_parser.parse_args()
+    if args.verbose == True :
+        logging.basicConfig(level=logging.INFO)
+    else:
+        logging.basicConfig(level=logging.ERROR)
+    #preparation; the stand-in transports complain whenever the crawler closes a connection
+    logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+
+    #preparation; generate the synthetic material
+    event: str = "1"
+    rmt_directory: str = args.directory + os.path.sep + "remote"
+    lcl_directory: str = args.directory + os.path.sep + "local"
+    shutil.rmtree(args.directory, ignore_errors = True)
+    os.makedirs(args.directory, mode = 0o777, exist_ok = True)
+    time_begin: float = time.perf_counter()
+    synthetic: dict = SyntheticMaterial.makeEvent(root = rmt_directory, event = event, qty = args.qty, tc_qty = args.tc_qty,
+        dut_qty = args.dut_qty, tb_qty = args.tb_qty, lines = args.lines, seed = args.seed)
+    SyntheticMaterial.makeNaming(args.directory + os.path.sep + "DisplayNames.txt")
+    SyntheticMaterial.makePermutation(args.directory + os.path.sep + "MasterTestInfo.xml", synthetic["tcs"], synthetic["permutation"])
+    logging.info("synthetic material (%d bytes) is generated within %.3f seconds" % (synthetic["size"], time.perf_counter() - time_begin))
+    naming: dict = MaterialProvider.getNaming(args.directory + os.path.sep + "DisplayNames.txt")
+    permutation: dict = MaterialProvider.getPermutation(args.directory + os.path.sep + "MasterTestInfo.xml")
+
+    #preparation; serve the stand-ins
+    provider: MaterialProvider = LfsCrawler
+    provided: dict = dict(directory = rmt_directory, prefix = "", permutation = permutation)
+    faults: dict = {"rate": args.fault_rate, "burst": args.fault_burst, "max_sessions": args.max_sessions}
+    if args.offline is False:
+        server = TmsStandIn.serve(event, rmt_directory, synthetic["results"])
+        provider = TmsCrawler
+        provided = dict(event = event, directory = lcl_directory, rst_expected = "Pass", account = "benchmark", password = "benchmark",
+            sftp_usr = None, sftp_pwd = None, sftp_interm_dir = None, since = "", prefix = "", latest = False, permutation = permutation, dut = None,
+            jobs = args.jobs, ftp_fetching = not args.http_fetching,
+            portal = "http://127.0.0.1:%d/" % (server.server_address[1]),
+            sftp_port = SftpStandIn.serve(rmt_directory, faults) if args.http_fetching is False else 22,
+            retry = args.retry,
+            backoff = args.backoff,
+            circuit_cooldown = args.circuit_cooldown)
+
+    #process; run every stage as the batch path of crawler_tms.py does (i.e. measured by PipelineMetrics)
+    runs: list = list()
+    for run in range(args.repeat):
+        shutil.rmtree(lcl_directory, ignore_errors = True)
+        for fn in [os.path.join(root, name) for root, dirs, files in os.walk(rmt_directory) for name in files if name.endswith(".zip") is False]:
+            os.remove(fn)
+        metrics: PipelineMetrics = PipelineMetrics()
+        if args.offline is False:
+            provided["metrics"] = metrics
+        material: dict = metrics.measure("getMaterial", provider.getMaterial, **provided)
+        size: int = getSize(material)
+        material = metrics.measure("TmsDirParser", TmsDirParser.decorate, material = material)
+        material = metrics.measure("UccLogParser", UccLogParser.decorate, material = material,
+            use_timestamp_from_log = args.offline, extract = args.extract, parse_jobs = args.parse_jobs, scan_mode = args.scan_mode, verdict_cache = None, metrics = metrics)
+        if args.offline is True:
+            material = metrics.measure("UccLogResultFiltrator", UccLogResultFiltrator.decorate, material = material, rst_expected = "Pass")
+        material = metrics.measure("UccLogTimestampFiltrator", UccLogTimestampFiltrator.decorate, material = material,
+            use_timestamp_from_log = args.offline, category = "last")
+        metrics.measure("ReportFormatter", ReportFormatter.write, material = material, output = io.StringIO(), output_format = "text",
+            naming = naming, permutation = permutation, show_device_from_log = False, rst_expected = "Pass", delimiter = os.linesep)
+        summary: dict = metrics.summarize()
+        summary["stages"]["getMaterial"]["bytes"] = size if args.offline is False else 0
+        summary["stages"]["UccLogParser"]["bytes"] = size
+        for name, stage in summary["stages"].items():
+            logging.info("stage %s takes %.3f seconds for %d candidates" % (name, stage["seconds"], stage["candidates"]))
+        runs.append(summary)
+
+    #finalize; output the machine-readable report
+    report: dict = {"python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": vars(args),
+        "synthetic_bytes": synthetic["size"],
+        "stages": summarize(runs),
+        "faults": {"injected": faults.get("injected", 0), "rejected": faults.get("rejected", 0)},
+        "downloads": {k: sum([run["counters"][k] for run in runs if k in run["counters"]]) for k in ("downloaded", "store_linked", "omitted", "download_retried", "download_failed", "circuit_opened")},
+        "runs": runs}
+    if args.output is None:
+        print(json.dumps(report, indent = 2))
+    else:
+        with open(args.output, "w", encoding = "utf-8") as f:
+            json.dump(report, f, indent = 2)
+
+#Crawler6 - by Leo Liu
@@ -8,53 +8,887 @@ import requests
 import json
 import warnings
 import pysftp
+import paramiko
 import zipfile
 import re
 import codecs
-import xmltodict
+from xml.etree import ElementTree
 import time
+import threading
+import itertools
+import mmap
+import heapq
+import bisect
+import cProfile
+import csv
+import contextlib
+import hashlib
+import shutil
+import sqlite3
+import random
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from datetime import timedelta
 from collections import OrderedDict
+from collections import deque
+from urllib.parse import urlparse
+
+class PipelineMetrics():
+    BUCKETS: tuple = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+    def __init__(self, slowest: int = 10):
+        self.slowest: int = slowest
+        self.lock = threading.Lock()
+        self.time_begin: float = time.perf_counter()
+        self.inner: float = 0.0
+        self.stages: dict = dict()
+        self.counters: dict = dict()
+        self.latencies: dict = dict()
+        self.heaps: dict = dict()
+
+    def add(self, name: str = "", value: int = 1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str = "", seconds: float = 0.0, path: str = None):
+        with self.lock:
+            if name not in self.latencies:
+                self.latencies[name] = list()
+                self.heaps[name] = list()
+            self.latencies[name].append(seconds)
+            if path is not None:
+                #process; keep the slowest N paths only
+                (heapq.heappush if len(self.heaps[name]) < self.slowest else heapq.heappushpop)(self.heaps[name], (seconds, path))
+
+    def record(self, name: str = "", seconds: float = 0.0, candidates: int = 0):
+        with self.lock:
+            if name not in self.stages:
+                self.stages[name] = {"seconds": 0.0, "candidates": 0}
+            self.stages[name]["seconds"] += seconds
+            self.stages[name]["candidates"] += candidates
+
+    def measure(self, name: str = "", func = None, **kwargs):
+        #process; the wall time of the nested stages (i.e. the iterated ones) is excluded
+        outer: float = self.inner
+        self.inner = 0.0
+        time_begin: float = time.perf_counter()
+        ret = func(**kwargs)
+        time_diff: float = time.perf_counter() - time_begin
+        candidates: int = 0
+        if isinstance(ret, dict) is True:
+            candidates = sum([len(v) for v in ret.values()])
+        elif isinstance(ret, int) is True:
+            candidates = ret
+        self.record(name, time_diff - self.inner, candidates)
+        self.inner = outer + time_diff
+        return ret
+
+    def iterate(self, name: str = "", items = None):
+        iterator = iter(items)
+        while True:
+            outer: float = self.inner
+            self.inner = 0.0
+            time_begin: float = time.perf_counter()
+            item = next(iterator, None)
+            time_diff: float = time.perf_counter() - time_begin
+            self.record(name, time_diff - self.inner, 1 if item is not None and item[-1] is not None else 0)
+            self.inner = outer + time_diff
+            if item is None:
+                return
+            yield item
+
+    @staticmethod
+    def getHistogram(latencies: list = None) -> dict:
+        ordered: list = sorted(latencies)
+        histogram: dict = {"count": len(ordered), "sum": sum(ordered), "min": ordered[0], "max": ordered[-1], "mean": sum(ordered) / len(ordered)}
+        for p in (50, 90, 99):
+            histogram["p%d" % (p)] = ordered[min(len(ordered) - 1, len(ordered) * p // 100)]
+        buckets: dict = OrderedDict()
+        for bound in PipelineMetrics.BUCKETS:
+            buckets["<=%g" % (bound)] = bisect.bisect_right(ordered, bound)
+        buckets["+Inf"] = len(ordered)
+        histogram["buckets"] = buckets
+        return histogram
+
+    def summarize(self) -> dict:
+        with self.lock:
+            summary: dict = {"wall": time.perf_counter() - self.time_begin, "stages": dict(), "counters": dict(self.counters), "histograms": dict(), "slowest": dict()}
+            for name, stage in self.stages.items():
+                summary["stages"][name] = dict(stage)
+                summary["stages"][name]["candidates_per_second"] = stage["candidates"] / stage["seconds"] if stage["seconds"] > 0 else None
+            for name, latencies in self.latencies.items():
+                summary["histograms"][name] = PipelineMetrics.getHistogram(latencies)
+                if len(self.heaps[name]) > 0:
+                    summary["slowest"][name] = [{"path": path, "seconds": seconds} for seconds, path in sorted(self.heaps[name], reverse = True)]
+            return summary
+
+    def save(self, fn: str = ""):
+        with open(fn, "w", encoding = "utf-8") as f:
+            json.dump(self.summarize(), f, indent = 2)
+        logging.info("the metrics are saved as %s" % (fn))
+
+class SftpConnectionPool():
+    def __init__(self, port: int = 22, metrics: PipelineMetrics = None):
+        self.port: int = port
+        self.metrics: PipelineMetrics = metrics
+        self.connections: dict = dict()
+        self.cnt_handshake: int = 0
+        self.cnt_reused: int = 0
+        self.cnt_reconnected: int = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def isAlive(conn: pysftp.Connection = None) -> bool:
+        try:
+            transport = conn.sftp_client.get_channel().get_transport()
+            return transport is not None and transport.is_active()
+        except Exception:
+            return False
+
+    def acquire(self, host: str = "", username: str = "", password: str = "") -> pysftp.Connection:
+        key: tuple = (host, username)
+        conn: pysftp.Connection = self.connections.get(key)
+        if conn is not None:
+            if SftpConnectionPool.isAlive(conn) is True:
+                self.cnt_reused += 1
+                return conn
+            logging.info("the session to %s@%s is dropped; reconnecting" % (username, host))
+            self.discard(host = host, username = username)
+            self.cnt_reconnected += 1
+        warnings.filterwarnings("ignore")
+        cnopts = pysftp.CnOpts()
+        cnopts.hostkeys = None
+        time_begin: float = time.perf_counter()
+        conn = pysftp.Connection(host=host, port=self.port, username=username, password=password, cnopts=cnopts)
+        if self.metrics is not None:
+            self.metrics.observe("sftp_connect", time.perf_counter() - time_begin)
+        self.cnt_handshake += 1
+        logging.debug("connection established successfully")
+        logging.debug("current working directory is: %s" % (conn.pwd))
+        self.connections[key] = conn
+        return conn
+
+    def discard(self, host: str = "", username: str = ""):
+        conn: pysftp.Connection = self.connections.pop((host, username), None)
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def close(self):
+        for host, username in list(self.connections):
+            self.discard(host = host, username = username)
+        logging.info("the SFTP handshake count is %d" % (self.cnt_handshake))
+        logging.info("the SFTP reused count is %d (handshakes saved)" % (self.cnt_reused))
+        logging.info("the SFTP reconnected count is %d" % (self.cnt_reconnected))
+        if self.metrics is not None:
+            for k, v in self.stats().items():
+                self.metrics.add("sftp_" + k, v)
+
+    def stats(self) -> dict:
+        return {"handshake": self.cnt_handshake, "reused": self.cnt_reused, "reconnected": self.cnt_reconnected}
+
+class LogStore():
+    VERSION: int = 1
+    CHUNK_SIZE: int = 1048576
+
+    def __init__(self, root: str = "", rebuild: bool = False):
+        self.root: str = root
+        self.rebuild: bool = rebuild
+        self.fn: str = root + os.path.sep + "index.json"
+        self.lock = threading.Lock()
+        self.index: dict = {"version": LogStore.VERSION, "remote": dict(), "verdicts": dict()}
+        self.inodes: dict = dict()
+        self.cnt_linked: int = 0
+        self.cnt_ingested: int = 0
+        self.cnt_deduplicated: int = 0
+        self.bytes_saved: int = 0
+        os.makedirs(root + os.path.sep + "blobs", mode = 0o777, exist_ok = True)
+        loaded: dict = LogStore.loadIndex(self.fn)
+        self.index["remote"] = loaded["remote"]
+        if rebuild is False:
+            self.index["verdicts"] = loaded["verdicts"]
+        #process; a local path is resolved to its content key by the inode it shares with the blob
+        for digest in set(self.index["remote"].values()):
+            self.remember(self.getBlob(digest), digest)
+
+    @staticmethod
+    def loadIndex(fn: str = "") -> dict:
+        index: dict = {"remote": dict(), "verdicts": dict()}
+        if os.path.exists(fn) is True:
+            try:
+                with open(fn, "r", encoding = "utf-8") as f:
+                    loaded: dict = json.load(f)
+                if loaded.get("version") == LogStore.VERSION:
+                    index["remote"] = loaded["remote"]
+                    index["verdicts"] = loaded["verdicts"]
+            except (OSError, ValueError, KeyError) as e:
+                logging.warning("the index of log store %s is unable to be loaded (%s)" % (fn, repr(e)))
+        return index
+
+    @staticmethod
+    def getKey(uri: str = "", size: int = 0) -> str:
+        return "%s#%d" % (uri, size)
+
+    @staticmethod
+    def getDigest(path: str = "") -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(LogStore.CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def getBlob(self, digest: str = "") -> str:
+        return self.root + os.path.sep + "blobs" + os.path.sep + digest[:2] + os.path.sep + digest
+
+    def remember(self, path: str = "", digest: str = ""):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        self.inodes[(st.st_dev, st.st_ino)] = digest
+
+    def resolve(self, path: str = "") -> str:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return self.inodes.get((st.st_dev, st.st_ino))
+
+    def link(self, blob: str = "", lcl_path: str = ""):
+        #process; hardlink the blob to the local path atomically; copy it if the filesystem refuses to link
+        tmp_path: str = lcl_path + ".link"
+        if os.path.exists(tmp_path) is True:
+            os.remove(tmp_path)
+        try:
+            os.link(blob, tmp_path)
+        except OSError as e:
+            logging.info("the blob %s is unable to be linked (%s); it is copied" % (blob, repr(e)))
+            shutil.copyfile(blob, tmp_path)
+        os.replace(tmp_path, lcl_path)
+
+    def place(self, uri: str = "", size: int = 0, lcl_path: str = "") -> bool:
+        with self.lock:
+            digest: str = self.index["remote"].get(LogStore.getKey(uri, size))
+        if digest is None or os.path.exists(self.getBlob(digest)) is False:
+            return False
+        self.link(self.getBlob(digest), lcl_path)
+        with self.lock:
+            self.remember(lcl_path, digest)
+            self.cnt_linked += 1
+            self.bytes_saved += size
+        logging.info("lcl_path \"%s\" is linked from the log store (%s)" % (lcl_path, digest))
+        return True
+
+    def ingest(self, uri: str = "", lcl_path: str = "") -> str:
+        size: int = os.path.getsize(lcl_path)
+        digest: str = LogStore.getDigest(lcl_path)
+        blob: str = self.getBlob(digest)
+        with self.lock:
+            if os.path.exists(blob) is True:
+                #process; the same content is stored already (e.g. by another event or directory); keep one copy only
+                self.link(blob, lcl_path)
+                self.cnt_deduplicated += 1
+                self.bytes_saved += size
+            else:
+                os.makedirs(os.path.dirname(blob), mode = 0o777, exist_ok = True)
+                self.link(lcl_path, blob)
+                self.cnt_ingested += 1
+            self.remember(lcl_path, digest)
+            self.index["remote"][LogStore.getKey(uri, size)] = digest
+        return digest
+
+    def lookup(self, path: str = "") -> tuple:
+        digest: str = self.resolve(path)
+        entry: dict = self.index["verdicts"].get(digest) if digest is not None else None
+        if entry is not None and entry["version"] == UccLogParser.VERSION:
+            return (True, entry["verdict"])
+        return (False, None)
+
+    def store(self, path: str = "", verdict: dict = None):
+        digest: str = self.resolve(path)
+        if digest is not None:
+            self.index["verdicts"][digest] = {"version": UccLogParser.VERSION, "verdict": verdict}
+
+    def save(self):
+        #process; merge with the index saved by the other runs sharing the store
+        with self.lock:
+            loaded: dict = LogStore.loadIndex(self.fn)
+            loaded["remote"].update(self.index["remote"])
+            loaded["verdicts"].update(self.index["verdicts"])
+            self.index["remote"] = loaded["remote"]
+            if self.rebuild is False:
+                self.index["verdicts"] = loaded["verdicts"]
+            self.rebuild = False
+            tmp_fn: str = self.fn + ".%d.tmp" % (os.getpid())
+            with open(tmp_fn, "w", encoding = "utf-8") as f:
+                json.dump(self.index, f, separators = (",", ":"))
+            os.replace(tmp_fn, self.fn)
+        logging.info("the log store linked count is %d" % (self.cnt_linked))
+        logging.info("the log store ingested count is %d" % (self.cnt_ingested))
+        logging.info("the log store deduplicated count is %d" % (self.cnt_deduplicated))
+        logging.info("the log store saved bytes is %d" % (self.bytes_saved))
+
+class HostScheduler():
+    THRESHOLD: int = 3
+    LATENCY_FACTOR: float = 3.0
+    LATENCY_FLOOR: float = 0.5
+    ALPHA: float = 0.2
+    MAX_COOLDOWN: float = 600.0
+
+    def __init__(self, max_limit: int = 1, retry: int = 3, backoff: float = 1.0, max_backoff: float = 30.0, cooldown: float = 30.0, metrics: PipelineMetrics = None):
+        self.max_limit: int = max_limit if max_limit > 1 else 1
+        self.retry: int = retry
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.cooldown: float = cooldown
+        self.metrics: PipelineMetrics = metrics
+        self.hosts: dict = dict()
+        self.lock = threading.Lock()
+        #process; the workers are shared by the hosts; a job is queued per host, and handed to a worker only once its host is able to take it
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers = self.max_limit)
+        self.timer: threading.Timer = None
+        self.wakeup: float = None
+        self.closed: bool = False
+        self.cnt_retried: int = 0
+        self.cnt_failed: int = 0
+        self.cnt_opened: int = 0
+
+    def getHost(self, host: str = "") -> dict:
+        if host not in self.hosts:
+            self.hosts[host] = {"limit": 1.0, "threshold": float(self.max_limit), "in_flight": 0, "latency": None, "queue": deque(),
+                "failures": 0, "trips": 0, "opened": 0.0, "decreased": 0.0, "cnt_ok": 0, "cnt_error": 0}
+        return self.hosts[host]
+
+    def getLimit(self, host: str = "") -> int:
+        with self.lock:
+            return int(self.getHost(host)["limit"])
+
+    def isDown(self, host: str = "") -> bool:
+        with self.lock:
+            state: dict = self.getHost(host)
+            return state["trips"] > self.retry and state["opened"] > time.monotonic()
+
+    def submit(self, host: str = "", lcl_path: str = "", func = None, **kwargs) -> Future:
+        task: dict = {"future": Future(), "lcl_path": lcl_path, "func": func, "kwargs": kwargs, "attempt": 0, "not_before": 0.0}
+        with self.lock:
+            self.getHost(host)["queue"].append(task)
+        self.dispatch()
+        return task["future"]
+
+    def dispatch(self):
+        #process; hand the queued jobs to the workers within the concurrency limit per host; the jobs of a host with an open circuit (or in backoff) stay queued, so the other hosts continue
+        failed: list = list()
+        with self.lock:
+            if self.closed is True:
+                return
+            now: float = time.monotonic()
+            wakeup: float = None
+            for host, state in self.hosts.items():
+                if state["opened"] > now and state["trips"] > self.retry:
+                    #process; the probes failed more times in a row than the retry budget, so the host is down until the cooldown elapses (i.e. its jobs fail at once)
+                    while len(state["queue"]) > 0:
+                        failed.append((host, state["queue"].popleft()))
+                    continue
+                if state["opened"] > now:
+                    wakeup = state["opened"] if wakeup is None else min(wakeup, state["opened"])
+                    continue
+                deferred: list = list()
+                while len(state["queue"]) > 0 and state["in_flight"] < int(state["limit"]):
+                    task: dict = state["queue"].popleft()
+                    if task["not_before"] > now:
+                        deferred.append(task)
+                        wakeup = task["not_before"] if wakeup is None else min(wakeup, task["not_before"])
+                        continue
+                    state["in_flight"] += 1
+                    self.executor.submit(self.attempt, host, task)
+                state["queue"].extendleft(reversed(deferred))
+            self.cnt_failed += len(failed)
+            if wakeup is not None and (self.wakeup is None or wakeup < self.wakeup):
+                #process; the dispatch is woken up again once the earliest cooldown (or backoff) elapses
+                if self.timer is not None:
+                    self.timer.cancel()
+                self.wakeup = wakeup
+                self.timer = threading.Timer(max(wakeup - now, 0.0) + 0.001, self.awake)
+                self.timer.daemon = True
+                self.timer.start()
+        for host, task in failed:
+            task["future"].set_exception(ConnectionError("the circuit of host %s is open" % (host)))
+
+    def awake(self):
+        with self.lock:
+            self.timer = None
+            self.wakeup = None
+        self.dispatch()
+
+    def attempt(self, host: str = "", task: dict = None):
+        started: float = time.monotonic()
+        try:
+            ret = task["func"](**task["kwargs"])
+        except (EOFError, OSError, paramiko.SSHException, pysftp.ConnectionException, requests.RequestException) as e:
+            self.release(host, False, started)
+            if task["attempt"] >= self.retry:
+                with self.lock:
+                    self.cnt_failed += 1
+                task["future"].set_exception(e)
+            else:
+                #process; the retry is queued again after the backoff (i.e. NOT sleeping in the worker)
+                delay: float = self.getBackoff(task["attempt"])
+                logging.info("the attempt %d to host %s failed (%s); retried after %.2f seconds" % (task["attempt"] + 1, host, repr(e), delay))
+                with self.lock:
+                    self.cnt_retried += 1
+                    task["attempt"] += 1
+                    task["not_before"] = time.monotonic() + delay
+                    self.getHost(host)["queue"].appendleft(task)
+        except BaseException as e:
+            #process; the other errors are NOT the failures of the host
+            with self.lock:
+                self.getHost(host)["in_flight"] -= 1
+            task["future"].set_exception(e)
+        else:
+            size: int = os.path.getsize(task["lcl_path"]) if ret is True and os.path.exists(task["lcl_path"]) is True else 0
+            self.release(host, True, started, size)
+            task["future"].set_result(ret)
+        self.dispatch()
+
+    def decrease(self, host: str = "", state: dict = None, reason: str = ""):
+        state["limit"] = max(1.0, state["limit"] / 2)
+        state["threshold"] = state["limit"]
+        state["decreased"] = time.monotonic()
+        logging.info("the concurrency of host %s is decreased to %d (%s)" % (host, int(state["limit"]), reason))
+
+    def release(self, host: str = "", succeeded: bool = True, started: float = 0.0, size: int = 0):
+        with self.lock:
+            state: dict = self.getHost(host)
+            state["in_flight"] -= 1
+            seconds: float = time.monotonic() - started
+            if succeeded is True:
+                state["cnt_ok"] += 1
+                state["failures"] = 0
+                state["trips"] = 0
+                #process; the latency is normalized per MiB (at least), so the small logs measure the round trip
+                latency: float = seconds / max(size, 1048576) * 1048576
+                congested: bool = state["latency"] is not None and latency > max(HostScheduler.LATENCY_FACTOR * state["latency"], HostScheduler.LATENCY_FLOOR)
+                state["latency"] = latency if state["latency"] is None else (1 - HostScheduler.ALPHA) * state["latency"] + HostScheduler.ALPHA * latency
+                if congested is True:
+                    self.decrease(host, state, "latency %.3f seconds" % (latency))
+                elif state["limit"] < state["threshold"]:
+                    #process; slow start; the limit grows by one per success (i.e. doubled per round trip) until the first congestion
+                    state["limit"] = min(float(self.max_limit), state["limit"] + 1)
+                else:
+                    #process; additive increase; the limit grows by one per round trip
+                    state["limit"] = min(float(self.max_limit), state["limit"] + 1 / state["limit"])
+            elif started < state["decreased"]:
+                #process; the attempt began before the former decrease, so it is the same congestion (i.e. NOT counted again)
+                state["cnt_error"] += 1
+            else:
+                state["cnt_error"] += 1
+                state["failures"] += 1
+                self.decrease(host, state, "error")
+                #process; a failure while half-open (i.e. tripped before and NOT recovered yet) opens the circuit again at once
+                if state["failures"] >= HostScheduler.THRESHOLD or state["trips"] > 0:
+                    cooldown: float = min(self.cooldown * (2 ** state["trips"]), HostScheduler.MAX_COOLDOWN)
+                    state["opened"] = time.monotonic() + cooldown
+                    state["trips"] += 1
+                    state["failures"] = 0
+                    self.cnt_opened += 1
+                    logging.warning("the circuit of host %s is open for %.1f seconds" % (host, cooldown))
+
+    def getBackoff(self, attempt: int = 0) -> float:
+        #process; exponential backoff with full jitter
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            if self.timer is not None:
+                self.timer.cancel()
+        self.executor.shutdown(wait = True)
+        for host, state in self.hosts.items():
+            logging.info("the host %s is downloaded %d times with %d errors (concurrency %d; latency %s)" % (host, state["cnt_ok"], state["cnt_error"], int(state["limit"]),
+                "%.3f seconds" % (state["latency"]) if state["latency"] is not None else "unknown"))
+        logging.info("the download retried count is %d" % (self.cnt_retried))
+        logging.info("the download failed count is %d" % (self.cnt_failed))
+        logging.info("the circuit opened count is %d" % (self.cnt_opened))
+        if self.metrics is not None:
+            self.metrics.add("download_retried", self.cnt_retried)
+            self.metrics.add("download_failed", self.cnt_failed)
+            self.metrics.add("circuit_opened", self.cnt_opened)
+
+class TmsDownloader():
+    def __init__(self, jobs: int = 1, ftp_fetching: bool = True, session: requests.Session = None, pool: SftpConnectionPool = None, store: LogStore = None, scheduler: HostScheduler = None):
+        self.jobs: int = jobs if jobs > 1 else 1
+        self.ftp_fetching: bool = ftp_fetching
+        self.session: requests.Session = session
+        self.pool: SftpConnectionPool = pool
+        self.store: LogStore = store
+        self.scheduler: HostScheduler = scheduler if scheduler is not None else HostScheduler(max_limit = self.jobs)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.sessions: list = list()
+        self.pools: list = list()
+        self.idle: list = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def getPool(self, host: str = "", username: str = "") -> SftpConnectionPool:
+        if self.jobs == 1:
+            return self.pool
+        #process; check out an idle pool; the one connected to the host already is preferred
+        with self.lock:
+            for idx in range(len(self.idle) - 1, -1, -1):
+                if (host, username) in self.idle[idx].connections:
+                    return self.idle.pop(idx)
+            if len(self.idle) > 0:
+                return self.idle.pop()
+            pool: SftpConnectionPool = SftpConnectionPool(port = self.pool.port, metrics = self.pool.metrics)
+            self.pools.append(pool)
+            return pool
+
+    def putPool(self, pool: SftpConnectionPool = None, host: str = "", username: str = ""):
+        if self.jobs == 1:
+            return
+        #process; the sessions to a host are kept within its concurrency limit (e.g. a throttling host drops the excessive ones)
+        with self.lock:
+            connected: int = len([p for p in self.pools if (host, username) in p.connections])
+            trimmed: bool = connected > self.scheduler.getLimit(host)
+        if trimmed is True:
+            pool.discard(host = host, username = username)
+        with self.lock:
+            self.idle.append(pool)
+
+    def getSession(self) -> requests.Session:
+        #process; the workers do NOT share the session of the API calls
+        if getattr(self.local, "session", None) is None:
+            self.local.session = requests.Session()
+            self.local.session.cookies.update(self.session.cookies)
+            with self.lock:
+                self.sessions.append(self.local.session)
+        return self.local.session
+
+    def fetch(self, job: dict = None) -> bool:
+        fetched: bool = False
+        if self.ftp_fetching is True:
+            #process; fetch log from FTP site (via the pooled connection checked out by this worker)
+            pool: SftpConnectionPool = self.getPool(job["host"], job["username"])
+            try:
+                fetched = TmsCrawler.fetchBySftp(pool = pool, host = job["host"], username = job["username"], password = job["password"], rmt_path = job["rmt_path"], lcl_path = job["lcl_path"], store = self.store, uri = job["uri"])
+            except (EOFError, OSError, paramiko.SSHException) as e:
+                #process; the broken session is discarded, whereas the one refusing a transfer is kept; the scheduler decides on the retry
+                conn: pysftp.Connection = pool.connections.get((job["host"], job["username"]))
+                if conn is not None and (isinstance(e, OSError) is False or SftpConnectionPool.isAlive(conn) is False):
+                    logging.info("the session to %s@%s failed (%s)" % (job["username"], job["host"], repr(e)))
+                    pool.discard(host = job["host"], username = job["username"])
+                raise
+            finally:
+                self.putPool(pool, job["host"], job["username"])
+        else:
+            #process; fetch log from web site (via the session of this worker)
+            fetched = TmsCrawler.fetchByHttp(session = self.getSession(), url = job["url"], headers = job["headers"], lcl_path = job["lcl_path"], store = self.store, uri = job["uri"])
+        return fetched
+
+    def download(self, job: dict = None) -> bool:
+        time_begin = time.time()
+        fetched: bool = self.fetch(job)
+        if fetched is True and self.store is not None and self.store.resolve(job["lcl_path"]) is not None:
+            #process; the log is linked from the log store rather than downloaded
+            job["linked"] = True
+        elif fetched is True:
+            if self.store is not None:
+                self.store.ingest(uri = job["uri"], lcl_path = job["lcl_path"])
+            time_end = time.time()
+            time_diff = time_end - time_begin
+            logging.info("lcl_path \"%s\" is downloaded (within %d seconds)" % (job["lcl_path"], timedelta(seconds=time_diff).total_seconds()))
+            if self.pool.metrics is not None:
+                self.pool.metrics.observe("download", time_diff, job["lcl_path"])
+                self.pool.metrics.add("bytes_downloaded", os.path.getsize(job["lcl_path"]))
+        return fetched
+
+    def submit(self, job: dict = None) -> Future:
+        #process; the concurrency, the retries and the circuit are managed per host
+        host: str = job["host"] if self.ftp_fetching is True else urlparse(job["url"]).netloc
+        return self.scheduler.submit(host, job["lcl_path"], self.download, job = job)
+
+    def close(self):
+        self.scheduler.close()
+        for pool in self.pools:
+            pool.close()
+        for session in self.sessions:
+            session.close()
+
+class TmsSession():
+    def __init__(self, portal: str = "https://tms.wi-fi.org/", jobs: int = 1, ftp_fetching: bool = True, sftp_port: int = 22, metrics: PipelineMetrics = None, store: LogStore = None, retry: int = 3, backoff: float = 1.0, cooldown: float = 30.0):
+        self.portal: str = portal + ("/" if portal.endswith("/") is False else "")
+        self.metrics: PipelineMetrics = metrics
+        self.session: requests.Session = requests.Session()
+        self.pool: SftpConnectionPool = SftpConnectionPool(port = sftp_port, metrics = metrics)
+        self.downloader: TmsDownloader = TmsDownloader(jobs = jobs, ftp_fetching = ftp_fetching, session = self.session, pool = self.pool, store = store,
+            scheduler = HostScheduler(max_limit = jobs, retry = retry, backoff = backoff, cooldown = cooldown, metrics = metrics))
+        self.headers: dict = dict()
+        self.cnt_login: int = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def create(**kwargs):
+        return TmsSession(portal = kwargs["portal"] if "portal" in kwargs else "https://tms.wi-fi.org/",
+            jobs = kwargs["jobs"] if "jobs" in kwargs else 1,
+            ftp_fetching = kwargs["ftp_fetching"] if "ftp_fetching" in kwargs else True,
+            sftp_port = kwargs["sftp_port"] if "sftp_port" in kwargs else 22,
+            metrics = kwargs["metrics"] if "metrics" in kwargs else None,
+            store = kwargs["log_store"] if "log_store" in kwargs else None,
+            retry = kwargs["retry"] if "retry" in kwargs else 3,
+            backoff = kwargs["backoff"] if "backoff" in kwargs else 1.0,
+            cooldown = kwargs["circuit_cooldown"] if "circuit_cooldown" in kwargs else 30.0)
+
+    def login(self, account: str = "", password: str = "") -> dict:
+        #process; authenticate once per account; the JSESSIONID is reused by the following events
+        if account in self.headers:
+            logging.debug("the session of %s is reused" % (account))
+            return self.headers[account]
+        #preparation; retrieve CSRF-TOKEN
+        time_begin: float = time.perf_counter()
+        rsp1 = self.session.get(self.portal)
+        c1:dict = rsp1.cookies.get_dict()
+        logging.debug("the cookie of CSRF-TOKEN is \"%s\"" % (c1))
+        #preparation; retrieve JSESSIONID
+        h2: dict = {"X-CSRF-TOKEN":c1["CSRF-TOKEN"]}
+        d2: dict = {"j_username": account, "j_password": password}
+        rsp2 = self.session.post(self.portal + "api/authentication", headers=h2, data=d2)
+        c2:dict = rsp2.cookies.get_dict()
+        if self.metrics is not None:
+            self.metrics.observe("http_authenticate", time.perf_counter() - time_begin)
+        logging.debug("the cookie of JSESSIONID is \"%s\"" %(c2))
+        self.headers[account] = {"JSESSIONID": c2["JSESSIONID"]}
+        self.cnt_login += 1
+        return self.headers[account]
+
+    def close(self):
+        self.downloader.close()
+        self.pool.close()
+        self.session.close()
+        logging.info("the authentication count is %d" % (self.cnt_login))
+
+class TmsSyncState():
+    def __init__(self, fn: str = "", rebuild: bool = False):
+        self.fn: str = fn
+        #process; the validators of the event information, and the results unable to be downloaded (i.e. absent, by id and timestamp)
+        self.state: dict = {"validators": dict(), "absent": dict()}
+        if rebuild is False and os.path.exists(fn) is True:
+            try:
+                with open(fn, "r", encoding = "utf-8") as f:
+                    loaded: dict = json.load(f)
+                self.state["validators"] = loaded.get("validators", dict())
+                self.state["absent"] = loaded.get("absent", dict())
+            except (OSError, ValueError, AttributeError) as e:
+                logging.warning("the sync state %s is unable to be loaded (%s)" % (fn, repr(e)))
+                self.state = {"validators": dict(), "absent": dict()}
+        #process; the state as saved, so an unchanged state is NOT written again
+        self.saved: str = json.dumps(self.state, separators = (",", ":"))
+
+    def getValidator(self, url: str = "") -> dict:
+        if url not in self.state["validators"]:
+            self.state["validators"][url] = dict()
+        return self.state["validators"][url]
+
+    def isAbsent(self, result: dict = None) -> bool:
+        return self.state["absent"].get(str(result["id"])) == str(result["timestamp"])
+
+    def mark(self, result_id: str = "", timestamp: str = ""):
+        self.state["absent"][str(result_id)] = str(timestamp)
+
+    def clear(self, result_id: str = ""):
+        self.state["absent"].pop(str(result_id), None)
+
+    def save(self):
+        #process; best-effort (e.g. a read-only or full disk); the event information and the results are retrieved in full by the next run
+        dumped: str = json.dumps(self.state, separators = (",", ":"))
+        if dumped != self.saved:
+            tmp_fn: str = self.fn + ".tmp"
+            try:
+                with open(tmp_fn, "w", encoding = "utf-8") as f:
+                    f.write(dumped)
+                os.replace(tmp_fn, self.fn)
+                self.saved = dumped
+            except OSError as e:
+                logging.warning("the sync state %s is unable to be saved (%s)" % (self.fn, repr(e)))
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_fn)
+        logging.info("the absent result count of sync state is %d" % (len(self.state["absent"])))
+
+class ProfileCache():
+    VERSION: int = 1
+
+    @staticmethod
+    def getKey(fn: str = "", kind: str = "") -> dict:
+        stat: os.stat_result = os.stat(fn)
+        return {"path": os.path.abspath(fn), "kind": kind, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "version": ProfileCache.VERSION}
+
+    @staticmethod
+    def load(fn: str = "", kind: str = "", loader = None, rebuild: bool = False) -> dict:
+        #process; the compiled table is stored next to the profile file, keyed by its path and mtime
+        cached_fn: str = fn + "." + kind + ".json"
+        key: dict = ProfileCache.getKey(fn, kind)
+        if rebuild is False and os.path.exists(cached_fn) is True:
+            try:
+                with open(cached_fn, "r", encoding = "utf-8") as f:
+                    cached: dict = json.load(f)
+                if cached["key"] == key:
+                    logging.debug("the %s of %s is loaded from %s" % (kind, fn, cached_fn))
+                    return cached["table"]
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logging.warning("the profile cache %s is unable to be loaded (%s)" % (cached_fn, repr(e)))
+        table: dict = loader(fn)
+        try:
+            tmp_fn: str = cached_fn + ".tmp"
+            with open(tmp_fn, "w", encoding = "utf-8") as f:
+                json.dump({"key": key, "table": table}, f, separators = (",", ":"))
+            os.replace(tmp_fn, cached_fn)
+        except OSError as e:
+            logging.info("the profile cache %s is unable to be saved (%s)" % (cached_fn, repr(e)))
+        return table
+
+class Candidate():
+    #the candidate of report; a compact (i.e. slotted) replacement of dict with the same item access
+    __slots__ = ("timestamp", "directory", "fn", "result", "dut", "ap", "sta", "elapsed", "begin", "tms_dut", "tms_tb")
+    KEYS: tuple = ("timestamp", "path", "result", "dut", "ap", "sta", "elapsed", "begin", "tms_dut", "tms_tb")
+    INTERNED: frozenset = frozenset(["result", "dut", "elapsed", "tms_dut", "tms_tb"])
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __getitem__(self, key: str = ""):
+        try:
+            if key == "path":
+                return self.directory + self.fn
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key: str = "", value = None):
+        if key == "path":
+            #process; the directory is shared by the candidates of a tc; only the filename is owned
+            idx: int = value.rfind(os.path.sep) + 1
+            self.directory = sys.intern(value[:idx])
+            self.fn = value[idx:]
+        elif key == "ap" or key == "sta":
+            setattr(self, key, tuple([sys.intern(name) if isinstance(name, str) is True else name for name in value]))
+        elif key in Candidate.INTERNED and isinstance(value, str) is True:
+            setattr(self, key, sys.intern(value))
+        elif key in Candidate.KEYS:
+            setattr(self, key, value)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: str = "") -> bool:
+        return key in Candidate.KEYS and hasattr(self, "directory" if key == "path" else key) is True
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other) -> bool:
+        return dict(self.items()) == (dict(other.items()) if isinstance(other, Candidate) is True else other)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def get(self, key: str = "", default = None):
+        return self[key] if key in self else default
+
+    def keys(self) -> list:
+        return [key for key in Candidate.KEYS if key in self]
+
+    def items(self) -> list:
+        return [(key, self[key]) for key in self.keys()]
 
 class MaterialProvider():
+    PATT_NAMING_AP = re.compile(r"wfa_control_agent_(.*?)_ap")
+    PATT_NAMING_STA = re.compile(r"wfa_control_agent_(.*?)_sta")
+
     @staticmethod
-    def getNaming(fn: str = "") -> dict:
+    def getNaming(fn: str = "", rebuild: bool = False) -> dict:
         naming: dict = {"ap": dict(), "sta": dict()}
         if os.path.exists(fn) is True:
-            with codecs.open(fn, "r", encoding = "utf-8", errors = "ignore") as f:
-                for line in f:
-                    n = line.strip().split("!")
-                    if len(n) == (3 + 1):
-                        matched_name_ap = re.findall(r"wfa_control_agent_(.*?)_ap", n[1])
-                        if matched_name_ap is not None and len(matched_name_ap) > 0:
-                            naming["ap"][n[2]] = matched_name_ap[0]
-                            continue
-                        matched_name_sta = re.findall(r"wfa_control_agent_(.*?)_sta", n[1])
-                        if matched_name_sta is not None and len(matched_name_sta) > 0:
-                            naming["sta"][n[2]] = matched_name_sta[0]
-                            continue
+            naming = ProfileCache.load(fn, "naming", MaterialProvider.parseNaming, rebuild)
         logging.debug(repr(naming))
         return naming
 
     @staticmethod
-    def getPermutation(fn: str = "") -> dict:
-        DELI_PERMUTE = ","
+    def parseNaming(fn: str = "") -> dict:
+        naming: dict = {"ap": dict(), "sta": dict()}
+        with codecs.open(fn, "r", encoding = "utf-8", errors = "ignore") as f:
+            for line in f:
+                n = line.strip().split("!")
+                if len(n) == (3 + 1):
+                    matched_name_ap = MaterialProvider.PATT_NAMING_AP.search(n[1])
+                    if matched_name_ap is not None:
+                        naming["ap"][n[2]] = matched_name_ap.group(1)
+                        continue
+                    matched_name_sta = MaterialProvider.PATT_NAMING_STA.search(n[1])
+                    if matched_name_sta is not None:
+                        naming["sta"][n[2]] = matched_name_sta.group(1)
+                        continue
+        return naming
+
+    @staticmethod
+    def getPermutation(fn: str = "", rebuild: bool = False) -> dict:
         permutation: dict = dict()
         if os.path.exists(fn) is True:
-            with codecs.open(fn, "r", encoding = "utf-8", errors = "ignore") as f:
-                m = xmltodict.parse(f.read())
-                for prog in m:
-                    for tc in m[prog]:
-                        if tc not in permutation:
-                            permutation[tc] = {"ap": list(), "sta": list()}
-                            if "AP" in m[prog][tc] and m[prog][tc]["AP"] is not None and m[prog][tc]["AP"].isdigit() == False:
-                                permutation[tc]["ap"] = m[prog][tc]["AP"].split(DELI_PERMUTE)
-                            if "STA" in m[prog][tc] and m[prog][tc]["STA"] is not None and m[prog][tc]["STA"].isdigit() == False:
-                                permutation[tc]["sta"] = m[prog][tc]["STA"].split(DELI_PERMUTE)
+            permutation = ProfileCache.load(fn, "permutation", MaterialProvider.parsePermutation, rebuild)
         logging.debug(repr(permutation))
         return permutation
 
+    @staticmethod
+    def parsePermutation(fn: str = "") -> dict:
+        #process; iterate through the elements (i.e. program, tc, and AP/STA) instead of building the whole document
+        DELI_PERMUTE = ","
+        permutation: dict = dict()
+        repeated: set = set()
+        depth: int = 0
+        tc: str = None
+        with open(fn, "rb") as f:
+            for event, elem in ElementTree.iterparse(f, events = ("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 2:
+                        tc = elem.tag
+                        if tc in permutation:
+                            #process; a repeated tc is NOT a single element (i.e. a list in xmltodict), so its testbeds are unknown
+                            repeated.add(tc)
+                        else:
+                            permutation[tc] = {"ap": list(), "sta": list()}
+                    continue
+                depth -= 1
+                if depth == 2 and tc not in repeated and elem.tag in ("AP", "STA"):
+                    text: str = elem.text.strip() if elem.text is not None else ""
+                    if len(text) > 0 and text.isdigit() == False:
+                        permutation[tc][elem.tag.lower()] = text.split(DELI_PERMUTE)
+                elif depth == 1:
+                    elem.clear()
+        for tc in repeated:
+            permutation[tc] = {"ap": list(), "sta": list()}
+        return permutation
+
     @staticmethod
     def getMaterial(**kwargs) -> dict:
         for k,v in kwargs.items():
@@ -62,9 +896,257 @@ class MaterialProvider():
         return dict()
 
 class TmsCrawler(MaterialProvider):
+    @staticmethod
+    def fetchBySftp(**kwargs) -> bool:
+        pool: SftpConnectionPool = kwargs["pool"]
+        host: str = kwargs["host"]
+        username: str = kwargs["username"]
+        password: str = kwargs["password"]
+        rmt_path: str = kwargs["rmt_path"]
+        lcl_path: str = kwargs["lcl_path"]
+        store: LogStore = kwargs["store"] if "store" in kwargs else None
+        uri: str = kwargs["uri"] if "uri" in kwargs else rmt_path
+        conn5: pysftp.Connection = pool.acquire(host = host, username = username, password = password)
+        #process; check log existence on FTP site
+        try:
+            size: int = conn5.stat(rmt_path).st_size
+        except FileNotFoundError:
+            logging.info("rmt_path \"%s\" is NOT existing" % (rmt_path))
+            return False
+        #process; the same remote log (i.e. logical path and size) might be stored by another event or directory
+        if store is not None and store.place(uri = uri, size = size, lcl_path = lcl_path) is True:
+            return True
+        #process; fetch log from FTP site to local path (resumed from the partial one, if any)
+        TmsCrawler.resumeBySftp(conn = conn5, rmt_path = rmt_path, lcl_path = lcl_path, size = size)
+        return True
+
+    @staticmethod
+    def resumeBySftp(**kwargs):
+        conn: pysftp.Connection = kwargs["conn"]
+        rmt_path: str = kwargs["rmt_path"]
+        lcl_path: str = kwargs["lcl_path"]
+        size: int = kwargs["size"]
+        CHUNK_SIZE: int = 262144
+        part_path: str = lcl_path + ".part"
+        offset: int = os.path.getsize(part_path) if os.path.exists(part_path) is True else 0
+        if offset > size:
+            offset = 0
+        if offset > 0:
+            logging.info("lcl_path \"%s\" is resumed from offset %d" % (lcl_path, offset))
+        with conn.sftp_client.open(rmt_path, "rb") as rf, open(part_path, "ab" if offset > 0 else "wb") as lf:
+            rf.seek(offset)
+            rf.prefetch(size)
+            for chunk in iter(lambda: rf.read(CHUNK_SIZE), b""):
+                lf.write(chunk)
+        TmsCrawler.finalize(part_path = part_path, lcl_path = lcl_path, size = size)
+
+    @staticmethod
+    def finalize(**kwargs):
+        part_path: str = kwargs["part_path"]
+        lcl_path: str = kwargs["lcl_path"]
+        size: int = kwargs["size"]
+        written: int = os.path.getsize(part_path)
+        if size is not None and written != size:
+            #process; the partial one is poisoned (e.g. the remote log is replaced), so the next attempt starts over
+            os.remove(part_path)
+            raise IOError("the size of \"%s\" is %d rather than %d" % (part_path, written, size))
+        os.replace(part_path, lcl_path)
+
+    @staticmethod
+    def fetchByHttp(**kwargs) -> bool:
+        session: requests.Session = kwargs["session"]
+        url: str = kwargs["url"]
+        headers: dict = kwargs["headers"]
+        lcl_path: str = kwargs["lcl_path"]
+        store: LogStore = kwargs["store"] if "store" in kwargs else None
+        uri: str = kwargs["uri"] if "uri" in kwargs else url
+        CHUNK_SIZE: int = 262144
+        part_path: str = lcl_path + ".part"
+        logging.info("url is \"%s\"" % (url))
+        offset: int = os.path.getsize(part_path) if os.path.exists(part_path) is True else 0
+        h5: dict = dict(headers)
+        if offset > 0:
+            logging.info("lcl_path \"%s\" is resumed from offset %d" % (lcl_path, offset))
+            h5["Range"] = "bytes=%d-" % (offset)
+        #process; check log existence on web site
+        with session.get(url, headers=h5, stream=True) as rsp5:
+            size: int = None
+            if rsp5.status_code == 206 and offset > 0:
+                content_range: str = rsp5.headers.get("Content-Range", "")
+                size = int(content_range.split("/")[-1]) if content_range.split("/")[-1].isdigit() else None
+                if size is not None and size < offset:
+                    #process; the partial one is longer than the remote log (i.e. poisoned); start over
+                    logging.info("lcl_path \"%s\" is longer than the remote log (%d bytes); restarted" % (lcl_path, size))
+                    rsp5.close()
+                    os.remove(part_path)
+                    return TmsCrawler.fetchByHttp(**kwargs)
+            elif rsp5.status_code == 200:
+                offset = 0
+                size = int(rsp5.headers["Content-Length"]) if "Content-Length" in rsp5.headers and "Content-Encoding" not in rsp5.headers else None
+            elif rsp5.status_code == 416 and offset > 0:
+                #process; the partial one is unusable; start over (i.e. NOT a retry, since the request without range is different)
+                os.remove(part_path)
+                return TmsCrawler.fetchByHttp(**kwargs)
+            else:
+                logging.info("lcl_path \"%s\" is unable to be downloaded" % (lcl_path))
+                return False
+            #process; the body is NOT read if the same remote log is stored already
+            if store is not None and size is not None and store.place(uri = uri, size = size, lcl_path = lcl_path) is True:
+                if os.path.exists(part_path) is True:
+                    os.remove(part_path)
+                return True
+            with open(part_path, "ab" if offset > 0 else "wb") as f5:
+                for chunk in rsp5.iter_content(chunk_size=CHUNK_SIZE):
+                    f5.write(chunk)
+        TmsCrawler.finalize(part_path = part_path, lcl_path = lcl_path, size = size)
+        return True
+
+    @staticmethod
+    def retrieve(**kwargs) -> str:
+        return "".join(TmsCrawler.retrieveChunks(**kwargs))
+
+    @staticmethod
+    def retrieveChunks(**kwargs):
+        session: requests.Session = kwargs["session"]
+        url: str = kwargs["url"]
+        headers: dict = dict(kwargs["headers"])
+        cached_fn: str = kwargs["cached_fn"]
+        validator: dict = kwargs["validator"]
+        CHUNK_SIZE: int = 65536
+        if cached_fn is not None and validator is not None and os.path.exists(cached_fn) is True:
+            if "etag" in validator:
+                headers["If-None-Match"] = validator["etag"]
+            if "last_modified" in validator:
+                headers["If-Modified-Since"] = validator["last_modified"]
+        with session.get(url, headers=headers, stream=True) as rsp:
+            if rsp.status_code == 304:
+                logging.info("the content of \"%s\" is NOT modified; the cached one is used" % (url))
+                with codecs.open(cached_fn, "r", encoding = "utf-8") as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), ""):
+                        yield chunk
+                return
+            if validator is not None:
+                validator.clear()
+                if rsp.headers.get("ETag") is not None:
+                    validator["etag"] = rsp.headers.get("ETag")
+                if rsp.headers.get("Last-Modified") is not None:
+                    validator["last_modified"] = rsp.headers.get("Last-Modified")
+            if rsp.encoding is None:
+                rsp.encoding = "utf-8"
+            f = open(cached_fn, "wb") if cached_fn is not None else None
+            try:
+                for chunk in rsp.iter_content(chunk_size=CHUNK_SIZE, decode_unicode=True):
+                    if f is not None:
+                        f.write(chunk.encode("utf-8"))
+                    yield chunk
+            finally:
+                if f is not None:
+                    f.close()
+
+    @staticmethod
+    def iterResults(chunks = None):
+        decoder = json.JSONDecoder()
+        buf: str = ""
+        pos: int = 0
+        began: bool = False
+        for chunk in chunks:
+            buf = buf[pos:] + chunk
+            pos = 0
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n,":
+                    pos += 1
+                if pos >= len(buf):
+                    break
+                if began is False:
+                    if buf[pos] != "[":
+                        raise ValueError("the payload is NOT a JSON array")
+                    began = True
+                    pos += 1
+                    continue
+                if buf[pos] == "]":
+                    return
+                try:
+                    result, end = decoder.raw_decode(buf, pos)
+                except ValueError:
+                    break
+                if end >= len(buf):
+                    #process; the value might be continued in the next chunk
+                    break
+                yield result
+                pos = end
+        raise ValueError("the payload is truncated")
+
+    @staticmethod
+    def getTc(result: dict = None) -> str:
+        return os.path.basename(os.path.dirname(result["logFileName"]))
+
+    @staticmethod
+    def popCompleted(**kwargs):
+        #process; lazily, so the job scheduled by the consumer in the meantime (e.g. a fallback) is popped as well
+        scheduled: deque = kwargs["scheduled"]
+        final: bool = kwargs["final"]
+        while len(scheduled) > 0 and (final is True or scheduled[0]["future"] is None or scheduled[0]["future"].done() is True):
+            yield scheduled.popleft()
+
+    @staticmethod
+    def scheduleLatest(**kwargs) -> tuple:
+        #process; schedule the newest job of a tc; the older ones are kept as the fallback in case the newest one is unable to be downloaded
+        jobs: list = kwargs.pop("jobs")
+        cnt_skipped: int = 0
+        while len(jobs) > 0:
+            job: dict = jobs.pop(0)
+            if TmsCrawler.schedule(job = job, **kwargs) is True:
+                job["fallback"] = jobs
+                return (job, cnt_skipped)
+            cnt_skipped += 1
+        return (None, cnt_skipped)
+
+    @staticmethod
+    def countChunks(**kwargs):
+        metrics: PipelineMetrics = kwargs["metrics"]
+        for chunk in kwargs["chunks"]:
+            metrics.add("bytes_api", len(chunk.encode("utf-8")))
+            yield chunk
+
+    @staticmethod
+    def schedule(**kwargs) -> bool:
+        job: dict = kwargs["job"]
+        downloader: TmsDownloader = kwargs["downloader"]
+        pending: dict = kwargs["pending"]
+        sync_state: TmsSyncState = kwargs["sync_state"]
+        verdict_cache: VerdictCache = kwargs["verdict_cache"] if "verdict_cache" in kwargs else None
+        lcl_path: str = job["lcl_path"]
+        if os.path.exists(job["lcl_dir"]) is False:
+            os.makedirs(job["lcl_dir"], mode = 0o777, exist_ok = True)
+        if os.path.exists(lcl_path) is True:
+            logging.info("lcl_path \"%s\" is existing" % (lcl_path))
+        elif verdict_cache is not None and verdict_cache.isEvicted(lcl_path) is True:
+            #process; the verdict of an evicted log is still stored, so it is NOT downloaded again
+            logging.info("lcl_path \"%s\" is evicted from the cache; its stored verdict is used" % (lcl_path))
+        elif sync_state is not None and sync_state.isAbsent(job) is True:
+            logging.info("lcl_path \"%s\" was unable to be downloaded in former run" % (lcl_path))
+            return False
+        elif lcl_path in pending:
+            #process; the same log is already scheduled by a former result
+            job["future"] = pending[lcl_path]
+            job["duplicated"] = True
+        else:
+            job["future"] = downloader.submit(job)
+            pending[lcl_path] = job["future"]
+        return True
+
     @staticmethod
     def getMaterial(**kwargs) -> dict:
         material: dict = dict()
+        for tc, candidate in TmsCrawler.iterMaterial(**kwargs):
+            if tc not in material:
+                material[tc] = list()
+            material[tc].append(candidate)
+        logging.info(repr(material))
+        return material
+
+    @staticmethod
+    def iterMaterial(**kwargs):
         event: str = kwargs["event"]
         directory: str = kwargs["directory"]
         rst_expected: str = kwargs["rst_expected"]
@@ -78,53 +1160,135 @@ class TmsCrawler(MaterialProvider):
         latest: str = kwargs["latest"]
         permutation: str = kwargs["permutation"]
         dut: str = kwargs["dut"]
+        incremental: bool = kwargs["incremental"] if "incremental" in kwargs else False
+        streaming: bool = kwargs["streaming"] if "streaming" in kwargs else False
+        portal: str = kwargs["portal"] if "portal" in kwargs else "https://tms.wi-fi.org/"
+        metrics: PipelineMetrics = kwargs["metrics"] if "metrics" in kwargs else None
+        shared: TmsSession = kwargs["tms_session"] if "tms_session" in kwargs else None
+        known: set = kwargs["known"] if "known" in kwargs else None
+        verdict_cache: VerdictCache = kwargs["verdict_cache"] if "verdict_cache" in kwargs else None
+        grouped: bool = kwargs["grouped"] if "grouped" in kwargs else False
+        tag: str = ("-" + kwargs["tag"]) if "tag" in kwargs and len(kwargs["tag"]) > 0 else ""
         cnt: int = 0
         cnt_dl: int = 0
+        cnt_linked: int = 0
         cnt_omitted: int = 0
         cnt_exec: int = 0
         evaluation_dl_qty: int = 0
-        term_early: bool = False
-        ftp_fetching: bool = True
-        cache_cover: bool = False
-        cache_category: bool = False
+        cache_cover: bool = incremental
+        cache_category: bool = incremental
         cached_directory: str = directory
-        cached_cover: str = cached_directory + os.path.sep + "cover.txt"
-        cached_category: str = cached_directory + os.path.sep + "category.txt"
-        PORTAL: str = "https://tms.wi-fi.org/"
-        AUTHENTICATOR: str = "https://tms.wi-fi.org/api/authentication"
-        COVER: str = "https://tms.wi-fi.org/api/events/" + event
-        CATEGORY: str = "https://tms.wi-fi.org/api/testResults/event/" + event
-        INDIVIDUAL: str = "https://tms.wi-fi.org/wifitmsftp/api/ftp-file?"
-        with requests.Session() as s:
+        cached_cover: str = cached_directory + os.path.sep + "cover" + tag + ".txt"
+        cached_category: str = cached_directory + os.path.sep + "category" + tag + ".txt"
+        cached_sync: str = cached_directory + os.path.sep + "sync" + tag + ".json"
+        sync_state: TmsSyncState = TmsSyncState(cached_sync, rebuild = kwargs["rebuild"] if "rebuild" in kwargs else False) if incremental is True else None
+        PORTAL: str = portal + ("/" if portal.endswith("/") is False else "")
+        COVER: str = PORTAL + "api/events/" + event
+        CATEGORY: str = PORTAL + "api/testResults/event/" + event
+        INDIVIDUAL: str = PORTAL + "wifitmsftp/api/ftp-file?"
+        scheduled: deque = deque()
+        pending: dict = dict()
+        newest: dict = dict()
+        remaining: dict = None
+        closed: list = list()
+        term_early: bool = False
+        #preparation; the session (i.e. HTTP session, SFTP connections and downloader) is shared by the events of a batch
+        with (contextlib.nullcontext(shared) if shared is not None else TmsSession.create(**kwargs)) as tms_session:
+            s: requests.Session = tms_session.session
+            downloader: TmsDownloader = tms_session.downloader
             os.makedirs(cached_directory, mode = 0o777, exist_ok = True)
-            #preparation; retrieve CSRF-TOKEN
-            rsp1 = s.get(PORTAL)
-            c1:dict = rsp1.cookies.get_dict()
-            logging.debug("the cookie of CSRF-TOKEN is \"%s\"" % (c1))
-            #preparation; retrieve JSESSIONID
-            h2: dict = {"X-CSRF-TOKEN":c1["CSRF-TOKEN"]}
-            d2: dict = {"j_username": account, "j_password": password}
-            rsp2 = s.post(AUTHENTICATOR, headers=h2, data=d2)
-            c2:dict = rsp2.cookies.get_dict()
-            logging.debug("the cookie of JSESSIONID is \"%s\"" %(c2))
+            h3: dict = tms_session.login(account = account, password = password)
             #process; retrieve event related information such as name/password/ftpUserName
-            h3: dict = {"JSESSIONID": c2["JSESSIONID"]}
-            rsp3 = s.get(COVER, headers=h3)
-            if cache_cover is True:
-                with open(cached_cover, "wb") as f3:
-                    f3.write(rsp3.text.encode("utf-8"))
-            js3 = json.loads(rsp3.text)
+            txt3: str = TmsCrawler.retrieve(session = s, url = COVER, headers = h3,
+                cached_fn = cached_cover if cache_cover is True else None,
+                validator = sync_state.getValidator(COVER) if sync_state is not None else None)
+            if metrics is not None:
+                metrics.add("bytes_api", len(txt3.encode("utf-8")))
+            js3 = json.loads(txt3)
             logging.debug("event identifier is %s" % (js3["id"]))
             logging.debug("event name is %s" % (js3["name"]))
             logging.debug("event password is %s" % (js3["password"]))
             logging.debug("ftp home directory is %s" % (js3["ftpUserName"]))
-            rsp4 = s.get(CATEGORY, headers=h3)
-            if cache_category is True:
-                with open(cached_category, "wb") as f4:
-                    f4.write(rsp4.text.encode("utf-8"))
-            js4 = json.loads(rsp4.text)
-            for result in js4:
+            chunks4 = TmsCrawler.retrieveChunks(session = s, url = CATEGORY, headers = h3,
+                cached_fn = cached_category if cache_category is True else None,
+                validator = sync_state.getValidator(CATEGORY) if sync_state is not None else None)
+            if metrics is not None:
+                chunks4 = TmsCrawler.countChunks(chunks = chunks4, metrics = metrics)
+            #process; decode the results one by one (streaming) or as a whole
+            js4 = TmsCrawler.iterResults(chunks4) if streaming is True else json.loads("".join(chunks4))
+            if grouped is True and streaming is False and latest is False:
+                #process; the results per tc are counted in advance, so the completion of a tc is marked (i.e. a candidate of None) once its last result is handled
+                remaining = dict()
+                for result in js4:
+                    remaining[TmsCrawler.getTc(result)] = remaining.get(TmsCrawler.getTc(result), 0) + 1
+            for result in itertools.chain(js4, [None]):
+                while len(closed) > 0:
+                    scheduled.append({"tc": closed.pop(0), "marker": True, "future": None})
+                if result is None:
+                    #process; schedule the newest result per tc at the end of results; ties are resolved in favor of the former one (i.e. a stable sort)
+                    for jobs in newest.values():
+                        jobs.sort(key = lambda j: int(j["timestamp"]), reverse = True)
+                        job, cnt_skipped = TmsCrawler.scheduleLatest(jobs = jobs, downloader = downloader, pending = pending, sync_state = sync_state, verdict_cache = verdict_cache)
+                        cnt_omitted += cnt_skipped
+                        if job is None:
+                            continue
+                        scheduled.append(job)
+                        if evaluation_dl_qty > 0 and evaluation_dl_qty <= len(pending):
+                            break
+                #process; yield the completed candidates in the order of results
+                for job in TmsCrawler.popCompleted(scheduled = scheduled, final = result is None):
+                    if "marker" in job:
+                        yield (job["tc"], None)
+                        continue
+                    if job["future"] is not None:
+                        fetched: bool = False
+                        try:
+                            fetched = job["future"].result()
+                        except (EOFError, OSError, paramiko.SSHException, pysftp.ConnectionException, requests.RequestException) as e:
+                            #process; a failing host does NOT abort the crawl; the result is NOT marked as absent, so it is tried again by the next run
+                            logging.warning("lcl_path \"%s\" is unable to be downloaded (%s); it is omitted" % (job["lcl_path"], repr(e)))
+                        else:
+                            if fetched is False and sync_state is not None:
+                                sync_state.mark(job["id"], job["timestamp"])
+                        if fetched is False:
+                            cnt_omitted += 1
+                            if "fallback" in job and len(job["fallback"]) > 0:
+                                #process; the newest result is unable to be downloaded, so the next newer one of the tc is tried
+                                fallback, cnt_skipped = TmsCrawler.scheduleLatest(jobs = job["fallback"], downloader = downloader, pending = pending, sync_state = sync_state, verdict_cache = verdict_cache)
+                                cnt_omitted += cnt_skipped
+                                if fallback is not None:
+                                    logging.info("the tc %s falls back to the result with ts \"%s\"" % (fallback["tc"], fallback["timestamp"]))
+                                    scheduled.append(fallback)
+                            continue
+                        if job["duplicated"] is True:
+                            logging.info("lcl_path \"%s\" is existing" % (job["lcl_path"]))
+                        elif job["linked"] is True:
+                            cnt_linked += 1
+                        else:
+                            cnt_dl += 1
+                    if sync_state is not None:
+                        sync_state.clear(job["id"])
+                    if "fallback" in job:
+                        #process; the older results of the tc are NOT needed anymore
+                        cnt_omitted += len(job["fallback"])
+                    candidate: Candidate = Candidate(timestamp = job["timestamp"], path = job["lcl_path"])
+                    logging.debug("the tc with ts \"%s\" is going to be executed" % (candidate["timestamp"]))
+                    cnt_exec += 1
+                    yield (job["tc"], candidate)
+                    if known is not None:
+                        #process; the consumer has taken the candidate, so the result is NOT going to be processed again
+                        known.add(str(job["id"]))
+                if result is None or term_early is True:
+                    continue
                 cnt += 1
+                if remaining is not None:
+                    remaining[TmsCrawler.getTc(result)] -= 1
+                    if remaining[TmsCrawler.getTc(result)] == 0:
+                        closed.append(TmsCrawler.getTc(result))
+                if known is not None and str(result["id"]) in known:
+                    logging.debug("the result %s is already processed" % (result["id"]))
+                    cnt_omitted += 1
+                    continue
                 logging.debug("id is %s" %(result["id"]))
                 logging.debug("result is %s" %(result["result"]))
                 logging.debug("timestamp is %s" %(result["timestamp"]))
@@ -163,118 +1327,246 @@ class TmsCrawler(MaterialProvider):
                         cnt_omitted += 1
                         continue
                     lcl_dir: str = cached_directory + os.path.sep + rmt_path_dir
-                    if os.path.exists(lcl_dir) is False:
-                        os.makedirs(lcl_dir, mode = 0o777, exist_ok = True)
                     lcl_path: str = lcl_dir + os.path.sep + rmt_path_fn
                     logging.debug("lcl_path is \"%s\"" %(lcl_path))
-                    if os.path.exists(lcl_path) is True:
-                        logging.info("lcl_path \"%s\" is existing" % (lcl_path))
-                    else:
-                        if ftp_fetching is True:
-                            #process; fetch log from FTP site
-                            warnings.filterwarnings("ignore")
-                            cnopts = pysftp.CnOpts()
-                            cnopts.hostkeys = None
-                            with pysftp.Connection(host=host, port=22, username=username, password=password, cnopts=cnopts) as conn5:
-                                logging.debug("connection established successfully")
-                                #process; check log existence on FTP site
-                                pwd5: str = conn5.pwd
-                                logging.debug("current working directory is: %s" % (pwd5))
-                                if conn5.exists(rmt_path) is False:
-                                    logging.info("rmt_path \"%s\" is NOT existing" % (rmt_path))
-                                    cnt_omitted += 1
-                                    continue
-                                #process; fetch log from FTP site to local path
-                                time_begin = time.time()
-                                conn5.get(remotepath=rmt_path, localpath=lcl_path, preserve_mtime=False)
-                                time_end = time.time()
-                                time_diff = time_end - time_begin
-                                logging.info("lcl_path \"%s\" is downloaded (within %d seconds)" % (lcl_path, timedelta(seconds=time_diff).total_seconds()))
-                                cnt_dl += 1
-                                if evaluation_dl_qty > 0 and evaluation_dl_qty <= cnt_dl:
-                                    term_early = True
-                        else:
-                            #process; fetch log from web site
-                            url: str = INDIVIDUAL + "homePath=" + js3["ftpUserName"] + "&" + "uri=" + result["logFileName"]
-                            logging.info("url is \"%s\"" % (url))
-                            #process; check log existence on web site
-                            time_begin = time.time()
-                            rsp5 = s.get(url, headers=h3)
-                            if rsp5.status_code == 200:
-                                with open(lcl_path, "wb") as f5:
-                                    f5.write(rsp5.content)
-                                time_end = time.time()
-                                time_diff = time_end - time_begin
-                                logging.info("lcl_path \"%s\" is downloaded (within %d seconds)" % (lcl_path, timedelta(seconds=time_diff).total_seconds()))
-                            else:
-                                logging.info("lcl_path \"%s\" is unable to be downloaded" % (lcl_path))
-                                cnt_omitted += 1
-                                continue
-                            cnt_dl += 1
-                            if evaluation_dl_qty > 0 and evaluation_dl_qty <= cnt_dl:
-                                term_early = True
                     logging.debug(result)
-                    candidate: dict = dict()
-                    candidate["timestamp"] = result["timestamp"]
-                    candidate["path"] = lcl_path
-                    if rmt_path_tc not in material:
-                        material[rmt_path_tc] = list()
-                    append: bool = True
+                    job: dict = {"id": result["id"], "timestamp": result["timestamp"], "tc": rmt_path_tc, "lcl_dir": lcl_dir, "lcl_path": lcl_path, "future": None, "duplicated": False, "linked": False}
+                    job["host"] = host
+                    job["username"] = username
+                    job["password"] = password
+                    job["rmt_path"] = rmt_path
+                    job["url"] = INDIVIDUAL + "homePath=" + js3["ftpUserName"] + "&" + "uri=" + result["logFileName"]
+                    job["headers"] = h3
+                    job["uri"] = result["logFileName"]
                     if latest is True:
-                        for i,c in enumerate(material[rmt_path_tc]):
-                            if (int(candidate["timestamp"]) > int(c["timestamp"])):
-                                logging.info("the tc with ts \"%s\" is NOT the latest and it should be excluded" % (c["timestamp"]))
-                                material[rmt_path_tc].pop(i)
-                                cnt_omitted += 1
-                                cnt_exec -= 1
-                                break
-                            else:
-                                logging.info("the tc with ts \"%s\" is NOT the latest and it should NOT be kept" % (candidate["timestamp"]))
-                                cnt_omitted += 1
-                                cnt_exec -= 1
-                                append = False
-                    if append is True:
-                        logging.debug("the tc with ts \"%s\" is going to be executed (%d)" % (candidate["timestamp"], len(material[rmt_path_tc])))
-                        material[rmt_path_tc].append(candidate)
-                    cnt_exec += 1
-                    if term_early is True:
-                        break
+                        #process; keep the results per tc; nothing is downloaded before the selection is done
+                        if rmt_path_tc not in newest:
+                            newest[rmt_path_tc] = list()
+                        newest[rmt_path_tc].append(job)
+                        continue
+                    if TmsCrawler.schedule(job = job, downloader = downloader, pending = pending, sync_state = sync_state, verdict_cache = verdict_cache) is False:
+                        cnt_omitted += 1
+                        continue
+                    scheduled.append(job)
+                    if evaluation_dl_qty > 0 and evaluation_dl_qty <= len(pending):
+                        term_early = True
             logging.info("the iterated count is %d" % (cnt))
             logging.info("the executed count is %d" % (cnt_exec))
             logging.info("the downloaded count is %d" % (cnt_dl))
+            logging.info("the linked count is %d (from the log store)" % (cnt_linked))
             logging.info("the omitted count is %d" % (cnt_omitted))
-            logging.info("the quantity of results is %d" % (len(js4)))
-            logging.info(repr(material))
+            logging.info("the quantity of results is %d" % (cnt if streaming is True else len(js4)))
+            if metrics is not None:
+                metrics.add("iterated", cnt)
+                metrics.add("executed", cnt_exec)
+                metrics.add("downloaded", cnt_dl)
+                metrics.add("store_linked", cnt_linked)
+                metrics.add("omitted", cnt_omitted)
+            if sync_state is not None:
+                sync_state.save()
+
+class TmsBatchCrawler(MaterialProvider):
+    @staticmethod
+    def getMaterial(**kwargs) -> dict:
+        material: dict = dict()
+        for tc, candidate in TmsBatchCrawler.iterMaterial(**kwargs):
+            if tc not in material:
+                material[tc] = list()
+            material[tc].append(candidate)
         return material
 
+    @staticmethod
+    def iterMaterial(**kwargs):
+        events: list = kwargs["events"]
+        seen: set = set()
+        with TmsSession.create(**kwargs) as tms_session:
+            for event in events:
+                logging.info("event %s is going to be crawled" % (event))
+                #process; a tc might be continued by the next event, so its completion is NOT marked per event
+                for tc, candidate in TmsCrawler.iterMaterial(**dict(kwargs, event = event, tag = event, tms_session = tms_session, grouped = False)):
+                    #process; a log shared by events is reported once
+                    if candidate["path"] in seen:
+                        logging.info("lcl_path \"%s\" is reported by a former event" % (candidate["path"]))
+                        continue
+                    seen.add(candidate["path"])
+                    yield (tc, candidate)
+
+class TmsWatcher():
+    def __init__(self, **kwargs):
+        self.provided: dict = kwargs["provided"]
+        self.interval: float = kwargs["interval"]
+        self.max_interval: float = kwargs["max_interval"]
+        self.rounds: int = kwargs["rounds"] if "rounds" in kwargs else 0
+        self.output: str = kwargs["output"] if "output" in kwargs else None
+        self.parsing: dict = kwargs["parsing"]
+        self.reporting: dict = kwargs["reporting"]
+        self.category: str = kwargs["category"] if "category" in kwargs else "all"
+        self.sorted_output: bool = kwargs["sorted_output"] if "sorted_output" in kwargs else False
+        self.cache_manager: CacheManager = kwargs["cache_manager"] if "cache_manager" in kwargs else None
+        self.material: dict = dict()
+        self.known: dict = dict()
+        self.paths: set = set()
+        self.tms_session: TmsSession = None
+
+    def poll(self) -> list:
+        #process; the session and the processed results are kept, so only the new results are downloaded and parsed
+        if self.tms_session is None:
+            self.tms_session = TmsSession.create(**self.provided)
+        events: list = self.provided["events"] if len(self.provided["events"]) > 0 else [self.provided["event"]]
+        added: list = list()
+        for event in events:
+            if event not in self.known:
+                self.known[event] = set()
+            items = TmsCrawler.iterMaterial(**dict(self.provided, event = event, tag = event if len(events) > 1 else "", tms_session = self.tms_session, known = self.known[event], incremental = True))
+            items = TmsDirParser.stream(items = items)
+            items = UccLogParser.stream(items = items, use_timestamp_from_log = False, **self.parsing)
+            for tc, candidate in items:
+                if candidate["path"] in self.paths:
+                    continue
+                self.paths.add(candidate["path"])
+                if tc not in self.material:
+                    self.material[tc] = list()
+                self.material[tc].append(candidate)
+                added.append((tc, candidate))
+        #process; the cached state is only rebuilt by the first round
+        self.provided = dict(self.provided, rebuild = False)
+        return added
+
+    def publish(self, added: list = None):
+        if self.output is None:
+            #process; emit the rows of the new candidates only (i.e. delta)
+            ReportFormatter.stream(items = added, output = sys.stdout, **self.reporting)
+            return
+        #process; rewrite the whole report in place (atomically)
+        material: dict = UccLogTimestampFiltrator.decorate(material = {tc: list(self.material[tc]) for tc in self.material},
+            use_timestamp_from_log = False,
+            category = self.category)
+        if self.sorted_output is True:
+            material = MaterialSorter.decorate(material = material)
+        tmp_fn: str = self.output + ".tmp"
+        with open(tmp_fn, "w", encoding = "utf-8", newline = "") as f:
+            ReportFormatter.write(material = material, output = f, **self.reporting)
+        os.replace(tmp_fn, self.output)
+        logging.info("the report %s is updated" % (self.output))
+
+    def watch(self):
+        interval: float = self.interval
+        rnd: int = 0
+        try:
+            while True:
+                rnd += 1
+                try:
+                    added: list = self.poll()
+                    logging.info("the round %d of watching gets %d new candidates" % (rnd, len(added)))
+                    if len(added) > 0 or rnd == 1:
+                        self.publish(added)
+                    #process; back off while there is nothing new
+                    interval = self.interval if len(added) > 0 else min(interval * 2, self.max_interval)
+                except (requests.RequestException, paramiko.SSHException, OSError, ValueError, KeyError) as e:
+                    logging.warning("the round %d of watching is failed (%s); the session is going to be renewed" % (rnd, repr(e)))
+                    if self.tms_session is not None:
+                        self.tms_session.close()
+                    self.tms_session = None
+                    interval = min(interval * 2, self.max_interval)
+                if self.parsing["verdict_cache"] is not None and os.path.isdir(self.provided["directory"]) is True:
+                    if self.cache_manager is not None:
+                        self.cache_manager.enforce()
+                    self.parsing["verdict_cache"].save()
+                if self.rounds > 0 and rnd >= self.rounds:
+                    break
+                logging.info("the next round of watching is %.1f seconds later" % (interval))
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logging.info("watching is stopped")
+        finally:
+            if self.tms_session is not None:
+                self.tms_session.close()
+
 class LfsCrawler(MaterialProvider):
     @staticmethod
     def getMaterial(**kwargs) -> dict:
         material: dict = dict()
+        for tc, candidate in LfsCrawler.iterMaterial(**kwargs):
+            if tc not in material:
+                material[tc] = list()
+            material[tc].append(candidate)
+        logging.info(repr(material))
+        return material
+
+    @staticmethod
+    def isZipfile(path: str = "") -> bool:
+        #process; check the magic bytes (i.e. local file header or end of central directory) before seeking the end of file
+        try:
+            with open(path, "rb") as f:
+                if f.read(4) in (b"PK\x03\x04", b"PK\x05\x06"):
+                    return True
+        except OSError:
+            return False
+        #process; the prefixed one (e.g. self-extracting) is recognized by its end of central directory
+        return zipfile.is_zipfile(path)
+
+    @staticmethod
+    def scanDir(**kwargs) -> tuple:
+        path: str = kwargs["path"]
+        permutation: str = kwargs["permutation"]
+        prefix: str = kwargs["prefix"]
+        executor: ThreadPoolExecutor = kwargs["executor"]
+        children: list = list()
+        files: list = list()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir: bool = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir is False:
+                        files.append(entry.name)
+                    elif entry.is_symlink() is False:
+                        children.append(os.path.join(path, entry.name))
+        except OSError as e:
+            logging.info("the directory %s is unable to be scanned (%s)" % (path, repr(e)))
+        #process; the subdirectories are scanned in advance by the other workers
+        children = [(child, executor.submit(LfsCrawler.scanDir, path = child, permutation = permutation, prefix = prefix, executor = executor) if executor is not None else None) for child in children]
+        candidates: list = list()
+        if len(files) > 0:
+            tc: str = os.path.basename(path)
+            if tc.startswith(prefix) is False:
+                logging.info("tc \"%s\" is omitted" %(tc))
+            elif tc not in permutation:
+                logging.info("tc \"%s\" is unrecognized" %(tc))
+            else:
+                for name in files:
+                    lcl_path: str = path + os.path.sep + name
+                    if LfsCrawler.isZipfile(lcl_path) is True:
+                        logging.debug("Archive format is %s; %s" % ("zip", lcl_path))
+                        candidate: Candidate = Candidate(timestamp = int(-1), path = lcl_path)
+                        candidates.append((tc, candidate))
+        return (children, candidates)
+
+    @staticmethod
+    def iterScanned(**kwargs):
+        children, candidates = kwargs["scanned"]
+        #process; bottom-up (i.e. the subdirectories before the directory itself) as os.walk(topdown = False) does
+        for child, future in children:
+            scanned: tuple = future.result() if future is not None else LfsCrawler.scanDir(path = child, permutation = kwargs["permutation"], prefix = kwargs["prefix"], executor = None)
+            yield from LfsCrawler.iterScanned(scanned = scanned, permutation = kwargs["permutation"], prefix = kwargs["prefix"])
+        yield from candidates
+
+    @staticmethod
+    def iterMaterial(**kwargs):
         directory: str = kwargs["directory"]
         permutation: str = kwargs["permutation"]
         prefix: str = kwargs["prefix"]
-        # iterate through the specified directory
-        for root, dirs, files in os.walk(directory, topdown = False):
-            for name in files:
-                tc: str = os.path.basename(root)
-                if tc.startswith(prefix) is False:
-                    logging.info("tc \"%s\" is omitted" %(tc))
-                    continue
-                if tc not in permutation:
-                    logging.info("tc \"%s\" is unrecognized" %(tc))
-                    continue
-                lcl_path: str = root + os.path.sep + name
-                if zipfile.is_zipfile(lcl_path):
-                    logging.debug("Archive format is %s; %s" % ("zip", lcl_path))
-                    if tc not in material:
-                        material[tc] = list()
-                    candidate: dict = dict()
-                    candidate["timestamp"] = int(-1)
-                    candidate["path"] = lcl_path
-                    material[tc].append(candidate)
-        logging.info(repr(material))
-        return material
+        scan_jobs: int = kwargs["scan_jobs"] if "scan_jobs" in kwargs else 1
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers = scan_jobs) if scan_jobs > 1 else None
+        try:
+            # iterate through the specified directory; a tc directory which is omitted is never opened file by file
+            scanned: tuple = LfsCrawler.scanDir(path = directory, permutation = permutation, prefix = prefix, executor = executor)
+            yield from LfsCrawler.iterScanned(scanned = scanned, permutation = permutation, prefix = prefix)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait = True, cancel_futures = True)
 
 class MaterialDecorator():
     @staticmethod
@@ -283,7 +1575,368 @@ class MaterialDecorator():
             logging.error("the value of {} is {}".format(k, v))
         return dict()
 
+    @classmethod
+    def stream(cls, **kwargs):
+        #process; a decorator requiring whole groups buffers the candidates per tc, then decorates a group once its tc is complete (i.e. a candidate of None), or at the end
+        material: dict = dict()
+        for tc, candidate in kwargs.pop("items"):
+            if candidate is not None:
+                if tc not in material:
+                    material[tc] = list()
+                material[tc].append(candidate)
+                continue
+            if tc in material:
+                decorated: dict = cls.decorate(material = {tc: material.pop(tc)}, **kwargs)
+                for tc_decorated in decorated:
+                    for candidate_decorated in decorated[tc_decorated]:
+                        yield (tc_decorated, candidate_decorated)
+            yield (tc, None)
+        decorated: dict = cls.decorate(material = material, **kwargs)
+        for tc in decorated:
+            for candidate in decorated[tc]:
+                yield (tc, candidate)
+
+class VerdictCache():
+    def __init__(self, fn: str = "", rebuild: bool = False, store: LogStore = None):
+        self.fn: str = fn
+        self.log_store: LogStore = store
+        self.entries: dict = dict()
+        #process; the access time is tracked only for the eviction by a byte budget (i.e. an access alone does NOT dirty the cache otherwise)
+        self.tracked: bool = False
+        self.changed: bool = False
+        self.cnt_hit: int = 0
+        self.cnt_miss: int = 0
+        self.cnt_evicted_hit: int = 0
+        if rebuild is False and os.path.exists(fn) is True:
+            try:
+                with open(fn, "r", encoding = "utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.warning("the verdict cache %s is unable to be loaded (%s)" % (fn, repr(e)))
+                self.entries = dict()
+
+    @staticmethod
+    def getSignature(path: str = "") -> list:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns, UccLogParser.VERSION]
+
+    def isEvicted(self, path: str = "") -> bool:
+        entry: dict = self.entries.get(path)
+        return entry is not None and entry.get("evicted") is True and os.path.exists(path) is False
+
+    def evict(self, path: str = ""):
+        self.entries[path]["evicted"] = True
+        self.changed = True
+
+    def touch(self, entry: dict = None):
+        entry["accessed"] = time.time()
+        if self.tracked is True:
+            self.changed = True
+
+    def lookup(self, path: str = "") -> tuple:
+        entry: dict = self.entries.get(path)
+        if entry is not None and self.isEvicted(path) is True:
+            #process; the zipfile is evicted from the disk, so the stored verdict is the only source
+            self.cnt_hit += 1
+            self.cnt_evicted_hit += 1
+            self.touch(entry)
+            return (True, entry["verdict"])
+        if entry is not None and entry["signature"] == VerdictCache.getSignature(path):
+            self.cnt_hit += 1
+            self.touch(entry)
+            return (True, entry["verdict"])
+        if self.log_store is not None:
+            #process; the same content might be parsed already under another path (i.e. shared by the content key)
+            hit, verdict = self.log_store.lookup(path)
+            if hit is True:
+                self.cnt_hit += 1
+                self.store(path, verdict)
+                return (True, verdict)
+        self.cnt_miss += 1
+        return (False, None)
+
+    def store(self, path: str = "", verdict: dict = None):
+        signature: list = VerdictCache.getSignature(path)
+        if signature is not None:
+            self.entries[path] = {"signature": signature, "verdict": verdict, "accessed": time.time()}
+            self.changed = True
+        if self.log_store is not None:
+            self.log_store.store(path, verdict)
+
+    def save(self):
+        #process; evict the entries of deleted files; the entries of evicted files are kept for their verdicts
+        for path in [p for p in self.entries if os.path.exists(p) is False and self.entries[p].get("evicted") is not True]:
+            self.entries.pop(path)
+            self.changed = True
+        #process; best-effort (e.g. a read-only or full disk); the verdicts are parsed again by the next run
+        if self.changed is True:
+            tmp_fn: str = self.fn + ".tmp"
+            try:
+                with open(tmp_fn, "w", encoding = "utf-8") as f:
+                    json.dump(self.entries, f, separators = (",", ":"))
+                os.replace(tmp_fn, self.fn)
+                self.changed = False
+            except OSError as e:
+                logging.warning("the verdict cache %s is unable to be saved (%s)" % (self.fn, repr(e)))
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_fn)
+        logging.info("the verdict cache hit count is %d" % (self.cnt_hit))
+        logging.info("the verdict cache miss count is %d" % (self.cnt_miss))
+        logging.info("the verdict cache hit count of evicted files is %d" % (self.cnt_evicted_hit))
+        if self.log_store is not None:
+            try:
+                self.log_store.save()
+            except OSError as e:
+                logging.warning("the log store %s is unable to be saved (%s)" % (self.log_store.fn, repr(e)))
+
+class CacheManager():
+    def __init__(self, verdict_cache: VerdictCache = None, max_bytes: int = 0):
+        self.verdict_cache: VerdictCache = verdict_cache
+        self.max_bytes: int = max_bytes
+        self.verdict_cache.tracked = max_bytes > 0
+        self.cnt_evicted: int = 0
+        self.bytes_evicted: int = 0
+
+    @staticmethod
+    def getUsage(paths: list = None) -> dict:
+        #process; a zipfile is accounted along with its extracted UCC logs (i.e. <zipfile>-<member>); a directory is listed once
+        usage: dict = dict()
+        by_dir: dict = dict()
+        for path in paths:
+            by_dir.setdefault(os.path.dirname(path), list()).append(path)
+        for lcl_dir, grouped in by_dir.items():
+            try:
+                entries: list = list(os.scandir(lcl_dir))
+            except OSError:
+                continue
+            stats: dict = {e.name: e.stat() for e in entries if e.is_file() is True}
+            for path in grouped:
+                fn: str = os.path.basename(path)
+                if fn not in stats:
+                    continue
+                members: list = [lcl_dir + os.path.sep + name for name in stats if name.startswith(fn + "-") is True]
+                #process; the inode is kept, since the hardlinks (e.g. of the log store) share the bytes of the zipfile
+                usage[path] = (stats[fn].st_size, members, sum(stats[os.path.basename(m)].st_size for m in members), (stats[fn].st_dev, stats[fn].st_ino))
+        return usage
+
+    @staticmethod
+    def getPinned(entries: dict = None, paths: list = None) -> set:
+        #process; the latest run (by the begin time of UCC log) per test case is pinned
+        latest: dict = dict()
+        for path in paths:
+            entry: dict = entries[path]
+            tc: str = os.path.basename(os.path.dirname(path))
+            rank: tuple = ((entry["verdict"] or dict()).get("begin") or "", entry.get("accessed", 0))
+            if tc not in latest or rank > latest[tc][0]:
+                latest[tc] = (rank, path)
+        return set(path for rank, path in latest.values())
+
+    def unlink(self, digest: str = None) -> bool:
+        #process; the last link of a zipfile in the directory is gone; the blob of the log store is removed as well, unless it is linked by another directory (or event)
+        if digest is None:
+            return True
+        blob: str = self.verdict_cache.log_store.getBlob(digest)
+        try:
+            if os.stat(blob).st_nlink > 1:
+                logging.info("the blob %s is still linked; its bytes are NOT freed" % (blob))
+                return False
+            os.remove(blob)
+        except OSError as e:
+            logging.warning("the blob %s is unable to be removed (%s)" % (blob, repr(e)))
+            return False
+        return True
+
+    def enforce(self):
+        if self.max_bytes <= 0:
+            return
+        entries: dict = self.verdict_cache.entries
+        log_store: LogStore = self.verdict_cache.log_store
+        usage: dict = CacheManager.getUsage([p for p in entries if entries[p].get("evicted") is not True])
+        #process; the zipfiles sharing an inode (i.e. the same content linked from the log store) are accounted once
+        names: dict = dict()
+        for path, (size, members, extracted, inode) in usage.items():
+            names.setdefault(inode, set()).add(path)
+        total: int = sum(usage[next(iter(paths))][0] for paths in names.values()) + sum(extracted for size, members, extracted, inode in usage.values())
+        logging.info("the cache usage is %d bytes (budget %d bytes)" % (total, self.max_bytes))
+        if total > self.max_bytes:
+            pinned: set = CacheManager.getPinned(entries, list(usage))
+            #process; evict the least recently used zipfiles (and extracted UCC logs) until the budget is met; a zipfile sharing its inode with a pinned one frees nothing, so it is kept
+            for path in sorted([p for p in usage if len(names[usage[p][3]] & pinned) == 0], key = lambda p: entries[p].get("accessed", 0)):
+                if total <= self.max_bytes:
+                    break
+                size, members, extracted, inode = usage[path]
+                digest: str = log_store.resolve(path) if log_store is not None else None
+                try:
+                    for member in members:
+                        os.remove(member)
+                    os.remove(path)
+                except OSError as e:
+                    logging.warning("lcl_path \"%s\" is unable to be evicted (%s)" % (path, repr(e)))
+                    continue
+                self.verdict_cache.evict(path)
+                names[inode].discard(path)
+                freed: int = extracted
+                if len(names[inode]) == 0 and self.unlink(digest) is True:
+                    freed += size
+                total -= freed
+                self.cnt_evicted += 1
+                self.bytes_evicted += freed
+                logging.info("lcl_path \"%s\" is evicted (%d bytes)" % (path, freed))
+            if total > self.max_bytes:
+                logging.warning("the cache usage is still %d bytes since %d pinned zipfiles are kept" % (total, len(pinned)))
+        logging.info("the cache evicted count is %d" % (self.cnt_evicted))
+        logging.info("the cache evicted bytes is %d" % (self.bytes_evicted))
+
+class UccLogScanner():
+    #one time patterns; the literal is checked before the regular expression
+    PATT_CORE_VER = ("Version [", re.compile(r"WiFiTestSuite Version \[(.*?)\]"))
+    PATT_BEGIN = ("Test Start Time", re.compile(r"Test Start Time\s+\:\s+(.*)"))
+    PATT_ELAPSED = ("Execution Time [", re.compile(r"Execution Time \[(.*?)\]"))
+    PATT_RESULT = ("FINAL TEST RESULT", re.compile(r"FINAL TEST RESULT\s+--->\s+(.+)"))
+    PATT_DUT = re.compile(r"DUT \(.*\)\s+<--\s+status,(.+),vendor,(.+),model,(.+),version,(.+)")
+    PATT_DUT_D = re.compile(r"INFO - DUT \(.*\)\s+<--\s+status,(.+),vendor,(.+),model,(.+),version,(.+)")
+    PATT_DUT_P = re.compile(r"INFO - parallel.* DUT \(.*\)\s+<--\s+status,(.+),vendor,(.+),model,(.+),version,(.+)")
+    #multiple time patterns
+    PATT_SECURITY = re.compile(r".*--->.*_set_security")
+    PATT_SECURITY_P = re.compile(r"parallel.*--->.*_set_security")
+    PATT_AP_D = re.compile(r"INFO - (.*?) \(.*\)\s+--->\s+ap_set_security")
+    PATT_STA_D = re.compile(r"INFO - (.*?) \(.*\)\s+--->\s+sta_set_security")
+    PATT_AP_P = re.compile(r"INFO - parallel.* (.*?) \(.*\)\s+--->\s+ap_set_security")
+    PATT_STA_P = re.compile(r"INFO - parallel.*  (.*?) \(.*\)\s+--->\s+sta_set_security")
+    #bytes patterns for the whole buffer; bounded by line (i.e. "\r" and "\n")
+    BPATT_CORE_VER = re.compile(rb"WiFiTestSuite Version \[([^\r\n]*?)\]")
+    BPATT_BEGIN = re.compile(rb"Test Start Time[^\S\r\n]+\:[^\S\r\n]+([^\r\n]*)")
+    BPATT_ELAPSED = re.compile(rb"Execution Time \[([^\r\n]*?)\]")
+    BPATT_RESULT = re.compile(rb"FINAL TEST RESULT[^\S\r\n]+--->[^\S\r\n]+([^\r\n]+)")
+    BPATT_DUT = re.compile(rb"DUT \([^\r\n]*\)[^\S\r\n]+<--[^\S\r\n]+status,[^\r\n]+,vendor,[^\r\n]+,model,[^\r\n]+,version,[^\r\n]+")
+    BPATT_SECURITY = re.compile(rb"--->[^\r\n]*_set_security")
+
+    def __init__(self):
+        self.verdict: dict = {"core_ver": None, "begin": None, "elapsed": None, "result": None, "dut": None, "ap": list(), "sta": list()}
+        self.pending: int = 5
+
+    def checkDut(self, line: str = "") -> bool:
+        if UccLogScanner.PATT_DUT.search(line) is not None:
+            matched = (UccLogScanner.PATT_DUT_P if UccLogScanner.PATT_DUT_P.search(line) is not None else UccLogScanner.PATT_DUT_D).search(line)
+            if matched is not None:
+                self.verdict["dut"] = matched.group(2)
+                self.pending -= 1
+                return True
+        return False
+
+    def checkSecurity(self, line: str = ""):
+        if UccLogScanner.PATT_SECURITY.search(line) is not None:
+            parallel: bool = "parallel" in line and UccLogScanner.PATT_SECURITY_P.search(line) is not None
+            matched = (UccLogScanner.PATT_AP_P if parallel is True else UccLogScanner.PATT_AP_D).search(line)
+            if matched is not None:
+                ap_name = matched.group(1) if matched.group(1) != "DUT" else None
+                if ap_name not in self.verdict["ap"] and ap_name is not None:
+                    self.verdict["ap"].append(ap_name)
+                    return
+            matched = (UccLogScanner.PATT_STA_P if parallel is True else UccLogScanner.PATT_STA_D).search(line)
+            if matched is not None:
+                sta_name = matched.group(1) if matched.group(1) != "DUT" else None
+                if sta_name not in self.verdict["sta"] and sta_name is not None:
+                    self.verdict["sta"].append(sta_name)
+
+    def scanLines(self, lines = None) -> dict:
+        verdict: dict = self.verdict
+        for line in lines:
+            #one time check; skipped as a whole once every field is found
+            if self.pending > 0:
+                if verdict["core_ver"] is None and UccLogScanner.PATT_CORE_VER[0] in line:
+                    matched = UccLogScanner.PATT_CORE_VER[1].search(line)
+                    if matched is not None:
+                        verdict["core_ver"] = matched.group(1)
+                        self.pending -= 1
+                if verdict["begin"] is None and UccLogScanner.PATT_BEGIN[0] in line:
+                    matched = UccLogScanner.PATT_BEGIN[1].search(line)
+                    if matched is not None:
+                        verdict["begin"] = matched.group(1).strip()
+                        self.pending -= 1
+                if verdict["elapsed"] is None and UccLogScanner.PATT_ELAPSED[0] in line:
+                    matched = UccLogScanner.PATT_ELAPSED[1].search(line)
+                    if matched is not None:
+                        verdict["elapsed"] = matched.group(1)
+                        self.pending -= 1
+                if verdict["result"] is None and UccLogScanner.PATT_RESULT[0] in line:
+                    matched = UccLogScanner.PATT_RESULT[1].search(line)
+                    if matched is not None:
+                        verdict["result"] = matched.group(1).strip()
+                        self.pending -= 1
+                if verdict["dut"] is None and "<--" in line and self.checkDut(line) is True:
+                    continue
+            #multiple time check
+            if "--->" in line and "_set_security" in line:
+                self.checkSecurity(line)
+        return verdict
+
+    @staticmethod
+    def getLine(buf = None, begin: int = 0, end: int = 0) -> tuple:
+        lhs: int = max(buf.rfind(b"\n", 0, begin), buf.rfind(b"\r", 0, begin)) + 1
+        rhs_lf: int = buf.find(b"\n", end)
+        rhs_cr: int = buf.find(b"\r", end)
+        rhs: int = min([r for r in (rhs_lf, rhs_cr) if r >= 0], default = len(buf))
+        return (lhs, rhs)
+
+    @staticmethod
+    def decode(raw: bytes = b"") -> str:
+        return raw.decode("utf-8", errors = "ignore")
+
+    def scanBuffer(self, buf = None) -> dict:
+        #process; the buffer (bytes or mmap) holds complete lines only; one time fields take the first occurrence
+        verdict: dict = self.verdict
+        dut_line: tuple = None
+        for field, patt, stripped in (("core_ver", UccLogScanner.BPATT_CORE_VER, False), ("begin", UccLogScanner.BPATT_BEGIN, True), ("elapsed", UccLogScanner.BPATT_ELAPSED, False), ("result", UccLogScanner.BPATT_RESULT, True)):
+            if verdict[field] is None:
+                matched = patt.search(buf)
+                if matched is not None:
+                    verdict[field] = UccLogScanner.decode(matched.group(1)).strip() if stripped is True else UccLogScanner.decode(matched.group(1))
+                    self.pending -= 1
+        if verdict["dut"] is None:
+            for matched in UccLogScanner.BPATT_DUT.finditer(buf):
+                lhs, rhs = UccLogScanner.getLine(buf, matched.start(), matched.end())
+                if self.checkDut(UccLogScanner.decode(buf[lhs:rhs])) is True:
+                    dut_line = (lhs, rhs)
+                    break
+        done: int = -1
+        for matched in UccLogScanner.BPATT_SECURITY.finditer(buf):
+            if matched.start() < done:
+                continue
+            lhs, rhs = UccLogScanner.getLine(buf, matched.start(), matched.end())
+            done = rhs
+            if dut_line is not None and dut_line[0] == lhs:
+                continue
+            self.checkSecurity(UccLogScanner.decode(buf[lhs:rhs]))
+        return verdict
+
+    def scanChunks(self, f = None, chunk_size: int = 8388608) -> dict:
+        #process; feed the buffer by chunks ended at a line boundary
+        remained: bytes = b""
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            buf: bytes = remained + chunk
+            boundary: int = max(buf.rfind(b"\n"), buf.rfind(b"\r")) + 1
+            if boundary > 0:
+                self.scanBuffer(buf[:boundary])
+            remained = buf[boundary:]
+        if len(remained) > 0:
+            self.scanBuffer(remained)
+        return self.verdict
+
+    @staticmethod
+    def scanFile(path: str = "") -> dict:
+        scanner: UccLogScanner = UccLogScanner()
+        if os.path.getsize(path) == 0:
+            return scanner.verdict
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+            return scanner.scanBuffer(mm)
+
 class UccLogParser(MaterialDecorator):
+    VERSION: int = 1
+
     @staticmethod
     def decorate(**kwargs) -> dict:
         return UccLogParser.parse(**kwargs)
@@ -299,104 +1952,176 @@ class UccLogParser(MaterialDecorator):
             pass
         return dt
 
+    @staticmethod
+    def scan(lines = None) -> dict:
+        return UccLogScanner().scanLines(lines)
+
+    @staticmethod
+    def inspect(path: str = "", extract: bool = False, scan_mode: str = "line") -> dict:
+        fn_patt6 = re.compile(r"(?!sniffer).*[a-zA-Z0-9_]+-[0-9]+\.[0-9]*\.*[0-9]*.*\.log")
+        tmp_dir: str = os.path.dirname(path)
+        tmp_fn: str = os.path.basename(path)
+        verdict: dict = None
+        try:
+            #process; open the zipfile once; a file which is NOT a zipfile (or broken) is rejected by the constructor instead of by is_zipfile()
+            archive: zipfile.ZipFile = zipfile.ZipFile(path, "r")
+        except (zipfile.BadZipFile, OSError):
+            logging.info("the file %s is NOT a zipfile (or broken)" % (path))
+            return verdict
+        logging.debug("Archive format is %s; %s" % ("zip", path))
+        try:
+            with archive:
+                allfiles = archive.namelist()
+                selected = [f for f in allfiles if fn_patt6.match(f)]
+                if len(selected) == 0:
+                    logging.warning("there is no suitable pattern in zipfile %s" %(path))
+                elif extract is True:
+                    #process; extract the UCC log next to the zipfile, then parse the extracted one
+                    ucc_log_path: str = ""
+                    for fn in selected:
+                        archive.getinfo(fn).filename = tmp_fn + "-" + fn
+                        archive.extract(member=fn, path=tmp_dir)
+                        ucc_log_path = tmp_dir + os.path.sep + archive.getinfo(fn).filename
+                    if os.path.exists(ucc_log_path) is True:
+                        if scan_mode == "mmap":
+                            verdict = UccLogScanner.scanFile(ucc_log_path)
+                        else:
+                            with codecs.open(ucc_log_path, "r", encoding = "utf-8", errors = "ignore") as f:
+                                verdict = UccLogParser.scan(f)
+                else:
+                    #process; decode the UCC log from the zipfile directly
+                    with archive.open(selected[-1], "r") as member:
+                        if scan_mode == "mmap":
+                            #process; a member could NOT be memory-mapped; scan its bytes by chunks instead
+                            verdict = UccLogScanner().scanChunks(member)
+                        else:
+                            verdict = UccLogParser.scan(codecs.getreader("utf-8")(member, errors = "ignore"))
+        except zipfile.BadZipFile as e:
+            logging.warning("the zipfile %s is broken (%s)" % (path, repr(e)))
+            verdict = None
+        return verdict
+
+    @staticmethod
+    def measure(path: str = "", extract: bool = False, scan_mode: str = "line") -> tuple:
+        time_begin: float = time.perf_counter()
+        verdict: dict = UccLogParser.inspect(path, extract, scan_mode)
+        return (verdict, time.perf_counter() - time_begin)
+
+    @staticmethod
+    def observe(metrics: PipelineMetrics = None, path: str = "", seconds: float = 0.0):
+        if metrics is not None:
+            metrics.observe("parse", seconds, path)
+            metrics.add("bytes_parsed", os.path.getsize(path))
+
+    @staticmethod
+    def apply(candidate: dict = None, verdict: dict = None, use_timestamp_from_log: bool = False):
+        candidate["ap"] = verdict["ap"]
+        candidate["sta"] = verdict["sta"]
+        candidate["dut"] = verdict["dut"]
+        candidate["elapsed"] = verdict["elapsed"]
+        if verdict["result"] is not None:
+            candidate["result"] = verdict["result"]
+        if verdict["begin"] is not None:
+            candidate["begin"] = verdict["begin"]
+            if use_timestamp_from_log is True:
+                dt: datetime = UccLogParser.getDatetime(verdict["begin"])
+                candidate["timestamp"] = int(dt.timestamp())
+
+    @staticmethod
+    def stream(**kwargs):
+        items = kwargs["items"]
+        use_timestamp_from_log: bool = kwargs["use_timestamp_from_log"]
+        extract: bool = kwargs["extract"] if "extract" in kwargs else False
+        parse_jobs: int = kwargs["parse_jobs"] if "parse_jobs" in kwargs else 1
+        scan_mode: str = kwargs["scan_mode"] if "scan_mode" in kwargs else "line"
+        verdict_cache: VerdictCache = kwargs["verdict_cache"] if "verdict_cache" in kwargs else None
+        metrics: PipelineMetrics = kwargs["metrics"] if "metrics" in kwargs else None
+        WINDOW: int = parse_jobs * 4
+        window: deque = deque()
+        executor: ProcessPoolExecutor = ProcessPoolExecutor(max_workers = parse_jobs) if parse_jobs > 1 else None
+        try:
+            for item in itertools.chain(items, [None]):
+                if item is not None and item[1] is None:
+                    window.append((item[0], None, None, None))
+                elif item is not None:
+                    tc, candidate = item
+                    hit, verdict = verdict_cache.lookup(candidate["path"]) if verdict_cache is not None else (False, None)
+                    future: Future = None
+                    if hit is False:
+                        if executor is not None:
+                            future = executor.submit(UccLogParser.measure, candidate["path"], extract, scan_mode)
+                        else:
+                            verdict, seconds = UccLogParser.measure(candidate["path"], extract, scan_mode)
+                            UccLogParser.observe(metrics, candidate["path"], seconds)
+                            if verdict_cache is not None:
+                                verdict_cache.store(candidate["path"], verdict)
+                    window.append((tc, candidate, future, verdict))
+                #process; yield the parsed candidates in order; at most WINDOW candidates are in flight
+                while len(window) > 0 and (item is None or len(window) > WINDOW or window[0][2] is None or window[0][2].done() is True):
+                    tc, candidate, future, verdict = window.popleft()
+                    if candidate is None:
+                        yield (tc, None)
+                        continue
+                    if future is not None:
+                        verdict, seconds = future.result()
+                        UccLogParser.observe(metrics, candidate["path"], seconds)
+                        if verdict_cache is not None:
+                            verdict_cache.store(candidate["path"], verdict)
+                    if verdict is None:
+                        logging.info("there is no UCC log in zipfile %s; the candidate is excluded" %(candidate["path"]))
+                        continue
+                    UccLogParser.apply(candidate, verdict, use_timestamp_from_log)
+                    yield (tc, candidate)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait = True)
+
     @staticmethod
     def parse(**kwargs) -> dict:
         material: dict = kwargs["material"]
         use_timestamp_from_log: bool = kwargs["use_timestamp_from_log"]
-        fn_patt6 = re.compile(r"(?!sniffer).*[a-zA-Z0-9_]+-[0-9]+\.[0-9]*\.*[0-9]*.*\.log")
+        extract: bool = kwargs["extract"] if "extract" in kwargs else False
+        parse_jobs: int = kwargs["parse_jobs"] if "parse_jobs" in kwargs else 1
+        scan_mode: str = kwargs["scan_mode"] if "scan_mode" in kwargs else "line"
+        verdict_cache: VerdictCache = kwargs["verdict_cache"] if "verdict_cache" in kwargs else None
+        metrics: PipelineMetrics = kwargs["metrics"] if "metrics" in kwargs else None
+        verdicts: dict = dict()
+        paths: list = list(OrderedDict.fromkeys([c["path"] for tc in material for c in material[tc]]))
+        if verdict_cache is not None:
+            #process; look up the verdict index before opening any archive
+            for path in paths:
+                hit, verdict = verdict_cache.lookup(path)
+                if hit is True:
+                    verdicts[path] = verdict
+            paths = [path for path in paths if path not in verdicts]
+        if parse_jobs > 1:
+            #process; parse every candidate by the worker processes in advance
+            with ProcessPoolExecutor(max_workers = parse_jobs) as executor:
+                for path, measured in zip(paths, executor.map(UccLogParser.measure, paths, [extract] * len(paths), [scan_mode] * len(paths), chunksize = 4)):
+                    verdict, seconds = measured
+                    UccLogParser.observe(metrics, path, seconds)
+                    verdicts[path] = verdict
+                    if verdict_cache is not None:
+                        verdict_cache.store(path, verdict)
         for tc in material:
             kept: bool = True
             for idx, candidate in enumerate(material[tc]):
-                tmp_dir: str = os.path.dirname(candidate["path"])
-                tmp_fn: str = os.path.basename(candidate["path"])
-                ucc_log_path: str = ""
-                if zipfile.is_zipfile(candidate["path"]):
-                    logging.debug("Archive format is %s; %s" % ("zip", candidate["path"]))
-                    with zipfile.ZipFile(candidate["path"], "r") as archive:
-                        allfiles = archive.namelist()
-                        selected = [f for f in allfiles if fn_patt6.match(f)]
-                        for fn in selected:
-                            archive.getinfo(fn).filename = tmp_fn + "-" + fn
-                            archive.extract(member=fn, path=tmp_dir)
-                            ucc_log_path = tmp_dir + os.path.sep + archive.getinfo(fn).filename
-                    if len(ucc_log_path) == 0:
-                        logging.warning("there is no suitable pattern in zipfile %s" %(candidate["path"]))
-                else:
-                    logging.info("the file %s is NOT a zipfile (or broken)" % (candidate["path"]))
-                verdict: dict = {"core_ver": None, "begin": None, "elapsed": None, "result": None, "dut": None, "ap": list(), "sta": list()}
-                if os.path.exists(ucc_log_path) is True:
-                    with codecs.open(ucc_log_path, "r", encoding = "utf-8", errors = "ignore") as f:
-                        for line in f:
-                            #one time check
-                            if verdict["core_ver"] is None:
-                                matched_core_ver = re.findall(r"WiFiTestSuite Version \[(.*?)\]", line)
-                                if matched_core_ver is not None:
-                                    verdict["core_ver"] = matched_core_ver[0] if len(matched_core_ver) > 0 else None
-                            if verdict["begin"] is None:
-                                matched_begin = re.findall(r"Test Start Time\s+\:\s+(.*)", line)
-                                if matched_begin is not None:
-                                    verdict["begin"] = matched_begin[0].strip() if len(matched_begin) > 0 else None
-                            if verdict["elapsed"] is None:
-                                matched_elapsed = re.findall(r"Execution Time \[(.*?)\]", line)
-                                if matched_elapsed is not None:
-                                    verdict["elapsed"] = matched_elapsed[0] if len(matched_elapsed) > 0 else None
-                            if verdict["result"] is None:
-                                matched_result = re.findall(r"FINAL TEST RESULT\s+--->\s+(.+)", line)
-                                if matched_result is not None:
-                                    verdict["result"] = matched_result[0].strip() if len(matched_result) > 0 else None
-                            if verdict["dut"] is None:
-                                capi_patt5: str = re.compile(r"DUT \(.*\)\s+<--\s+status,(.+),vendor,(.+),model,(.+),version,(.+)")
-                                if re.search(capi_patt5, line) is not None:
-                                    capi_patt5d: str = r"INFO - DUT \(.*\)\s+<--\s+status,(.+),vendor,(.+),model,(.+),version,(.+)"
-                                    capi_patt5p: str = r"INFO - parallel.* DUT \(.*\)\s+<--\s+status,(.+),vendor,(.+),model,(.+),version,(.+)"
-                                    if re.search(capi_patt5p, line) is not None:
-                                        capi_patt5d = capi_patt5p
-                                    matched_result = re.findall(capi_patt5d, line)
-                                    if matched_result is not None and len(matched_result) > 0 and len(matched_result[0]) > 0:
-                                        verdict["dut"] = matched_result[0][1]
-                                        continue
-                            #multiple time check
-                            capi_patt6: str = re.compile(r".*--->.*_set_security")
-                            if re.search(capi_patt6, line) is not None:
-                                capi_patt6ap: str = None
-                                capi_patt6sta: str = None
-                                capi_patt6p: str = re.compile(r"parallel.*--->.*_set_security")
-                                if re.search(capi_patt6p, line) is not None:
-                                    capi_patt6ap: str = r"INFO - parallel.* (.*?) \(.*\)\s+--->\s+ap_set_security"
-                                    capi_patt6sta: str = r"INFO - parallel.*  (.*?) \(.*\)\s+--->\s+sta_set_security"
-                                else:
-                                    capi_patt6ap: str = r"INFO - (.*?) \(.*\)\s+--->\s+ap_set_security"
-                                    capi_patt6sta: str = r"INFO - (.*?) \(.*\)\s+--->\s+sta_set_security"
-                                matched_ap_name = re.findall(capi_patt6ap, line)
-                                if matched_ap_name is not None and len(matched_ap_name) > 0:
-                                    ap_name = matched_ap_name[0] if matched_ap_name[0] != "DUT" else None
-                                    if ap_name not in verdict["ap"] and ap_name is not None:
-                                        verdict["ap"].append(ap_name)
-                                        continue
-                                matched_sta_name = re.findall(capi_patt6sta, line)
-                                if matched_sta_name is not None and len(matched_sta_name) > 0:
-                                    sta_name = matched_sta_name[0] if matched_sta_name[0] != "DUT" else None
-                                    if sta_name not in verdict["sta"] and sta_name is not None:
-                                        verdict["sta"].append(sta_name)
-                                        continue
+                verdict: dict = None
+                if candidate["path"] in verdicts:
+                    verdict = verdicts[candidate["path"]]
                 else:
+                    verdict, seconds = UccLogParser.measure(candidate["path"], extract, scan_mode)
+                    UccLogParser.observe(metrics, candidate["path"], seconds)
+                    if verdict_cache is not None:
+                        verdict_cache.store(candidate["path"], verdict)
+                if verdict is None:
                     logging.info("there is no UCC log in zipfile %s" %(candidate["path"]))
                     kept = False
                 if kept is False:
                     material[tc].pop(idx)
                     logging.info("the candidate with index %d is excluded" %(idx))
                 else:
-                    material[tc][idx]["ap"] = verdict["ap"]
-                    material[tc][idx]["sta"] = verdict["sta"]
-                    material[tc][idx]["dut"] = verdict["dut"]
-                    material[tc][idx]["elapsed"] = verdict["elapsed"]
-                    if verdict["result"] is not None:
-                        material[tc][idx]["result"] = verdict["result"]
-                    if verdict["begin"] is not None:
-                        material[tc][idx]["begin"] = verdict["begin"]
-                        if use_timestamp_from_log is True:
-                            dt: datetime = UccLogParser.getDatetime(verdict["begin"])
-                            material[tc][idx]["timestamp"] = int(dt.timestamp())
+                    UccLogParser.apply(material[tc][idx], verdict, use_timestamp_from_log)
                     logging.info("the candidate with index %d is included" %(idx))
 
         logging.debug(repr(material))
@@ -407,6 +2132,17 @@ class TmsDirParser(MaterialDecorator):
     def decorate(**kwargs) -> dict:
         return TmsDirParser.parse(**kwargs)
 
+    @staticmethod
+    def stream(**kwargs):
+        for tc, candidate in kwargs["items"]:
+            if candidate is None:
+                yield (tc, None)
+                continue
+            path: list = candidate["path"].split(os.path.sep)
+            candidate["tms_dut"] = path[-4]
+            candidate["tms_tb"] = path[-3]
+            yield (tc, candidate)
+
     @staticmethod
     def parse(**kwargs) -> dict:
         material: dict = kwargs["material"]
@@ -421,6 +2157,18 @@ class TmsDirParser(MaterialDecorator):
         return material
 
 class UccLogResultFiltrator(MaterialDecorator):
+    @staticmethod
+    def stream(**kwargs):
+        rst_expected: str = kwargs["rst_expected"]
+        for tc, candidate in kwargs["items"]:
+            if candidate is None:
+                yield (tc, None)
+                continue
+            if ("result" not in candidate) or (candidate["result"].lower() != rst_expected.lower()):
+                logging.info("the result of candidate %s is different from expected" % (candidate["path"]))
+                continue
+            yield (tc, candidate)
+
     @staticmethod
     def decorate(**kwargs) -> dict:
         material: dict = kwargs["material"]
@@ -440,43 +2188,210 @@ class UccLogResultFiltrator(MaterialDecorator):
         return material
 
 class UccLogTimestampFiltrator(MaterialDecorator):
+    @classmethod
+    def stream(cls, **kwargs):
+        if (kwargs["category"] == "first") or (kwargs["category"] == "last"):
+            return super().stream(**kwargs)
+        return iter(kwargs["items"])
+
+    @staticmethod
+    def getSelection(candidate = None) -> tuple:
+        #process; the key (i.e. DUT and testbed permutation) and the timestamp; the slots of a compact candidate are read directly
+        try:
+            if type(candidate) is Candidate:
+                return ((candidate.dut, candidate.ap, candidate.sta), int(candidate.timestamp))
+            return ((candidate["dut"], tuple(candidate["ap"]), tuple(candidate["sta"])), int(candidate["timestamp"]))
+        except (AttributeError, KeyError):
+            return None
+
     @staticmethod
     def decorate(**kwargs) -> dict:
         material: dict = kwargs["material"]
         category: str = kwargs["category"]
         if (category == "first") or (category == "last"):
             for tc in material:
-                remedied: set = set()
+                #process; index the candidates by DUT and testbed permutation; ties are resolved in favor of the former one
+                selected: dict = dict()
+                remained: set = set()
                 for idx, candidate in enumerate(material[tc]):
-                    for i, c in enumerate(material[tc]):
-                        if i == idx:
-                            continue
-                        if "dut" in c and c["dut"] == candidate["dut"]:
-                            if ("ap" not in c) or ("sta" not in c) or ("timestamp" not in c):
-                                logging.info("parameter is missing")
-                                continue
-                            elif (c["ap"] != candidate["ap"]) or (c["sta"] != candidate["sta"]):
-                                logging.info("permutation is different")
-                                continue
-                            else:
-                                if (category == "last"):
-                                    if (int(c["timestamp"]) >= int(candidate["timestamp"])):
-                                        logging.info("the timestamp of candidate %d is not \"greater than or equal to\" existing" % (idx))
-                                        remedied.add(idx)
-                                        continue
-                                elif (args.category == "first"):
-                                    if (int(c["timestamp"]) < int(candidate["timestamp"])):
-                                        logging.info("the timestamp of candidate %d is not \"less than\" existing" % (idx))
-                                        remedied.add(idx)
-                                        continue
-                                else:
-                                    pass
-                if len(remedied) > 0:
-                    for r in reversed(sorted(remedied)):
-                        material[tc].pop(r)
+                    selection: tuple = UccLogTimestampFiltrator.getSelection(candidate)
+                    if selection is None:
+                        logging.info("parameter of candidate %d is missing" % (idx))
+                        remained.add(idx)
+                        continue
+                    key, ts = selection
+                    if key not in selected:
+                        selected[key] = (idx, ts)
+                        continue
+                    idx_selected, ts_selected = selected[key]
+                    if ((category == "last") and (ts > ts_selected)) or ((category == "first") and (ts < ts_selected)):
+                        logging.info("the timestamp of candidate %d supersedes candidate %d" % (idx, idx_selected))
+                        selected[key] = (idx, ts)
+                    else:
+                        logging.info("the timestamp of candidate %d is superseded by candidate %d" % (idx, idx_selected))
+                remained.update([idx for idx, ts in selected.values()])
+                if len(remained) < len(material[tc]):
+                    material[tc][:] = [c for idx, c in enumerate(material[tc]) if idx in remained]
         logging.debug(repr(material))
         return material
 
+class MaterialSorter(MaterialDecorator):
+    @staticmethod
+    def decorate(**kwargs) -> dict:
+        material: dict = kwargs["material"]
+        sorted_material: dict = OrderedDict(sorted(material.items()))
+        for k in sorted_material:
+            sorted_material[k] = sorted(sorted_material[k], key=lambda x: x["elapsed"] if "elapsed" in x else x["timestamp"], reverse=True)
+        return sorted_material
+
+class MaterialGrouper(MaterialDecorator):
+    @staticmethod
+    def decorate(**kwargs) -> dict:
+        return kwargs["material"]
+
+class MaterialPipeline():
+    @staticmethod
+    def iterate(**kwargs):
+        #process; chain the decorators lazily; only the ones requiring whole groups buffer the candidates
+        metrics: PipelineMetrics = kwargs["metrics"] if "metrics" in kwargs else None
+        wrap = (lambda name, items: metrics.iterate(name, items)) if metrics is not None else (lambda name, items: items)
+        items = wrap("TmsDirParser", TmsDirParser.stream(items = kwargs["items"]))
+        items = wrap("UccLogParser", UccLogParser.stream(items = items,
+            use_timestamp_from_log = kwargs["use_timestamp_from_log"],
+            extract = kwargs["extract"],
+            parse_jobs = kwargs["parse_jobs"],
+            scan_mode = kwargs["scan_mode"],
+            verdict_cache = kwargs["verdict_cache"],
+            metrics = metrics))
+        if kwargs["rst_expected"] is not None:
+            items = wrap("UccLogResultFiltrator", UccLogResultFiltrator.stream(items = items, rst_expected = kwargs["rst_expected"]))
+        items = wrap("UccLogTimestampFiltrator", UccLogTimestampFiltrator.stream(items = items, category = kwargs["category"]))
+        if kwargs["sorted_output"] is True:
+            items = wrap("MaterialSorter", MaterialSorter.stream(items = items))
+        elif "grouped" in kwargs and kwargs["grouped"] is True and kwargs["category"] not in ("first", "last"):
+            #process; the rows are output per tc, as the batch path does
+            items = wrap("MaterialGrouper", MaterialGrouper.stream(items = items))
+        return items
+
+class MaterialStore():
+    VERSION: int = 1
+    BATCH: int = 10000
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            started TEXT,
+            source TEXT,
+            directory TEXT,
+            event TEXT,
+            rst_expected TEXT,
+            quantity INTEGER DEFAULT 0);
+        CREATE TABLE IF NOT EXISTS candidates (
+            id INTEGER PRIMARY KEY,
+            run INTEGER REFERENCES runs(id),
+            tc TEXT,
+            tc_seq INTEGER,
+            path TEXT,
+            ts INTEGER,
+            result TEXT,
+            dut TEXT,
+            ap TEXT,
+            sta TEXT,
+            complete INTEGER,
+            sort_key,
+            data TEXT);
+        CREATE INDEX IF NOT EXISTS idx_candidates_order ON candidates(run, tc_seq, id);
+        CREATE INDEX IF NOT EXISTS idx_candidates_sorted ON candidates(run, tc, sort_key);
+        CREATE INDEX IF NOT EXISTS idx_candidates_result ON candidates(run, result COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_candidates_permutation ON candidates(tc, dut, ap, sta, ts);
+        """
+
+    def __init__(self, fn: str = ""):
+        self.fn: str = fn
+        self.conn: sqlite3.Connection = sqlite3.connect(fn)
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        version: int = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, MaterialStore.VERSION):
+            raise ValueError("the material store %s is of version %d rather than %d" % (fn, version, MaterialStore.VERSION))
+        self.conn.executescript(MaterialStore.SCHEMA)
+        self.conn.execute("PRAGMA user_version = %d" % (MaterialStore.VERSION))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def begin(self, source: str = "", directory: str = "", event: str = "", rst_expected: str = None) -> int:
+        with self.conn:
+            cursor = self.conn.execute("INSERT INTO runs (started, source, directory, event, rst_expected) VALUES (?, ?, ?, ?, ?)",
+                (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), source, directory, event, rst_expected))
+        return cursor.lastrowid
+
+    @staticmethod
+    def getRow(run: int = 0, tc: str = "", tc_seq: int = 0, candidate: dict = None) -> tuple:
+        complete: bool = ("dut" in candidate) and ("ap" in candidate) and ("sta" in candidate) and ("timestamp" in candidate)
+        return (run, tc, tc_seq, candidate["path"],
+            int(candidate["timestamp"]) if "timestamp" in candidate else None,
+            candidate["result"] if "result" in candidate else None,
+            candidate["dut"] if "dut" in candidate else None,
+            json.dumps(candidate["ap"]) if "ap" in candidate else None,
+            json.dumps(candidate["sta"]) if "sta" in candidate else None,
+            1 if complete is True else 0,
+            candidate["elapsed"] if "elapsed" in candidate else candidate["timestamp"],
+            json.dumps(dict(candidate), separators = (",", ":")))
+
+    def insert(self, run: int = 0, items = None) -> int:
+        #process; the candidates are written by batches, so they are NOT held in memory as a whole
+        seq: dict = dict()
+        batch: list = list()
+        cnt: int = 0
+        for tc, candidate in itertools.chain(items, [(None, None)]):
+            if candidate is not None:
+                if tc not in seq:
+                    seq[tc] = len(seq)
+                batch.append(MaterialStore.getRow(run, tc, seq[tc], candidate))
+            if len(batch) >= MaterialStore.BATCH or (candidate is None and len(batch) > 0):
+                with self.conn:
+                    self.conn.executemany("INSERT INTO candidates (run, tc, tc_seq, path, ts, result, dut, ap, sta, complete, sort_key, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                cnt += len(batch)
+                batch.clear()
+        with self.conn:
+            self.conn.execute("UPDATE runs SET quantity = ? WHERE id = ?", (cnt, run))
+        logging.info("the run %d of material store is stored with %d candidates" % (run, cnt))
+        return cnt
+
+    def getRuns(self) -> list:
+        return self.conn.execute("SELECT id, started, source, directory, event, quantity FROM runs ORDER BY id").fetchall()
+
+    def resolve(self, selector: str = "latest") -> list:
+        if selector == "all":
+            return None
+        if selector == "latest":
+            row: tuple = self.conn.execute("SELECT MAX(id) FROM runs").fetchone()
+            return [row[0]] if row[0] is not None else list()
+        return [int(run) for run in selector.split(",")]
+
+    def iterate(self, runs: list = None, category: str = "all", sorted_output: bool = False):
+        #process; the result is filtered per run (i.e. the expected result of offline runs); the selection and sorting are indexed queries
+        params: list = list()
+        filtered: str = "SELECT c.* FROM candidates c JOIN runs r ON r.id = c.run WHERE (r.rst_expected IS NULL OR c.result = r.rst_expected COLLATE NOCASE)"
+        if runs is not None:
+            filtered += " AND c.run IN (%s)" % (",".join(["?"] * len(runs)))
+            params += runs
+        ranked: str = filtered
+        if (category == "first") or (category == "last"):
+            #process; one candidate per tc, DUT and testbed permutation; ties are resolved in favor of the former one; incomplete ones remain
+            ranked = ("SELECT *, CASE WHEN complete = 1 THEN ROW_NUMBER() OVER (PARTITION BY tc, complete, dut, ap, sta ORDER BY ts %s, id) ELSE 1 END AS rn FROM (%s)" %
+                ("DESC" if category == "last" else "ASC", filtered))
+            ranked = "SELECT * FROM (%s) WHERE rn = 1" % (ranked)
+        ordering: str = "tc, sort_key DESC, id" if sorted_output is True else "run, tc_seq, id"
+        cursor = self.conn.execute("SELECT tc, data FROM (%s) ORDER BY %s" % (ranked, ordering), params)
+        for tc, data in cursor:
+            yield (tc, Candidate(**json.loads(data)))
+
 class MaterialSerializer():
     @staticmethod
     def serialize(**kwargs) -> str:
@@ -484,77 +2399,143 @@ class MaterialSerializer():
             logging.error("the value of {} is {}".format(k, v))
         return ""
 
+class ReportWriter():
+    FORMATS: list = ["text", "csv", "jsonl", "json"]
+
+    def __init__(self, **kwargs):
+        self.output = kwargs["output"]
+        self.output_format: str = kwargs["output_format"] if "output_format" in kwargs else "text"
+        self.delimiter: str = kwargs["delimiter"]
+        self.naming: dict = kwargs["naming"]
+        self.permutation: dict = kwargs["permutation"]
+        self.show_device_from_log: bool = kwargs["show_device_from_log"]
+        self.rst_expected: str = kwargs["rst_expected"]
+        self.profiles: dict = dict()
+        self.cnt: int = 0
+        self.csv_writer = None
+        if self.output_format == "csv":
+            self.csv_writer = csv.writer(self.output, lineterminator = "\n")
+            self.csv_writer.writerow(ReportFormatter.getHeader(self.show_device_from_log))
+        elif self.output_format == "json":
+            self.output.write("[")
+
+    def write(self, tc: str = "", candidate: dict = None):
+        profile: dict = self.profiles.get(tc)
+        if profile is None:
+            profile = ReportFormatter.getProfile(tc, self.permutation)
+            self.profiles[tc] = profile
+        if self.output_format == "text":
+            self.output.write((self.delimiter if self.cnt > 0 else "") + ReportFormatter.DELI_OUTER.join(ReportFormatter.getColumns(tc, candidate, profile, self.naming, self.rst_expected, self.show_device_from_log)))
+        elif self.output_format == "csv":
+            self.csv_writer.writerow(ReportFormatter.getColumns(tc, candidate, profile, self.naming, self.rst_expected, self.show_device_from_log))
+        elif self.output_format == "jsonl":
+            self.output.write(json.dumps(ReportFormatter.getRecord(tc, candidate, profile, self.naming, self.rst_expected, self.show_device_from_log)) + "\n")
+        else:
+            self.output.write(("," if self.cnt > 0 else "") + "\n" + json.dumps(ReportFormatter.getRecord(tc, candidate, profile, self.naming, self.rst_expected, self.show_device_from_log)))
+        self.cnt += 1
+
+    def close(self):
+        if self.output_format == "text":
+            self.output.write("\n")
+        elif self.output_format == "json":
+            self.output.write(("\n" if self.cnt > 0 else "") + "]\n")
+        self.output.flush()
+
 class ReportFormatter(MaterialSerializer):
+    DELI_OUTER: str = "; "
+    DELI_INNER: str = ","
+    DELI_ENCLOSED_LHS: str = "["
+    DELI_ENCLOSED_RHS: str = "]"
+    DELI_MISMATCHED: str = "*"
+    DELI_PERMUTED: str = "M"
+    DELI_UNPERMUTED: str = ""
+
+    @staticmethod
+    def getHeader(show_device_from_log: bool = False) -> list:
+        if show_device_from_log is True:
+            return ["result", "tc", "elapsed", "dut", "ap", "sta", "permuted"]
+        return ["result", "tc", "elapsed", "tms_dut", "tms_tb"]
+
+    @staticmethod
+    def getProfile(tc: str = "", permutation: dict = None) -> dict:
+        #process; the permutation of a tc is looked up once; the testbeds are translated/compared/rendered once per tc
+        permuted: bool = True if tc in permutation else False
+        return {"permuted": permuted,
+            "ap": permutation[tc]["ap"] if permuted is True else None,
+            "sta": permutation[tc]["sta"] if permuted is True else None,
+            "memo": dict()}
+
+    @staticmethod
+    def getTestbeds(profile: dict = None, naming: dict = None, role: str = "ap", names: list = None) -> tuple:
+        key: tuple = (role, tuple(names))
+        memorized: tuple = profile["memo"].get(key)
+        if memorized is None:
+            named: dict = naming[role] if role in naming else dict()
+            translated: list = [named.get(c, c) for c in names]
+            expected: list = profile[role]
+            matched: list = [True] * len(translated)
+            if profile["permuted"] is True:
+                equal_len: bool = len(translated) == len(expected)
+                matched = [equal_len is True and t == e for t, e in zip(translated, expected)] + [False] * max(0, len(translated) - len(expected))
+            rendered: str = ReportFormatter.DELI_ENCLOSED_LHS + ReportFormatter.DELI_INNER.join([t if m is True else t + ReportFormatter.DELI_MISMATCHED for t, m in zip(translated, matched)]) + ReportFormatter.DELI_ENCLOSED_RHS
+            memorized = (translated, matched, rendered)
+            profile["memo"][key] = memorized
+        return memorized
+
+    @staticmethod
+    def getColumns(tc: str = "", candidate: dict = None, profile: dict = None, naming: dict = None, rst_expected: str = "", show_device_from_log: bool = False) -> list:
+        columns: list = [candidate["result"] if "result" in candidate else rst_expected, tc, "%s" % (candidate["elapsed"] if "elapsed" in candidate else "")]
+        if show_device_from_log is True:
+            columns.append("%s" % (candidate["dut"] if "dut" in candidate else ""))
+            columns.append(ReportFormatter.getTestbeds(profile, naming, "ap", candidate["ap"] if "ap" in candidate else list())[2])
+            columns.append(ReportFormatter.getTestbeds(profile, naming, "sta", candidate["sta"] if "sta" in candidate else list())[2])
+            columns.append(ReportFormatter.DELI_PERMUTED if profile["permuted"] is True else ReportFormatter.DELI_UNPERMUTED)
+        else:
+            columns.append("%s" % (candidate["tms_dut"] if "tms_dut" in candidate else ""))
+            columns.append("%s" % (candidate["tms_tb"] if "tms_tb" in candidate else ""))
+        return columns
+
+    @staticmethod
+    def getRecord(tc: str = "", candidate: dict = None, profile: dict = None, naming: dict = None, rst_expected: str = "", show_device_from_log: bool = False) -> dict:
+        columns: list = ReportFormatter.getColumns(tc, candidate, profile, naming, rst_expected, show_device_from_log)
+        record: dict = dict(zip(ReportFormatter.getHeader(show_device_from_log), columns))
+        if show_device_from_log is True:
+            #process; the testbeds are structured (instead of rendered) in a record
+            for role in ("ap", "sta"):
+                translated, matched, rendered = ReportFormatter.getTestbeds(profile, naming, role, candidate[role] if role in candidate else list())
+                record[role] = translated
+                record[role + "_matched"] = matched
+            record["permuted"] = profile["permuted"]
+        return record
+
+    @staticmethod
+    def stream(**kwargs) -> int:
+        items = kwargs.pop("items")
+        flushed: bool = kwargs.pop("flushed") if "flushed" in kwargs else True
+        writer: ReportWriter = ReportWriter(**kwargs)
+        for tc, candidate in items:
+            if candidate is None:
+                continue
+            writer.write(tc, candidate)
+            if flushed is True:
+                writer.output.flush()
+        writer.close()
+        return writer.cnt
+
+    @staticmethod
+    def write(**kwargs) -> int:
+        material: dict = kwargs.pop("material")
+        return ReportFormatter.stream(items = ((tc, candidate) for tc in material for candidate in material[tc]), flushed = False, **kwargs)
+
     @staticmethod
     def serialize(**kwargs) -> str:
-        show_timestamp: bool = False
-        finished: str = ""
-        material = kwargs["material"]
-        naming = kwargs["naming"]
-        permutation = kwargs["permutation"]
-        show_device_from_log: bool = kwargs["show_device_from_log"]
-        rst_expected: str = kwargs["rst_expected"]
-        delimiter: str = kwargs["delimiter"]
-        DELI_OUTER: str = "; "
-        DELI_INNER: str = ","
-        DELI_ENCLOSED_LHS: str = "["
-        DELI_ENCLOSED_RHS: str = "]"
-        DELI_MISMATCHED: str = "*"
-        DELI_PERMUTED: str = "M"
-        DELI_UNPERMUTED: str = ""
+        material: dict = kwargs["material"]
+        finished: list = list()
         for tc in material:
-            permuted: bool = True if tc in permutation else False
-            for idx, candidate in enumerate(material[tc]):
-                rst: str = (candidate["result"] if "result" in candidate else rst_expected) + DELI_OUTER
-                rst += tc + DELI_OUTER
-                if show_timestamp:
-                    rst += ("%d" % (candidate["timestamp"])) + DELI_OUTER
-                rst += ("%s" % (candidate["elapsed"] if "elapsed" in candidate else "")) + DELI_OUTER
-                if show_device_from_log:
-                    rst += ("%s" % (candidate["dut"] if "dut" in candidate else "")) + DELI_OUTER
-                    ap: str = ""
-                    ap += DELI_ENCLOSED_LHS
-                    if "ap" in candidate:
-                        for i,c in enumerate(candidate["ap"]):
-                            if i > 0:
-                                ap += DELI_INNER
-                            a: str = c
-                            if ("ap" in naming and c in naming["ap"]):
-                                a = naming["ap"][c]
-                            if permuted is True:
-                                if (len(candidate["ap"]) == len(permutation[tc]["ap"])) and (i < len(permutation[tc]["ap"])) and (a == permutation[tc]["ap"][i]):
-                                    ap += a
-                                else:
-                                    ap += a + DELI_MISMATCHED
-                            else:
-                                ap += a
-                    ap += DELI_ENCLOSED_RHS
-                    rst += ap + DELI_OUTER
-                    sta: str = ""
-                    sta += DELI_ENCLOSED_LHS
-                    if "sta" in candidate:
-                        for i,c in enumerate(candidate["sta"]):
-                            if i > 0:
-                                sta += DELI_INNER
-                            s: str = c
-                            if ("sta" in naming and c in naming["sta"]):
-                                s = naming["sta"][c]
-                            if permuted is True:
-                                if (len(candidate["sta"]) == len(permutation[tc]["sta"])) and (i < len(permutation[tc]["sta"])) and (s == permutation[tc]["sta"][i]):
-                                    sta += s
-                                else:
-                                    sta += s + DELI_MISMATCHED
-                            else:
-                                sta += s
-                    sta += DELI_ENCLOSED_RHS
-                    rst += sta + DELI_OUTER
-                    rst += DELI_PERMUTED if permuted is True else DELI_UNPERMUTED
-                else:
-                    rst += ("%s" % (candidate["tms_dut"] if "tms_dut" in candidate else ""))
-                    rst += DELI_OUTER
-                    rst += ("%s" % (candidate["tms_tb"] if "tms_tb" in candidate else ""))
-                finished += (delimiter if len(finished) > 0 else "") + rst
-        return finished
+            profile: dict = ReportFormatter.getProfile(tc, kwargs["permutation"])
+            for candidate in material[tc]:
+                finished.append(ReportFormatter.DELI_OUTER.join(ReportFormatter.getColumns(tc, candidate, profile, kwargs["naming"], kwargs["rst_expected"], kwargs["show_device_from_log"])))
+        return kwargs["delimiter"].join(finished)
 
 if __name__ == "__main__":
     my_parser = argparse.ArgumentParser(description="CLI argument parsing")
@@ -567,7 +2548,7 @@ if __name__ == "__main__":
         metavar="event",
         default="",
         type=str,
-        help="Event number; mandatory input for TMS")
+        help="Event number (or comma-separated event numbers); mandatory input for TMS")
     my_parser.add_argument("-a",
         "--account",
         metavar="account",
@@ -664,6 +2645,166 @@ if __name__ == "__main__":
         "--show-device-from-log",
         action="store_true",
         help="show device information from the parsed UCC log")
+    my_parser.add_argument(
+        "--jobs",
+        metavar="jobs",
+        default=1,
+        type=int,
+        help="quantity of concurrent downloads; an option for TMS")
+    my_parser.add_argument(
+        "--http-fetching",
+        action="store_true",
+        help="fetch log from web site instead of SFTP; an option for TMS")
+    my_parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="extract UCC log next to the zipfile before parsing")
+    my_parser.add_argument(
+        "--parse-jobs",
+        metavar="parse_jobs",
+        default=1,
+        type=int,
+        help="quantity of worker processes for parsing UCC log")
+    my_parser.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="discard the verdict cache, the sync state of the directory, and the compiled profile files, then start over")
+    my_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="incremental sync; reuse the cached event information and the sync state of the directory; an option for TMS")
+    my_parser.add_argument(
+        "--stream-results",
+        action="store_true",
+        help="decode the test results incrementally and download while decoding; an option for TMS")
+    my_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="streaming pipeline; output the report rows per tc as soon as the tc is complete (i.e. its last test result is handled; for TMS without --stream-results and --latest), or at the end")
+    my_parser.add_argument(
+        "--scan-mode",
+        metavar="scan_mode",
+        default="line",
+        choices=["line", "mmap"],
+        type=str,
+        help="scanning mode of UCC log; line by line, or the whole (memory-mapped) buffer")
+    my_parser.add_argument(
+        "--portal",
+        metavar="portal",
+        default="https://tms.wi-fi.org/",
+        type=str,
+        help="URL of TMS portal; an option for TMS")
+    my_parser.add_argument(
+        "--sftp-port",
+        metavar="sftp_port",
+        default=22,
+        type=int,
+        help="port of SFTP server; an option for TMS")
+    my_parser.add_argument(
+        "--retry",
+        metavar="retry",
+        default=3,
+        type=int,
+        help="quantity of retries of a failed download (with jittered exponential backoff); the concurrency per host (up to --jobs) is adapted by the latency and the errors; an option for TMS")
+    my_parser.add_argument(
+        "--backoff",
+        metavar="backoff",
+        default=1.0,
+        type=float,
+        help="base delay (in seconds) of the backoff between retries; an option for TMS")
+    my_parser.add_argument(
+        "--circuit-cooldown",
+        metavar="circuit_cooldown",
+        default=30.0,
+        type=float,
+        help="duration (in seconds) that the downloads from a failing host are held back for (i.e. queued without occupying a worker), while the other hosts continue; doubled if the host keeps failing; an option for TMS")
+    my_parser.add_argument(
+        "--scan-jobs",
+        metavar="scan_jobs",
+        default=1,
+        type=int,
+        help="quantity of threads for scanning the directory; an option for offline")
+    my_parser.add_argument(
+        "--event-file",
+        metavar="event_file",
+        default=None,
+        type=str,
+        help="path of the file listing event numbers (one per line); crawled in one session along with --event; an option for TMS")
+    my_parser.add_argument(
+        "--per-event-report",
+        action="store_true",
+        help="one report per event (suffixed with the event number if --output is specified) instead of a combined report; an option for TMS")
+    my_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and poll for new results; the report (--output) is updated in place, or the rows of new results are output; an option for TMS")
+    my_parser.add_argument(
+        "--interval",
+        metavar="interval",
+        default=300.0,
+        type=float,
+        help="polling interval (in seconds) of --watch; doubled while there is no new result")
+    my_parser.add_argument(
+        "--max-interval",
+        metavar="max_interval",
+        default=3600.0,
+        type=float,
+        help="maximum polling interval (in seconds) of --watch")
+    my_parser.add_argument(
+        "--watch-rounds",
+        metavar="watch_rounds",
+        default=0,
+        type=int,
+        help="quantity of polling rounds of --watch; 0 for unlimited")
+    my_parser.add_argument(
+        "--cache-max-bytes",
+        metavar="cache_max_bytes",
+        default=0,
+        type=int,
+        help="byte budget of the downloaded zipfiles and the extracted UCC logs in the directory; the least recently used ones are evicted (the latest one per test case is pinned) while their verdicts are kept for the report; with --store, a blob linked by no other directory is removed along; 0 for unlimited; an option for TMS")
+    my_parser.add_argument(
+        "--store",
+        metavar="store",
+        default=None,
+        type=str,
+        help="directory of the content-addressed log store shared by events and directories; the logs are hardlinked from the store, and the parsed results are shared by content")
+    my_parser.add_argument(
+        "--db",
+        metavar="db",
+        default=None,
+        type=str,
+        help="path of the SQLite material store; the candidates of a run are stored as rows, then filtered, selected (--category) and sorted (--sorted-output) by indexed queries")
+    my_parser.add_argument(
+        "--db-run",
+        metavar="db_run",
+        default=None,
+        type=str,
+        help="report the stored run(s) of --db instead of crawling; comma-separated run identifiers, \"latest\", \"all\" (i.e. the history of every run), or \"list\" to list the runs")
+    my_parser.add_argument(
+        "--output",
+        metavar="output",
+        default=None,
+        type=str,
+        help="path of the report; standard output if not specified")
+    my_parser.add_argument(
+        "--output-format",
+        metavar="output_format",
+        default="text",
+        choices=ReportWriter.FORMATS,
+        type=str,
+        help="format of the report")
+    my_parser.add_argument(
+        "--metrics",
+        metavar="metrics",
+        default=None,
+        type=str,
+        help="path of the JSON summary of metrics (i.e. wall time, bytes, latency histograms, and the slowest zipfiles of each stage)")
+    my_parser.add_argument(
+        "--profile",
+        metavar="profile",
+        default=None,
+        type=str,
+        help="path of the cProfile stats dump of the whole run")
 
     args = my_parser.parse_args()
     if args.verbose == True :
@@ -672,63 +2813,225 @@ if __name__ == "__main__":
         logging.basicConfig(level=logging.ERROR)
     logging.debug("args: " + repr(args))
 
-    naming = MaterialProvider.getNaming(args.naming)
-    permutation = MaterialProvider.getPermutation(args.permute)
-
-    material: dict = dict()
-    if args.offline is False:
-        material = TmsCrawler.getMaterial(event = args.event,
-            directory = args.directory,
-            rst_expected = args.result,
-            account = args.account,
-            password = args.password,
-            sftp_usr = args.sftp_usr,
-            sftp_pwd = args.sftp_pwd,
-            sftp_interm_dir = args.sftp_interm_dir,
-            since = args.since,
-            prefix = args.prefix,
-            latest = args.latest,
-            permutation = permutation,
-            dut = args.dut)
-    else:
-        material = LfsCrawler.getMaterial(directory = args.directory,
-            prefix = args.prefix,
-            permutation = permutation)
+    profiler: cProfile.Profile = None
+    if args.profile is not None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    metrics: PipelineMetrics = PipelineMetrics()
 
-    #process; retrieve DUT and primary testbed from directory structure
-    prepended: dict = TmsDirParser.decorate(material = material)
+    def conclude():
+        if args.metrics is not None:
+            metrics.add("verdict_cache_hit", verdict_cache.cnt_hit)
+            metrics.add("verdict_cache_miss", verdict_cache.cnt_miss)
+            metrics.add("verdict_cache_evicted_hit", verdict_cache.cnt_evicted_hit)
+            metrics.add("cache_evicted", cache_manager.cnt_evicted)
+            metrics.add("cache_evicted_bytes", cache_manager.bytes_evicted)
+            metrics.save(args.metrics)
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            logging.info("the profile is dumped as %s" % (args.profile))
 
-    #process; retrieve testbed names from the UCC log
-    parsed: dict = UccLogParser.decorate(material = prepended,
-        use_timestamp_from_log = args.offline)
+    log_store: LogStore = LogStore(args.store, rebuild = args.rebuild_cache) if args.store is not None else None
+    verdict_cache: VerdictCache = VerdictCache(args.directory + os.path.sep + "verdict.json", rebuild = args.rebuild_cache, store = log_store)
+    cache_manager: CacheManager = CacheManager(verdict_cache, max_bytes = args.cache_max_bytes if args.offline is False else 0)
+    #process; the metrics and the profile are concluded even if the run is interrupted (e.g. an exception or Ctrl-C)
+    try:
+        naming = MaterialProvider.getNaming(args.naming, rebuild = args.rebuild_cache)
+        permutation = MaterialProvider.getPermutation(args.permute, rebuild = args.rebuild_cache)
+        events: list = [event.strip() for event in args.event.split(",") if len(event.strip()) > 0]
+        if args.event_file is not None:
+            with codecs.open(args.event_file, "r", encoding = "utf-8", errors = "ignore") as f:
+                events += [line.strip() for line in f if len(line.strip()) > 0 and line.strip().startswith("#") is False]
+        events = list(OrderedDict.fromkeys(events))
 
-    filtrated: dict = dict()
-    if args.offline is False:
-        filtrated = parsed
-    else:
-        filtrated = UccLogResultFiltrator.decorate(material = parsed,
-            rst_expected = args.result)
+        provider: MaterialProvider = None
+        provided: dict = dict()
+        if args.offline is False:
+            provider = TmsCrawler if len(events) <= 1 else TmsBatchCrawler
+            provided = dict(event = events[0] if len(events) > 0 else "",
+                events = events,
+                directory = args.directory,
+                rst_expected = args.result,
+                account = args.account,
+                password = args.password,
+                sftp_usr = args.sftp_usr,
+                sftp_pwd = args.sftp_pwd,
+                sftp_interm_dir = args.sftp_interm_dir,
+                since = args.since,
+                prefix = args.prefix,
+                latest = args.latest,
+                permutation = permutation,
+                dut = args.dut,
+                jobs = args.jobs,
+                ftp_fetching = not args.http_fetching,
+                incremental = args.incremental,
+                rebuild = args.rebuild_cache,
+                streaming = args.stream_results,
+                portal = args.portal,
+                sftp_port = args.sftp_port,
+                retry = args.retry,
+                backoff = args.backoff,
+                circuit_cooldown = args.circuit_cooldown,
+                log_store = log_store,
+                verdict_cache = verdict_cache,
+                metrics = metrics)
+        else:
+            provider = LfsCrawler
+            provided = dict(directory = args.directory,
+                prefix = args.prefix,
+                permutation = permutation,
+                scan_jobs = args.scan_jobs)
 
-    decorated: dict = UccLogTimestampFiltrator.decorate(material = filtrated,
-        use_timestamp_from_log = args.offline,
-        category = args.category)
+        def report(provider: MaterialProvider = None, provided: dict = None, output = None):
+            if material_store is not None:
+                #process; candidates are parsed on the fly and stored as rows; the filtrators, the selection and the sorting are indexed queries
+                run: int = material_store.begin(source = "offline" if args.offline is True else "tms",
+                    directory = args.directory,
+                    event = provided["event"] if "event" in provided else "",
+                    rst_expected = args.result if args.offline is True else None)
+                items = MaterialPipeline.iterate(items = metrics.iterate("getMaterial", provider.iterMaterial(**provided)),
+                    use_timestamp_from_log = args.offline,
+                    extract = args.extract,
+                    parse_jobs = args.parse_jobs,
+                    scan_mode = args.scan_mode,
+                    verdict_cache = verdict_cache,
+                    rst_expected = None,
+                    category = "all",
+                    sorted_output = False,
+                    metrics = metrics)
+                metrics.measure("MaterialStore", material_store.insert, run = run, items = items)
+                metrics.measure("ReportFormatter", ReportFormatter.stream, items = material_store.iterate(runs = [run], category = args.category, sorted_output = args.sorted_output),
+                    output = output,
+                    output_format = args.output_format,
+                    naming = naming,
+                    permutation = permutation,
+                    show_device_from_log = args.show_device_from_log,
+                    rst_expected = args.result,
+                    delimiter = os.linesep)
+                return
 
-    sorted_decorated: dict = None
-    if args.sorted_output == False:
-        sorted_decorated = decorated
-    else:
-        sorted_decorated = OrderedDict(sorted(decorated.items()))
-        for k in sorted_decorated:
-            sorted_decorated_further = sorted(sorted_decorated[k], key=lambda x: x["elapsed"] if "elapsed" in x else x["timestamp"], reverse=True)
-            sorted_decorated[k] = sorted_decorated_further
-
-    #finalize; output report
-    rst: str = ReportFormatter.serialize(material = sorted_decorated,
-        naming = naming,
-        permutation = permutation,
-        show_device_from_log = args.show_device_from_log,
-        rst_expected = args.result,
-        delimiter = os.linesep)
-    print(rst)
+            if args.stream is True:
+                #process; candidates flow from the provider to the report one by one; the rows are output per tc once the tc is complete
+                items = MaterialPipeline.iterate(items = metrics.iterate("getMaterial", provider.iterMaterial(**dict(provided, grouped = True))),
+                    use_timestamp_from_log = args.offline,
+                    extract = args.extract,
+                    parse_jobs = args.parse_jobs,
+                    scan_mode = args.scan_mode,
+                    verdict_cache = verdict_cache,
+                    rst_expected = args.result if args.offline is True else None,
+                    category = args.category,
+                    sorted_output = args.sorted_output,
+                    grouped = True,
+                    metrics = metrics)
+                metrics.measure("ReportFormatter", ReportFormatter.stream, items = items,
+                    output = output,
+                    output_format = args.output_format,
+                    naming = naming,
+                    permutation = permutation,
+                    show_device_from_log = args.show_device_from_log,
+                    rst_expected = args.result,
+                    delimiter = os.linesep)
+                return
+
+            material: dict = metrics.measure("getMaterial", provider.getMaterial, **provided)
+
+            #process; retrieve DUT and primary testbed from directory structure
+            prepended: dict = metrics.measure("TmsDirParser", TmsDirParser.decorate, material = material)
+
+            #process; retrieve testbed names from the UCC log (or from the verdict cache)
+            parsed: dict = metrics.measure("UccLogParser", UccLogParser.decorate, material = prepended,
+                use_timestamp_from_log = args.offline,
+                extract = args.extract,
+                parse_jobs = args.parse_jobs,
+                scan_mode = args.scan_mode,
+                verdict_cache = verdict_cache,
+                metrics = metrics)
+
+            filtrated: dict = dict()
+            if args.offline is False:
+                filtrated = parsed
+            else:
+                filtrated = metrics.measure("UccLogResultFiltrator", UccLogResultFiltrator.decorate, material = parsed,
+                    rst_expected = args.result)
+
+            decorated: dict = metrics.measure("UccLogTimestampFiltrator", UccLogTimestampFiltrator.decorate, material = filtrated,
+                use_timestamp_from_log = args.offline,
+                category = args.category)
+
+            sorted_decorated: dict = None
+            if args.sorted_output == False:
+                sorted_decorated = decorated
+            else:
+                sorted_decorated = metrics.measure("MaterialSorter", MaterialSorter.decorate, material = decorated)
+
+            #finalize; output report row by row
+            metrics.measure("ReportFormatter", ReportFormatter.write, material = sorted_decorated,
+                output = output,
+                output_format = args.output_format,
+                naming = naming,
+                permutation = permutation,
+                show_device_from_log = args.show_device_from_log,
+                rst_expected = args.result,
+                delimiter = os.linesep)
+
+        def getOutput(event: str = None):
+            if args.output is None:
+                return sys.stdout
+            fn: str = args.output
+            if event is not None:
+                fn_root, fn_ext = os.path.splitext(args.output)
+                fn = fn_root + "-" + event + fn_ext
+            return open(fn, "w", encoding = "utf-8", newline = "")
+
+        material_store: MaterialStore = MaterialStore(args.db) if args.db is not None else None
+        if material_store is not None and args.db_run == "list":
+            for row in material_store.getRuns():
+                print(ReportFormatter.DELI_OUTER.join(["%s" % (column) for column in row]))
+        elif material_store is not None and args.db_run is not None:
+            #process; the history is reported from the store without crawling
+            output = getOutput()
+            metrics.measure("ReportFormatter", ReportFormatter.stream, items = material_store.iterate(runs = material_store.resolve(args.db_run), category = args.category, sorted_output = args.sorted_output),
+                output = output,
+                output_format = args.output_format,
+                naming = naming,
+                permutation = permutation,
+                show_device_from_log = args.show_device_from_log,
+                rst_expected = args.result,
+                delimiter = os.linesep)
+            if output is not sys.stdout:
+                output.close()
+        elif args.watch is True and args.offline is False:
+            #process; a long-running crawl; new results are processed round by round
+            TmsWatcher(provided = provided,
+                interval = args.interval,
+                max_interval = args.max_interval,
+                rounds = args.watch_rounds,
+                output = args.output,
+                parsing = dict(extract = args.extract, parse_jobs = args.parse_jobs, scan_mode = args.scan_mode, verdict_cache = verdict_cache, metrics = metrics),
+                reporting = dict(output_format = args.output_format, naming = naming, permutation = permutation, show_device_from_log = args.show_device_from_log, rst_expected = args.result, delimiter = os.linesep),
+                category = args.category,
+                sorted_output = args.sorted_output,
+                cache_manager = cache_manager).watch()
+        elif provider is TmsBatchCrawler and args.per_event_report is True:
+            #process; one report per event; the session is still shared by the events
+            with TmsSession.create(**provided) as tms_session:
+                for event in events:
+                    output = getOutput(event)
+                    report(provider = TmsCrawler, provided = dict(provided, event = event, tag = event, tms_session = tms_session), output = output)
+                    if output is not sys.stdout:
+                        output.close()
+        else:
+            output = getOutput()
+            report(provider = provider, provided = provided, output = output)
+            if output is not sys.stdout:
+                output.close()
+        if os.path.isdir(args.directory) is True:
+            cache_manager.enforce()
+            verdict_cache.save()
+        if material_store is not None:
+            material_store.close()
+    finally:
+        conclude()
 
 #Crawler6 - by Leo Liu
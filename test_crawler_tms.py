@@ -0,0 +1,757 @@
+#!/usr/bin/python3
+import os
+import io
+import sys
+import csv
+import json
+import time
+import copy
+import logging
+import shutil
+import tempfile
+import threading
+import subprocess
+import importlib.util
+import unittest
+import zipfile
+from unittest import mock
+from concurrent.futures import wait
+from crawler_tms import SftpConnectionPool
+from crawler_tms import TmsDownloader
+from crawler_tms import TmsCrawler
+from crawler_tms import TmsWatcher
+from crawler_tms import TmsSyncState
+from crawler_tms import HostScheduler
+from crawler_tms import MaterialProvider
+from crawler_tms import LfsCrawler
+from crawler_tms import LogStore
+from crawler_tms import CacheManager
+from crawler_tms import UccLogScanner
+from crawler_tms import VerdictCache
+from crawler_tms import UccLogParser
+from crawler_tms import UccLogTimestampFiltrator
+from crawler_tms import MaterialGrouper
+from crawler_tms import ReportFormatter
+from crawler_tms import Candidate
+from benchmark_tms import SyntheticMaterial
+from benchmark_tms import TmsStandIn
+from benchmark_tms import SftpStandIn
+
+def getUccLog(idx: int = 0, ap: list = None, sta: list = None, parallel: bool = False, result: str = "PASS", lines: int = 20) -> str:
+    prefix: str = "INFO - parallel-1 " if parallel is True else "INFO - "
+    begin: str = "2023-01-%02d 10:%02d:00" % (1 + idx % 28, idx % 60)
+    out: list = list()
+    out.append("%s,000 INFO - WiFiTestSuite Version [9.%d.0]" % (begin, idx % 3))
+    out.append("Test Start Time   : %s" % (begin))
+    out.append("%s,000 %sDUT (192.168.250.1:9000)    <--  status,COMPLETE,vendor,Vendor%d,model,Model,version,1.0" % (begin, prefix, idx))
+    for name in ap:
+        out.append("%s,000 %s%s (192.168.250.2:9000)    --->  ap_set_security,NAME,%s,KEYMGNT,SAE" % (begin, prefix, name, name))
+    for name in sta:
+        out.append("%s,000 %s%s%s (192.168.250.3:9000)    --->  sta_set_security,interface,wlan0,type,SAE" % (begin, prefix, " " if parallel is True else "", name))
+    #process; the security of DUT is NOT a testbed
+    out.append("%s,000 %sDUT (192.168.250.1:9000)    --->  sta_set_security,interface,wlan0,type,SAE" % (begin, prefix))
+    for i in range(lines):
+        out.append("%s,%03d %sDUT (192.168.250.1:9000)    <--  status,COMPLETE,token,%08x" % (begin, i, prefix, i * 7919))
+    out.append("Execution Time [00:%02d:%02d]" % (idx % 60, (idx * 13) % 60))
+    out.append("FINAL TEST RESULT  --->  %s" % (result))
+    #process; the one time fields take the first occurrence
+    out.append("FINAL TEST RESULT  --->  ABORTED")
+    return "\r\n".join(out) + "\r\n"
+
+def getVerdict(idx: int = 0, ap: list = None, sta: list = None, result: str = "PASS") -> dict:
+    return {"core_ver": "9.%d.0" % (idx % 3), "begin": "2023-01-%02d 10:%02d:00" % (1 + idx % 28, idx % 60), "elapsed": "00:%02d:%02d" % (idx % 60, (idx * 13) % 60),
+        "result": result, "dut": "Vendor%d" % (idx), "ap": list(ap), "sta": list(sta)}
+
+def makeZip(path: str = "", idx: int = 0, ap: list = None, sta: list = None, parallel: bool = False, result: str = "PASS", logged: bool = True):
+    os.makedirs(os.path.dirname(path), exist_ok = True)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        if logged is True:
+            archive.writestr(os.path.basename(os.path.dirname(path)) + "_" + str(idx) + ".log", getUccLog(idx, ap, sta, parallel, result))
+        archive.writestr("sniffer-1.2.log", "sniffer\r\n")
+
+class UccLogCase(unittest.TestCase):
+    RUNS: list = [(["Atlas", "Borealis"], ["Lyra"], False, "PASS"),
+        (["Atlas"], [], True, "PASS"),
+        (["Cygnus", "Draco"], ["Mensa", "Norma"], True, "FAIL"),
+        (["Draco"], ["Orion"], False, "PASS")]
+
+    def setUp(self):
+        self.directory: str = tempfile.mkdtemp()
+        self.paths: list = list()
+        self.verdicts: list = list()
+        for idx, (ap, sta, parallel, result) in enumerate(self.RUNS):
+            path: str = self.getPath(idx)
+            makeZip(path, idx, ap, sta, parallel, result)
+            self.paths.append(path)
+            self.verdicts.append(getVerdict(idx, ap, sta, result))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def getPath(self, idx: int = 0) -> str:
+        return self.directory + os.path.sep + "DUT0" + os.path.sep + "TB%d" % (idx % 2) + os.path.sep + "HE-4.2.%d" % (idx % 2) + os.path.sep + "log_%d.zip" % (idx)
+
+    def getMaterial(self) -> dict:
+        material: dict = dict()
+        for path in self.paths:
+            material.setdefault(os.path.basename(os.path.dirname(path)), list()).append(Candidate(timestamp = -1, path = path))
+        return material
+
+    def getExtracted(self) -> list:
+        return [name for root, dirs, files in os.walk(self.directory) for name in files if name.endswith(".zip") is False]
+
+class DownloaderTest(unittest.TestCase):
+    def setUp(self):
+        self.directory: str = tempfile.mkdtemp()
+        self.lock = threading.Lock()
+        self.in_use: set = set()
+        self.conflicts: int = 0
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def fetch(self, **kwargs) -> bool:
+        with self.lock:
+            self.conflicts += 1 if id(kwargs["pool"]) in self.in_use else 0
+            self.in_use.add(id(kwargs["pool"]))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with open(kwargs["lcl_path"], "w") as f:
+            f.write(kwargs["rmt_path"])
+        with self.lock:
+            self.in_use.discard(id(kwargs["pool"]))
+            self.in_flight -= 1
+        return True
+
+    def test_bounded(self):
+        #process; the downloads run concurrently within --jobs; a worker never shares its SFTP connections with another one
+        jobs: list = [{"host": "127.0.0.1", "username": "test", "password": "test", "rmt_path": "log_%d.zip" % (idx), "lcl_path": self.directory + os.path.sep + "log_%d.zip" % (idx),
+            "url": "", "headers": dict(), "uri": "ftp://127.0.0.1/log_%d.zip" % (idx)} for idx in range(24)]
+        with mock.patch.object(TmsCrawler, "fetchBySftp", self.fetch):
+            with TmsDownloader(jobs = 4, ftp_fetching = True, pool = SftpConnectionPool()) as downloader:
+                futures: list = [downloader.submit(job) for job in jobs]
+                self.assertEqual([future.result() for future in futures], [True] * len(jobs))
+        self.assertEqual(self.conflicts, 0)
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, 4)
+        for job in jobs:
+            with open(job["lcl_path"], "r") as f:
+                self.assertEqual(f.read(), job["rmt_path"])
+
+class ParserTest(UccLogCase):
+    def test_zip_streamed(self):
+        #process; the UCC log is decoded from the zipfile directly; nothing is extracted unless it is requested
+        for extract in [False, True]:
+            material: dict = UccLogParser.decorate(material = self.getMaterial(), use_timestamp_from_log = False, extract = extract)
+            parsed: dict = {candidate["path"]: candidate for candidates in material.values() for candidate in candidates}
+            for path, verdict in zip(self.paths, self.verdicts):
+                self.assertEqual([parsed[path][key] for key in ["result", "elapsed", "dut", "begin"]], [verdict[key] for key in ["result", "elapsed", "dut", "begin"]])
+                self.assertEqual([list(parsed[path]["ap"]), list(parsed[path]["sta"])], [verdict["ap"], verdict["sta"]])
+            self.assertEqual(len(self.getExtracted()), len(self.paths) if extract is True else 0)
+
+    def test_parse_jobs(self):
+        #process; the worker processes produce the same material (i.e. the same order, and the same exclusion of the candidate without UCC log)
+        makeZip(self.getPath(4), 4, ["Atlas"], list(), logged = False)
+        self.paths.append(self.getPath(4))
+        serial: dict = UccLogParser.decorate(material = self.getMaterial(), use_timestamp_from_log = True, parse_jobs = 1)
+        parallel: dict = UccLogParser.decorate(material = self.getMaterial(), use_timestamp_from_log = True, parse_jobs = 2)
+        self.assertEqual(parallel, serial)
+        self.assertEqual([candidate["path"] for candidate in serial["HE-4.2.0"]], [self.paths[0], self.paths[2]])
+
+class ScannerTest(UccLogCase):
+    def test_verdict(self):
+        #process; the same verdict as the former per-line regular expressions (i.e. first occurrence, DUT excluded from testbeds, parallel logs)
+        for idx, (ap, sta, parallel, result) in enumerate(self.RUNS):
+            self.assertEqual(UccLogScanner().scanLines(getUccLog(idx, ap, sta, parallel, result).splitlines(True)), self.verdicts[idx])
+
+    def test_no_ucc_log(self):
+        self.assertEqual(UccLogScanner().scanLines(["sniffer\r\n"]), {"core_ver": None, "begin": None, "elapsed": None, "result": None, "dut": None, "ap": list(), "sta": list()})
+
+class VerdictCacheTest(UccLogCase):
+    def test_cached(self):
+        #process; the verdict is reused until the zipfile is modified
+        fn: str = self.directory + os.path.sep + "verdict.json"
+        verdict_cache: VerdictCache = VerdictCache(fn)
+        UccLogParser.decorate(material = self.getMaterial(), use_timestamp_from_log = False, verdict_cache = verdict_cache)
+        verdict_cache.save()
+        loaded: VerdictCache = VerdictCache(fn)
+        with mock.patch.object(UccLogParser, "inspect", side_effect = AssertionError("parsed again")):
+            material: dict = UccLogParser.decorate(material = self.getMaterial(), use_timestamp_from_log = False, verdict_cache = loaded)
+        self.assertEqual([candidate["dut"] for candidates in material.values() for candidate in candidates], ["Vendor0", "Vendor2", "Vendor1", "Vendor3"])
+        self.assertEqual(loaded.cnt_hit, len(self.paths))
+        os.utime(self.paths[0], ns = (0, 0))
+        self.assertEqual(loaded.lookup(self.paths[0]), (False, None))
+
+    def test_unable_to_save(self):
+        #process; the cache is saved best-effort; nothing is left behind
+        fn: str = self.directory + os.path.sep + "missing" + os.path.sep + "verdict.json"
+        verdict_cache: VerdictCache = VerdictCache(fn)
+        verdict_cache.store(self.paths[0], self.verdicts[0])
+        with self.assertLogs(level = "WARNING"):
+            verdict_cache.save()
+        self.assertFalse(os.path.exists(fn + ".tmp"))
+
+class ScanModeTest(UccLogCase):
+    def test_scan_mode(self):
+        #process; the bytes-level scan (of the extracted log, or of the zip member by chunks) has the same verdict as the line scan
+        for extract in [False, True]:
+            for path, verdict in zip(self.paths, self.verdicts):
+                self.assertEqual(UccLogParser.inspect(path, extract, "line"), verdict)
+                self.assertEqual(UccLogParser.inspect(path, extract, "mmap"), verdict)
+
+    def test_chunk_boundary(self):
+        #process; every chunk size splits the markers (e.g. "FINAL TEST RESULT" or "--->") somewhere
+        for idx, (ap, sta, parallel, result) in enumerate(self.RUNS):
+            raw: bytes = getUccLog(idx, ap, sta, parallel, result, lines = 2).encode("utf-8")
+            for chunk_size in range(1, 64):
+                self.assertEqual(UccLogScanner().scanChunks(io.BytesIO(raw), chunk_size), self.verdicts[idx])
+
+class SyncStateTest(unittest.TestCase):
+    def setUp(self):
+        self.directory: str = tempfile.mkdtemp()
+        self.fn: str = self.directory + os.path.sep + "sync.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def test_absent(self):
+        #process; an absent result is NOT tried again by the next run, unless its timestamp changes
+        sync_state: TmsSyncState = TmsSyncState(self.fn)
+        sync_state.mark(1, 100)
+        sync_state.mark(2, 200)
+        sync_state.clear(2)
+        sync_state.save()
+        loaded: TmsSyncState = TmsSyncState(self.fn)
+        self.assertTrue(loaded.isAbsent({"id": 1, "timestamp": 100}))
+        self.assertFalse(loaded.isAbsent({"id": 1, "timestamp": 101}))
+        self.assertFalse(loaded.isAbsent({"id": 2, "timestamp": 200}))
+        self.assertFalse(TmsSyncState(self.fn, rebuild = True).isAbsent({"id": 1, "timestamp": 100}))
+
+    def test_unchanged(self):
+        #process; an unchanged state is NOT written again
+        sync_state: TmsSyncState = TmsSyncState(self.fn)
+        sync_state.getValidator("http://127.0.0.1/")["ETag"] = "\"1\""
+        sync_state.save()
+        os.remove(self.fn)
+        sync_state.save()
+        self.assertFalse(os.path.exists(self.fn))
+        self.assertEqual(TmsSyncState(self.fn).getValidator("http://127.0.0.1/"), dict())
+
+    def test_unable_to_save(self):
+        #process; the state is saved best-effort; nothing is left behind
+        fn: str = self.directory + os.path.sep + "missing" + os.path.sep + "sync.json"
+        sync_state: TmsSyncState = TmsSyncState(fn)
+        sync_state.mark(1, 100)
+        with self.assertLogs(level = "WARNING"):
+            sync_state.save()
+        self.assertFalse(os.path.exists(fn + ".tmp"))
+
+class ResultsTest(unittest.TestCase):
+    def test_chunk_boundary(self):
+        #process; the results are decoded one by one, wherever the payload is split
+        results: list = [{"id": idx, "result": "Pass", "logFileName": "ftp://127.0.0.1/Event1/DUT0/TB0/HE-4.2.%d/log_%d.zip" % (idx, idx), "text": "a \"quoted\" [bracket] {brace}, é"} for idx in range(5)]
+        payload: str = json.dumps(results, indent = 1)
+        for chunk_size in [1, 2, 3, 7, 64, len(payload)]:
+            chunks: list = [payload[idx:idx + chunk_size] for idx in range(0, len(payload), chunk_size)]
+            self.assertEqual(list(TmsCrawler.iterResults(iter(chunks))), results)
+        self.assertEqual(list(TmsCrawler.iterResults(iter(["[", "]"]))), list())
+
+    def test_truncated(self):
+        with self.assertRaises(ValueError):
+            list(TmsCrawler.iterResults(iter(["[{\"id\": 1}, {\"id\""])))
+
+class FakeResponse():
+    def __init__(self, status_code: int = 200, body: bytes = b"", headers: dict = None):
+        self.status_code: int = status_code
+        self.body: bytes = body
+        self.headers: dict = headers if headers is not None else dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        pass
+
+    def iter_content(self, chunk_size: int = 1):
+        for idx in range(0, len(self.body), chunk_size):
+            yield self.body[idx:idx + chunk_size]
+
+class FakeSession():
+    #the web site of one log; a range request is answered by 206, or by 416 beyond the end
+    def __init__(self, body: bytes = b""):
+        self.body: bytes = body
+        self.requested: list = list()
+
+    def get(self, url: str = "", headers: dict = None, stream: bool = False, **kwargs) -> FakeResponse:
+        ranged: str = headers.get("Range") if headers is not None else None
+        self.requested.append(ranged)
+        if ranged is None:
+            return FakeResponse(200, self.body, {"Content-Length": str(len(self.body))})
+        offset: int = int(ranged.split("=")[1].rstrip("-"))
+        if offset >= len(self.body):
+            return FakeResponse(416, b"", {"Content-Range": "bytes */%d" % (len(self.body))})
+        return FakeResponse(206, self.body[offset:], {"Content-Range": "bytes %d-%d/%d" % (offset, len(self.body) - 1, len(self.body)), "Content-Length": str(len(self.body) - offset)})
+
+class ResumeTest(unittest.TestCase):
+    def setUp(self):
+        self.directory: str = tempfile.mkdtemp()
+        self.lcl_path: str = self.directory + os.path.sep + "log.zip"
+        self.body: bytes = bytes(range(256)) * 40
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def fetch(self, part: bytes = b"") -> FakeSession:
+        with open(self.lcl_path + ".part", "wb") as f:
+            f.write(part)
+        session: FakeSession = FakeSession(self.body)
+        self.assertTrue(TmsCrawler.fetchByHttp(session = session, url = "http://127.0.0.1/log.zip", headers = dict(), lcl_path = self.lcl_path))
+        self.assertFalse(os.path.exists(self.lcl_path + ".part"))
+        with open(self.lcl_path, "rb") as f:
+            self.assertEqual(f.read(), self.body)
+        return session
+
+    def test_resumed(self):
+        #process; the partial one is resumed from its end
+        self.assertEqual(self.fetch(self.body[:1000]).requested, ["bytes=1000-"])
+
+    def test_poisoned_part(self):
+        #process; the partial one is longer than the remote log (e.g. the log is replaced remotely); the download starts over
+        self.assertEqual(self.fetch(b"\0" * (len(self.body) + 100)).requested, ["bytes=%d-" % (len(self.body) + 100), None])
+
+    def test_size_mismatch(self):
+        #process; the partial one of a mismatched size is removed, so the retry does NOT resume from it again
+        part_path: str = self.lcl_path + ".part"
+        with open(part_path, "wb") as f:
+            f.write(b"\0" * 10)
+        with self.assertRaises(IOError):
+            TmsCrawler.finalize(part_path = part_path, lcl_path = self.lcl_path, size = 20)
+        self.assertFalse(os.path.exists(part_path))
+
+class LatestTest(unittest.TestCase):
+    def setUp(self):
+        self.directory: str = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def test_fallback(self):
+        #process; the newest result of a tc was absent in the former run; the next newer one is scheduled, and the older ones are kept as its fallback
+        jobs: list = [{"id": idx, "timestamp": str(ts), "tc": "HE-4.2.1", "lcl_dir": self.directory, "lcl_path": self.directory + os.path.sep + "log_%d.zip" % (idx), "future": None, "duplicated": False}
+            for idx, ts in enumerate([300, 200, 100])]
+        sync_state: TmsSyncState = TmsSyncState(self.directory + os.path.sep + "sync.json")
+        sync_state.mark(0, 300)
+        downloader = mock.Mock()
+        job, cnt_skipped = TmsCrawler.scheduleLatest(jobs = list(jobs), downloader = downloader, pending = dict(), sync_state = sync_state)
+        self.assertEqual([job["id"], cnt_skipped], [1, 1])
+        self.assertEqual([j["id"] for j in job["fallback"]], [2])
+        downloader.submit.assert_called_once_with(job)
+
+class SelectionTest(unittest.TestCase):
+    def getMaterial(self) -> dict:
+        #process; the candidates 0 and 2 (or 1 and 5) tie on the timestamp; the candidate 4 misses its testbeds
+        rows: list = [(100, "DUT0", ["Atlas"]), (300, "DUT0", ["Atlas"]), (100, "DUT0", ["Atlas"]), (200, "DUT1", ["Atlas"]), (50, "DUT0", None), (300, "DUT0", ["Atlas"]), (250, "DUT1", ["Atlas"])]
+        material: dict = {"HE-4.2.1": list()}
+        for idx, (ts, dut, ap) in enumerate(rows):
+            candidate: Candidate = Candidate(timestamp = ts, path = "/HE-4.2.1/log_%d.zip" % (idx), dut = dut)
+            if ap is not None:
+                candidate["ap"] = ap
+                candidate["sta"] = list()
+            material["HE-4.2.1"].append(candidate)
+        return material
+
+    def test_selection(self):
+        #process; the first/last one per DUT and testbed permutation; ties are resolved in favor of the former one; the incomplete one is kept
+        for category, expected in [("first", [0, 3, 4]), ("last", [1, 4, 6]), ("all", [0, 1, 2, 3, 4, 5, 6])]:
+            material: dict = UccLogTimestampFiltrator.decorate(material = self.getMaterial(), use_timestamp_from_log = False, category = category)
+            self.assertEqual([candidate["path"] for candidate in material["HE-4.2.1"]], ["/HE-4.2.1/log_%d.zip" % (idx) for idx in expected])
+
+class StreamTest(unittest.TestCase):
+    def test_grouped_per_tc(self):
+        #process; a group is output once its tc is complete, before the producer is exhausted
+        consumed: list = list()
+        def produce():
+            for tc, idx in [("A", 0), ("B", 1), ("A", 2), ("A", None), ("B", 3), ("B", None)]:
+                consumed.append(idx)
+                yield (tc, Candidate(timestamp = idx, path = "/%s/%d.zip" % (tc, idx)) if idx is not None else None)
+        items = MaterialGrouper.stream(items = produce())
+        self.assertEqual(next(items)[1]["timestamp"], 0)
+        self.assertEqual(len(consumed), 4)
+        rows: list = [(tc, candidate["timestamp"]) for tc, candidate in items if candidate is not None]
+        self.assertEqual(rows, [("A", 2), ("B", 1), ("B", 3)])
+
+class TmsStandInCase(unittest.TestCase):
+    QTY: int = 30
+    GROWTH: int = 0
+
+    def setUp(self):
+        logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+        self.directory: str = tempfile.mkdtemp()
+        self.rmt_directory: str = self.directory + os.path.sep + "remote"
+        self.lcl_directory: str = self.directory + os.path.sep + "local"
+        self.synthetic: dict = SyntheticMaterial.makeEvent(root = self.rmt_directory, event = "1", qty = self.QTY, tc_qty = 5, dut_qty = 1, tb_qty = 2, lines = 10)
+        SyntheticMaterial.makePermutation(self.directory + os.path.sep + "MasterTestInfo.xml", self.synthetic["tcs"], self.synthetic["permutation"])
+        self.server = TmsStandIn.serve("1", self.rmt_directory, self.synthetic["results"], self.GROWTH)
+        self.faults: dict = {"rate": 0.0, "burst": 0, "max_sessions": 0}
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def getProvided(self, **kwargs) -> dict:
+        provided: dict = dict(event = "1", directory = self.lcl_directory, rst_expected = "Pass", account = "test", password = "test",
+            sftp_usr = None, sftp_pwd = None, sftp_interm_dir = None, since = "", prefix = "", latest = False,
+            permutation = MaterialProvider.getPermutation(self.directory + os.path.sep + "MasterTestInfo.xml"), dut = None,
+            jobs = 4, ftp_fetching = True, portal = "http://127.0.0.1:%d/" % (self.server.server_address[1]), sftp_port = 22)
+        provided.update(kwargs)
+        if provided["ftp_fetching"] is True and provided["sftp_port"] == 22:
+            provided["sftp_port"] = SftpStandIn.serve(self.rmt_directory, self.faults)
+        return provided
+
+    def getExpected(self) -> int:
+        return len([result for result in self.synthetic["results"] if result["result"] == "Pass"])
+
+    def getRelative(self, result: dict = None) -> str:
+        return result["logFileName"].split("/", 3)[3]
+
+class TmsStandInTest(TmsStandInCase):
+    def getSummary(self, material: dict = None) -> list:
+        return [(tc, [(candidate["timestamp"], os.path.basename(candidate["path"])) for candidate in candidates]) for tc, candidates in material.items()]
+
+    def test_jobs(self):
+        #process; the material is the same whatever the quantity of workers or the way of fetching
+        serial: dict = TmsCrawler.getMaterial(**self.getProvided(jobs = 1, directory = self.lcl_directory + "-serial"))
+        self.assertEqual(sum([len(v) for v in serial.values()]), self.getExpected())
+        for ftp_fetching in [True, False]:
+            material: dict = TmsCrawler.getMaterial(**self.getProvided(ftp_fetching = ftp_fetching, directory = self.lcl_directory + "-%s" % (ftp_fetching)))
+            self.assertEqual(self.getSummary(material), self.getSummary(serial))
+
+    def test_poisoned_part(self):
+        #process; the partial ones are longer than the remote logs (e.g. the logs are replaced remotely); the downloads start over
+        poisoned: list = [result for result in self.synthetic["results"] if result["result"] == "Pass"][:5]
+        for result in poisoned:
+            lcl_path: str = self.lcl_directory + os.path.sep + self.getRelative(result)
+            os.makedirs(os.path.dirname(lcl_path), exist_ok = True)
+            with open(lcl_path + ".part", "wb") as f:
+                f.write(b"\0" * (os.path.getsize(self.rmt_directory + os.path.sep + self.getRelative(result)) + 100))
+        material: dict = TmsCrawler.getMaterial(**self.getProvided(ftp_fetching = False, retry = 1, backoff = 0.01))
+        self.assertEqual(sum([len(v) for v in material.values()]), self.getExpected())
+        for result in poisoned:
+            lcl_path: str = self.lcl_directory + os.path.sep + self.getRelative(result)
+            self.assertFalse(os.path.exists(lcl_path + ".part"))
+            with open(lcl_path, "rb") as lf, open(self.rmt_directory + os.path.sep + self.getRelative(result), "rb") as rf:
+                self.assertEqual(lf.read(), rf.read())
+
+    def test_latest_fallback(self):
+        #process; the newest log of a tc is missing remotely; the next newer result of the tc is reported instead
+        tc: str = self.synthetic["tcs"][0]
+        passed: list = sorted([result for result in self.synthetic["results"] if result["result"] == "Pass" and result["testCaseIdName"] == tc], key = lambda result: int(result["timestamp"]))
+        os.remove(self.rmt_directory + os.path.sep + self.getRelative(passed[-1]))
+        material: dict = TmsCrawler.getMaterial(**self.getProvided(latest = True))
+        self.assertEqual(sorted(material), sorted(self.synthetic["tcs"]))
+        self.assertEqual([candidate["timestamp"] for candidate in material[tc]], [passed[-2]["timestamp"]])
+
+    def test_completion_marked(self):
+        #process; the completion of a tc is marked once, after every candidate of the tc
+        items: list = list(TmsCrawler.iterMaterial(**self.getProvided(grouped = True)))
+        marked: list = [tc for tc, candidate in items if candidate is None]
+        self.assertEqual(sorted(marked), sorted(self.synthetic["tcs"]))
+        for tc in marked:
+            positions: list = [idx for idx, item in enumerate(items) if item[0] == tc]
+            self.assertIsNone(items[positions[-1]][1])
+        self.assertEqual(len([candidate for tc, candidate in items if candidate is not None]), self.getExpected())
+
+class LfsCrawlerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory: str = tempfile.mkdtemp()
+        for tc in ["HE-4.2.1", "HE-4.2.2", "HE-9.9.9", "VHT-4.2.1"]:
+            for sub in ["", os.path.sep + "1" + os.path.sep + tc]:
+                path: str = self.directory + os.path.sep + "event" + sub + os.path.sep + tc
+                os.makedirs(path, exist_ok = True)
+                with zipfile.ZipFile(path + os.path.sep + "log.zip", "w") as z:
+                    z.writestr("log.txt", "log of %s" % (tc))
+                with open(path + os.path.sep + "log.zip", "rb") as f:
+                    archive: bytes = f.read()
+                #process; a self-extracting one (i.e. prefixed by a stub), an empty one, and a plain text
+                with open(path + os.path.sep + "sfx.zip", "wb") as f:
+                    f.write(b"#!/bin/sh\n" * 16 + archive)
+                open(path + os.path.sep + "empty.zip", "wb").close()
+                with open(path + os.path.sep + "readme.txt", "w") as f:
+                    f.write("PK")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def getExpected(self, permutation: dict = None, prefix: str = "") -> dict:
+        #process; os.walk and zipfile.is_zipfile as the former scan did
+        material: dict = dict()
+        for root, dirs, files in os.walk(self.directory, topdown = False):
+            tc: str = os.path.basename(root)
+            if tc.startswith(prefix) is False or tc not in permutation:
+                continue
+            for name in files:
+                if zipfile.is_zipfile(root + os.path.sep + name):
+                    material.setdefault(tc, list()).append(root + os.path.sep + name)
+        return material
+
+    def test_scan(self):
+        #process; the same candidates in the same order, whatever the quantity of threads
+        permutation: dict = {"HE-4.2.1": dict(), "HE-4.2.2": dict(), "VHT-4.2.1": dict()}
+        expected: dict = self.getExpected(permutation, "HE")
+        self.assertEqual(sorted(os.path.basename(path) for path in expected["HE-4.2.1"]), ["log.zip", "log.zip", "sfx.zip", "sfx.zip"])
+        for scan_jobs in [1, 4]:
+            material: dict = LfsCrawler.getMaterial(directory = self.directory, permutation = permutation, prefix = "HE", scan_jobs = scan_jobs)
+            self.assertEqual({tc: [candidate["path"] for candidate in candidates] for tc, candidates in material.items()}, expected)
+
+class WriterTest(UccLogCase):
+    def write(self, material: dict = None, output_format: str = "text") -> str:
+        output: io.StringIO = io.StringIO()
+        ReportFormatter.write(material = material, output = output, output_format = output_format, naming = {"ap": {"Atlas": "atlas"}, "sta": dict()},
+            permutation = {"HE-4.2.0": {"ap": ["atlas", "borealis"], "sta": ["lyra"]}}, show_device_from_log = True, rst_expected = "PASS", delimiter = "\n")
+        return output.getvalue()
+
+    def test_formats(self):
+        #process; the rows of every format are the same as the text rows
+        material: dict = UccLogParser.decorate(material = self.getMaterial(), use_timestamp_from_log = False)
+        text: list = [row.split(ReportFormatter.DELI_OUTER) for row in self.write(material, "text").splitlines()]
+        self.assertEqual(text[0], ["PASS", "HE-4.2.0", "00:00:00", "Vendor0", "[atlas,Borealis*]", "[Lyra*]", "M"])
+        self.assertEqual(len(text), len(self.paths))
+        rows: list = list(csv.reader(io.StringIO(self.write(material, "csv"))))
+        self.assertEqual(rows[0], ReportFormatter.getHeader(True))
+        self.assertEqual(rows[1:], text)
+        records: list = [json.loads(line) for line in self.write(material, "jsonl").splitlines()]
+        self.assertEqual(json.loads(self.write(material, "json")), records)
+        self.assertEqual([[record[column] for column in ["result", "tc", "elapsed", "dut"]] for record in records], [row[:4] for row in text])
+        self.assertEqual([records[0]["ap"], records[0]["ap_matched"], records[0]["sta"], records[0]["permuted"]], [["atlas", "Borealis"], [True, False], ["Lyra"], True])
+        self.assertEqual(json.loads(self.write(dict(), "json")), list())
+
+class ProfileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory: str = tempfile.mkdtemp()
+        self.fn: str = self.directory + os.path.sep + "MasterTestInfo.xml"
+        with open(self.fn, "w", encoding = "utf-8") as f:
+            f.write("<?xml version=\"1.0\"?>\n<HE>\n")
+            f.write("  <HE-4.2.1><AP>atlas,borealis</AP><STA>lyra</STA><Note>n/a</Note></HE-4.2.1>\n")
+            f.write("  <HE-4.2.2><AP>2</AP><STA></STA></HE-4.2.2>\n")
+            f.write("  <HE-4.2.3><AP> cygnus </AP></HE-4.2.3>\n")
+            f.write("  <HE-4.2.4><AP>atlas</AP></HE-4.2.4>\n  <HE-4.2.4><AP>draco</AP></HE-4.2.4>\n")
+            f.write("</HE>\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    @unittest.skipIf(importlib.util.find_spec("xmltodict") is None, "xmltodict is NOT installed")
+    def test_permutation(self):
+        #process; the element iteration has the same table as the former whole document (e.g. numeric, empty, or repeated tc)
+        import xmltodict
+        expected: dict = dict()
+        with open(self.fn, "r", encoding = "utf-8") as f:
+            m = xmltodict.parse(f.read())
+        for prog in m:
+            for tc in m[prog]:
+                if tc not in expected:
+                    expected[tc] = {"ap": list(), "sta": list()}
+                    for role in ["AP", "STA"]:
+                        if role in m[prog][tc] and m[prog][tc][role] is not None and m[prog][tc][role].isdigit() == False:
+                            expected[tc][role.lower()] = m[prog][tc][role].split(",")
+        self.assertEqual(MaterialProvider.parsePermutation(self.fn), expected)
+
+    def test_cached(self):
+        #process; the compiled table is loaded from the cache until the file is modified
+        permutation: dict = MaterialProvider.getPermutation(self.fn)
+        self.assertTrue(os.path.exists(self.fn + ".permutation.json"))
+        with mock.patch.object(MaterialProvider, "parsePermutation", side_effect = AssertionError("parsed again")):
+            self.assertEqual(MaterialProvider.getPermutation(self.fn), permutation)
+        os.utime(self.fn, ns = (0, 0))
+        with mock.patch.object(MaterialProvider, "parsePermutation", return_value = dict()) as parsed:
+            self.assertEqual(MaterialProvider.getPermutation(self.fn), dict())
+            parsed.assert_called_once_with(self.fn)
+
+class IncrementalTest(TmsStandInCase):
+    def test_not_modified(self):
+        #process; the event information and the results are unchanged, so the second crawl is answered by 304 (i.e. the cached ones are used)
+        first: dict = TmsCrawler.getMaterial(**self.getProvided(incremental = True))
+        second: dict = TmsCrawler.getMaterial(**self.getProvided(incremental = True))
+        self.assertEqual(self.server.state["not_modified"], 2)
+        self.assertEqual(second, first)
+
+class WatchTest(TmsStandInCase):
+    GROWTH: int = 10
+
+    def test_growing_event(self):
+        #process; the results are appended between the rounds; the report is complete once the event stops growing
+        output: str = self.directory + os.path.sep + "report.txt"
+        TmsWatcher(provided = self.getProvided(events = list()),
+            interval = 0.0,
+            max_interval = 0.0,
+            rounds = self.QTY // self.GROWTH + 2,
+            output = output,
+            parsing = dict(extract = False, parse_jobs = 1, scan_mode = "line", verdict_cache = None),
+            reporting = dict(output_format = "text", naming = dict(), permutation = dict(), show_device_from_log = False, rst_expected = "Pass", delimiter = os.linesep)).watch()
+        with open(output, "r", encoding = "utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), self.getExpected())
+        self.assertGreater(self.server.state["not_modified"], 0)
+
+class CacheManagerTest(unittest.TestCase):
+    SIZE: int = 1000
+
+    def setUp(self):
+        self.directory: str = tempfile.mkdtemp()
+        self.paths: list = list()
+        for idx in range(3):
+            for tc in ["HE-4.2.1", "HE-4.2.2"]:
+                path: str = self.directory + os.path.sep + "event" + os.path.sep + str(idx) + os.path.sep + tc + os.path.sep + "log.zip"
+                os.makedirs(os.path.dirname(path), exist_ok = True)
+                with open(path, "wb") as f:
+                    f.write(os.urandom(self.SIZE))
+                self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def getVerdictCache(self, log_store: LogStore = None) -> VerdictCache:
+        #process; the older a run is, the less recently it is used; the latest run per tc is pinned
+        verdict_cache: VerdictCache = VerdictCache(self.directory + os.path.sep + "verdict.json", store = log_store)
+        for idx, path in enumerate(self.paths):
+            with open(path + "-ucc.log", "wb") as f:
+                f.write(b"\0" * 10)
+            verdict_cache.store(path, {"begin": "2026-10-%02d" % (idx // 2 + 1)})
+            verdict_cache.entries[path]["accessed"] = idx
+        return verdict_cache
+
+    def getDiskUsage(self) -> int:
+        inodes: dict = dict()
+        for root, dirs, files in os.walk(self.directory):
+            for name in files:
+                st = os.stat(root + os.path.sep + name)
+                inodes[(st.st_dev, st.st_ino)] = st.st_size
+        return sum(inodes.values())
+
+    def test_budget(self):
+        #process; the least recently used ones are evicted along with their extracted logs; the evicted verdicts are still served
+        verdict_cache: VerdictCache = self.getVerdictCache()
+        cache_manager: CacheManager = CacheManager(verdict_cache, max_bytes = 3500)
+        cache_manager.enforce()
+        self.assertEqual([os.path.exists(path) for path in self.paths], [False, False, False, True, True, True])
+        self.assertFalse(os.path.exists(self.paths[0] + "-ucc.log"))
+        self.assertEqual(cache_manager.bytes_evicted, 3 * (self.SIZE + 10))
+        self.assertEqual(verdict_cache.lookup(self.paths[0]), (True, {"begin": "2026-10-01"}))
+
+    def test_pinned(self):
+        #process; the latest run per tc is kept even beyond the budget
+        cache_manager: CacheManager = CacheManager(self.getVerdictCache(), max_bytes = 1)
+        cache_manager.enforce()
+        self.assertEqual([os.path.exists(path) for path in self.paths], [False, False, False, False, True, True])
+
+    def test_log_store(self):
+        #process; the zipfiles are hardlinked to the log store; the budget is met by removing the blobs NOT linked anymore
+        log_store: LogStore = LogStore(self.directory + os.path.sep + "store")
+        for path in self.paths:
+            log_store.ingest(uri = path, lcl_path = path)
+        #process; the blob of the second one is linked by another directory as well
+        shared: str = log_store.getBlob(log_store.resolve(self.paths[1]))
+        os.link(shared, self.directory + os.path.sep + "other.zip")
+        blobs: list = [log_store.getBlob(log_store.resolve(path)) for path in self.paths]
+        cache_manager: CacheManager = CacheManager(self.getVerdictCache(log_store), max_bytes = 3500)
+        cache_manager.enforce()
+        self.assertEqual([os.path.exists(path) for path in self.paths], [False, False, False, False, True, True])
+        self.assertEqual([os.path.exists(blob) for blob in blobs], [False, True, False, False, True, True])
+        self.assertEqual(cache_manager.bytes_evicted, 3 * self.SIZE + 4 * 10)
+        #process; the kept ones and their extracted logs, along with the blob linked by another directory
+        self.assertEqual(self.getDiskUsage(), 2 * (self.SIZE + 10) + self.SIZE)
+
+class MaterialStoreTest(unittest.TestCase):
+    def setUp(self):
+        #process; the reruns of a tc vary by DUT and testbeds; some of them fail, and some of them tie on the timestamp
+        self.directory: str = tempfile.mkdtemp()
+        self.lcl_directory: str = self.directory + os.path.sep + "event"
+        self.fn: str = self.directory + os.path.sep + "MasterTestInfo.xml"
+        permutation: dict = {"HE-4.2.%d" % (i): {"ap": ["Atlas", "Borealis"][:1 + i % 2], "sta": ["Lyra"]} for i in range(3)}
+        for idx in range(18):
+            tc: str = "HE-4.2.%d" % (idx % 3)
+            ap: list = permutation[tc]["ap"] if idx % 4 > 0 else ["Draco"]
+            makeZip(self.lcl_directory + os.path.sep + "DUT%d" % (idx % 2) + os.path.sep + tc + os.path.sep + "log_%d.zip" % (idx), (idx * 5) % 9, ap, ["Lyra"], idx % 5 == 0, "PASS" if idx % 7 > 0 else "FAIL")
+        SyntheticMaterial.makePermutation(self.fn, list(permutation), permutation)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+    def crawl(self, *args) -> str:
+        completed = subprocess.run([sys.executable, "crawler_tms.py", "-o", "-d", self.lcl_directory, "-m", self.fn, "--show-device-from-log"] + list(args),
+            cwd = os.path.dirname(os.path.abspath(__file__)), stdout = subprocess.PIPE, stderr = subprocess.DEVNULL, check = True)
+        return completed.stdout.decode("utf-8")
+
+    def test_queries(self):
+        #process; the indexed queries of the store report the same rows as the in-memory pipeline
+        db: str = self.directory + os.path.sep + "material.sqlite"
+        for category in ["all", "first", "last"]:
+            for sorted_output in [[], ["--sorted-output"]]:
+                expected: str = self.crawl("-y", category, *sorted_output)
+                self.assertGreater(len(expected.splitlines()), 0)
+                self.assertEqual(self.crawl("-y", category, "--db", db, *sorted_output), expected)
+                #process; the latest run is reported from the store without crawling
+                self.assertEqual(self.crawl("-y", category, "--db", db, "--db-run", "latest", *sorted_output), expected)
+        self.assertEqual(len(self.crawl("--db", db, "--db-run", "list").splitlines()), 6)
+
+class CandidateTest(unittest.TestCase):
+    def test_dict_compatible(self):
+        #process; a candidate is accessed as the former dict
+        candidate: Candidate = Candidate(timestamp = "1672531200000", path = "/event/DUT0/TB0/HE-4.2.1/log_0.zip")
+        self.assertEqual(candidate, {"timestamp": "1672531200000", "path": "/event/DUT0/TB0/HE-4.2.1/log_0.zip"})
+        self.assertFalse("ap" in candidate)
+        self.assertIsNone(candidate.get("ap"))
+        with self.assertRaises(KeyError):
+            candidate["ap"]
+        with self.assertRaises(KeyError):
+            candidate["unknown"] = 1
+        candidate["ap"] = ["Atlas", "Borealis"]
+        candidate["dut"] = "Vendor0"
+        self.assertEqual(list(candidate.keys()), ["timestamp", "path", "dut", "ap"])
+        self.assertEqual(len(candidate), 4)
+        self.assertEqual(dict(candidate.items())["ap"], ("Atlas", "Borealis"))
+        self.assertEqual(json.loads(json.dumps(dict(candidate.items()))), {"timestamp": "1672531200000", "path": "/event/DUT0/TB0/HE-4.2.1/log_0.zip", "dut": "Vendor0", "ap": ["Atlas", "Borealis"]})
+        self.assertEqual(copy.deepcopy(candidate), candidate)
+
+    def test_interned(self):
+        #process; the directory and the names are shared by the candidates
+        lhs: Candidate = Candidate(path = "".join(["/event/DUT0/", "HE-4.2.1/log_0.zip"]), tms_tb = "".join(["T", "B0"]))
+        rhs: Candidate = Candidate(path = "".join(["/event/DUT0/", "HE-4.2.1/log_1.zip"]), tms_tb = "".join(["T", "B", "0"]))
+        self.assertIs(lhs.directory, rhs.directory)
+        self.assertIs(lhs["tms_tb"], rhs["tms_tb"])
+
+class HostSchedulerTest(TmsStandInCase):
+    def test_fault_burst(self):
+        #process; the host refuses every transfer for a while; the circuit opens, and the jobs wait for the half-open probe instead of being dropped
+        self.faults["burst"] = 6
+        material: dict = TmsCrawler.getMaterial(**self.getProvided(retry = 5, backoff = 0.01, circuit_cooldown = 0.1))
+        self.assertEqual(sum([len(v) for v in material.values()]), self.getExpected())
+        self.assertGreaterEqual(self.faults["injected"], 6)
+
+    def test_healthy_host_continues(self):
+        #process; the jobs of a failing host are held back while its circuit is open, so the jobs of a healthy host are NOT starved of the workers
+        def fail():
+            raise OSError("refused")
+        scheduler: HostScheduler = HostScheduler(max_limit = 4, retry = 3, backoff = 0.01, cooldown = 2.0)
+        try:
+            failing: list = [scheduler.submit("A", "", fail) for idx in range(8)]
+            deadline: float = time.monotonic() + 5.0
+            while scheduler.hosts["A"]["opened"] <= time.monotonic() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertGreater(scheduler.hosts["A"]["opened"], time.monotonic())
+            healthy: list = [scheduler.submit("B", "", lambda: True) for idx in range(4)]
+            done, not_done = wait(healthy, timeout = 1.0)
+            self.assertEqual(len(not_done), 0)
+            self.assertGreater(scheduler.hosts["A"]["opened"], time.monotonic())
+            self.assertFalse(all([future.done() for future in failing]))
+        finally:
+            scheduler.close()
+
+if __name__ == "__main__":
+    unittest.main()